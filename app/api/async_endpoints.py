@@ -0,0 +1,638 @@
+# asyncio 모드 라우터 (Settings.db_async=True 일 때 app.main에서 사용)
+# app/api/endpoints.py와 같은 경로/응답을 제공하지만, 모든 핸들러가 async def 이므로
+# AnyIO 스레드풀 슬롯을 점유하지 않고 비동기 드라이버로 DB를 기다린다.
+import logging
+from datetime import timedelta
+from typing import Any, List, Optional, Union
+
+from fastapi import (APIRouter, Body, Cookie, Depends, Header, HTTPException,
+                     Query, Response, status)
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import render
+from app.auth.dependencies import get_current_user_async, is_owner_or_admin
+from app.auth.utils import averify_password
+from app.config import get_settings
+from app.database import get_async_db
+from app.domain.models.user import Role
+from app.domain.schemas.bulk import BulkCreateResult
+from app.domain.schemas.comment import (CommentCreate, CommentRead,
+                                        CommentUpdate)
+from app.domain.schemas.pagination import CursorPage
+from app.domain.schemas.post import PostCreate, PostRead, PostUpdate
+from app.domain.schemas.user import UserCreate, UserInDB, UserRead, UserUpdate
+from app.metrics import render_metrics
+from app.profiler import ProfiledRoute, load_profile
+from app.service.comment_service import AsyncCommentService
+from app.service.etag import etag_matches
+from app.service.export import EXPORT_TABLES, ExportTable, aiter_export
+from app.service.pagination import check_page_size
+from app.service.post_service import AsyncPostService
+from app.service.user_service import (AsyncUserService,
+                                      UserAlreadyExistsException)
+from app.session_store import AsyncSessionStore, get_async_session_store
+
+router = APIRouter(route_class=ProfiledRoute)
+# 로거별 샘플링(LOG_SAMPLING)을 할 수 있도록 모듈 이름의 로거 사용
+logger = logging.getLogger(__name__)
+
+
+@router.post("/users/", response_model=UserRead)
+async def create_user(
+    user: UserCreate, db: AsyncSession = Depends(get_async_db)
+) -> UserRead:
+    try:
+        new_user = await AsyncUserService(db).create_user(user)
+        logger.info("데이터베이스 커밋 성공")
+        return new_user
+
+    except UserAlreadyExistsException as e:
+        logger.warning("%s", e.detail)
+        raise e
+
+    except HTTPException as e:  # 비밀번호 풀 포화(503) 등은 그대로 전달
+        raise e
+
+    except Exception as e:
+        logger.error("회원가입 중 에러 발생: %s", e)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="회원가입 중 오류가 발생했습니다.",
+        )
+
+
+@router.post("/posts/", response_model=PostRead)
+async def create_post(
+    post: PostCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    try:
+        return await AsyncPostService(db).create(
+            post_create=post, author_id=current_user.userid
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/posts/bulk", response_model=BulkCreateResult)
+async def create_posts_bulk(
+    items: List[Any] = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    try:
+        return await AsyncPostService(db).bulk_create(
+            items, author_id=current_user.userid
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error("게시글 대량 생성 중 에러 발생: %s", e)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="게시글 대량 생성 중 오류가 발생했습니다.",
+        )
+
+
+@router.get("/posts/search", response_model=CursorPage[PostRead])
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=100),
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+):
+    items, next_cursor = await AsyncPostService(db).search(
+        q, cursor=cursor, limit=limit
+    )
+    return render(CursorPage[PostRead], {"items": items, "next_cursor": next_cursor})
+
+
+@router.get("/posts/{post_id}", response_model=PostRead)
+async def read_post(
+    post_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    post_service = AsyncPostService(db)
+    etag = await post_service.get_etag(post_id)
+    if etag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="게시글이 없습니다."
+        )
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    loaded = await post_service.get_read(post_id, etag)
+    if loaded is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="게시글이 없습니다."
+        )
+    # 본문을 읽은 시점의 ETag를 함께 보내서 본문과 ETag가 어긋나지 않도록 함
+    post, etag = loaded
+    response.headers["ETag"] = etag
+    return render(PostRead, post, response)
+
+
+@router.get("/posts/", response_model=Union[List[PostRead], CursorPage[PostRead]])
+async def read_posts(
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    if cursor is not None:
+        check_page_size(limit)
+        items, next_cursor = await AsyncPostService(db).get_page(
+            cursor=cursor, limit=limit
+        )
+        return render(
+            CursorPage[PostRead], {"items": items, "next_cursor": next_cursor}
+        )
+    return render(
+        List[PostRead], await AsyncPostService(db).get_multi(skip=skip, limit=limit)
+    )
+
+
+@router.patch("/posts/{post_id}", response_model=PostRead)
+async def update_post(
+    post_id: int,
+    post: PostUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    post_service = AsyncPostService(db)
+    post_in_db = await post_service.get(post_id)
+
+    if post_in_db is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="게시글이 없습니다."
+        )
+
+    if not is_owner_or_admin(current_user, post_in_db.author_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="게시글 수정 권한이 없습니다.",
+        )
+
+    try:
+        updated_post = await post_service.update(post_id, post)
+        logger.info("Post ID %s 업데이트 성공.", post_id)
+        return updated_post
+    except Exception as e:
+        await db.rollback()
+        logger.error("게시글 업데이트 중 에러 발생: %s", e)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/posts/{post_id}")
+async def delete_post(
+    post_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    post_service = AsyncPostService(db)
+    post_in_db = await post_service.get(post_id)
+    if post_in_db is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="게시글이 없습니다."
+        )
+
+    if not is_owner_or_admin(current_user, post_in_db.author_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="게시글 삭제 권한이 없습니다.",
+        )
+
+    try:
+        await post_service.delete(post_id)
+        return Response(status_code=status.HTTP_200_OK)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/users/{user_id}/posts",
+    response_model=Union[List[PostRead], CursorPage[PostRead]],
+)
+async def read_posts_by_user(
+    user_id: str,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    if cursor is not None:
+        check_page_size(limit)
+        items, next_cursor = await AsyncPostService(db).get_page_by_author(
+            user_id, cursor=cursor, limit=limit
+        )
+        return render(
+            CursorPage[PostRead], {"items": items, "next_cursor": next_cursor}
+        )
+    return render(
+        List[PostRead],
+        await AsyncPostService(db).get_by_author(user_id, skip=skip, limit=limit),
+    )
+
+
+@router.get("/users/{userid}", response_model=UserRead)
+async def read_user(
+    userid: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    user_service = AsyncUserService(db)
+    etag = await user_service.get_etag(userid)
+    if etag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="유저가 없습니다."
+        )
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    user = await user_service.get(userid)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="유저가 없습니다."
+        )
+    response.headers["ETag"] = etag
+    return render(UserRead, user, response)
+
+
+@router.patch("/users/{userid}", response_model=UserRead)
+async def update_user(
+    userid: str,
+    user: UserUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    if not is_owner_or_admin(current_user, userid):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="유저 정보를 수정할 권한이 없습니다.",
+        )
+
+    try:
+        # 비밀번호 해시는 AsyncUserService.update 에서 한 번만 수행
+        return await AsyncUserService(db).update(userid, user)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/users/{user_id}")
+async def delete_user(
+    userid: str,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    if not is_owner_or_admin(current_user, userid):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="유저를 삭제할 권한이 없습니다.",
+        )
+
+    try:
+        await AsyncUserService(db).delete(userid)
+        return Response(status_code=status.HTTP_200_OK)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/users/{user_id}/comments", response_model=List[CommentRead])
+async def read_comments_by_user(
+    user_id: str,
+    skip: int = 0,
+    limit: int = 10,
+    db: AsyncSession = Depends(get_async_db),
+):
+    return render(
+        List[CommentRead],
+        await AsyncUserService(db).get_comments_by_user(
+            user_id, skip=skip, limit=limit
+        ),
+    )
+
+
+# Comment Endpoints
+@router.post("/comments/", response_model=CommentRead)
+async def create_comment(
+    comment: CommentCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    try:
+        return await AsyncCommentService(db).create(
+            comment, author_id=current_user.userid
+        )
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/comments/bulk", response_model=BulkCreateResult)
+async def create_comments_bulk(
+    items: List[Any] = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    try:
+        return await AsyncCommentService(db).bulk_create(
+            items, author_id=current_user.userid
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error("댓글 대량 생성 중 에러 발생: %s", e)
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="댓글 대량 생성 중 오류가 발생했습니다.",
+        )
+
+
+@router.get("/comments/{comment_id}", response_model=CommentRead)
+async def read_comment(comment_id: int, db: AsyncSession = Depends(get_async_db)):
+    comment = await AsyncCommentService(db).get(comment_id)
+    if comment is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="댓글이 없습니다."
+        )
+    return render(CommentRead, comment)
+
+
+@router.patch("/comments/{comment_id}", response_model=CommentRead)
+async def update_comment(
+    comment_id: int,
+    comment: CommentUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    comment_service = AsyncCommentService(db)
+    comment_in_db = await comment_service.get(comment_id)
+    if comment_in_db is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="댓글이 없습니다."
+        )
+
+    if not is_owner_or_admin(current_user, comment_in_db.author_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="댓글 수정 권한이 없습니다.",
+        )
+
+    try:
+        return await comment_service.update(comment_id, comment)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/comments/{comment_id}")
+async def delete_comment(
+    comment_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    comment_service = AsyncCommentService(db)
+    comment_in_db = await comment_service.get(comment_id)
+    if comment_in_db is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="댓글이 없습니다."
+        )
+
+    if not is_owner_or_admin(current_user, comment_in_db.author_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="댓글 삭제 권한이 없습니다.",
+        )
+
+    try:
+        await comment_service.delete(comment_id)
+        return Response(status_code=status.HTTP_200_OK)
+    except Exception as e:
+        await db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/posts/{post_id}/comments",
+    response_model=Union[List[CommentRead], CursorPage[CommentRead]],
+)
+async def read_comments_by_post(
+    post_id: int,
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if cursor is not None:
+        check_page_size(limit)
+    comment_service = AsyncCommentService(db)
+    etag = await comment_service.get_etag_by_post(post_id, skip, limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
+    if cursor is not None:
+        items, next_cursor = await comment_service.get_page_by_post(
+            post_id, cursor=cursor, limit=limit
+        )
+        return render(
+            CursorPage[CommentRead],
+            {"items": items, "next_cursor": next_cursor},
+            response,
+        )
+    return render(
+        List[CommentRead],
+        await comment_service.get_by_post(post_id, skip=skip, limit=limit),
+        response,
+    )
+
+
+# 세션 기반 프로필 정보 확인
+@router.get("/profile")
+async def get_user_profile(
+    session_id: str = Cookie(None),
+    session_store: AsyncSessionStore = Depends(get_async_session_store),
+):
+    session_data = await session_store.get_session(session_id)
+
+    if not session_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="세션을 찾을 수 없거나 만료되었습니다.",
+        )
+
+    return {"user": session_data["nickname"]}
+
+
+@router.post("/login")
+async def login_for_session(
+    response: Response,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    session_store: AsyncSessionStore = Depends(get_async_session_store),
+):
+    user = await AsyncUserService(db).get_by_userid(form_data.username)
+
+    # bcrypt 검증은 비밀번호 전용 프로세스 풀에서 실행 (포화 시 503 + Retry-After)
+    if not user or not await averify_password(form_data.password, user.hashed_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="잘못된 사용자 이름 또는 비밀번호",
+        )
+
+    session_data = {
+        "userid": user.userid,
+        "nickname": user.nickname,
+        "hashed_password": user.hashed_password,
+        "role": user.role,
+        "id": user.id,
+        "created_at": str(user.created_at),
+    }
+
+    try:
+        session_id = await session_store.create_session(
+            session_data, expires_in=timedelta(days=1)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Session creation failed: {str(e)}"
+        )
+
+    response.set_cookie(
+        key="session_id",
+        value=session_id,
+        httponly=True,
+        secure=False,  # 프로덕션 환경에서는 True로 설정할 것
+        samesite="Lax",
+    )
+
+    return {"message": "로그인 성공", "session_id": session_id}
+
+
+@router.post("/logout")
+async def logout(
+    response: Response,
+    userid: str,
+    session_id: str = Cookie(None),
+    session_store: AsyncSessionStore = Depends(get_async_session_store),
+):
+    session_data = await session_store.get_session(session_id) if session_id else None
+    if not session_data or session_data.get("userid") != userid:
+        session_id = await session_store.find_session_id(userid)
+
+    if not session_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No active session found for user: {userid}",
+        )
+
+    try:
+        await session_store.delete_session(session_id)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Session deletion failed: {str(e)}"
+        )
+
+    response.delete_cookie(key="session_id")
+
+    return {"message": f"Logout successful for user {userid}"}
+
+
+@router.delete("/users/{userid}/sessions")
+async def revoke_user_sessions(
+    response: Response,
+    userid: str,
+    current_user: UserInDB = Depends(get_current_user_async),
+    session_store: AsyncSessionStore = Depends(get_async_session_store),
+):
+    if not is_owner_or_admin(current_user, userid):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="세션을 폐기할 권한이 없습니다.",
+        )
+
+    try:
+        revoked = await session_store.revoke_user_sessions(userid)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Session revocation failed: {str(e)}"
+        )
+
+    if current_user.userid == userid:
+        response.delete_cookie(key="session_id")
+
+    return {"message": f"All sessions revoked for user {userid}", "revoked": revoked}
+
+
+@router.get("/export/{table}")
+async def export_table(
+    table: ExportTable,
+    after_id: int = Query(0, ge=0),
+    gzip: bool = False,
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    if current_user.role != Role.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 데이터를 내보낼 수 있습니다.",
+        )
+    return StreamingResponse(
+        aiter_export(EXPORT_TABLES[table.value], after_id=after_id, compress=gzip),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "gzip"} if gzip else None,
+    )
+
+
+# Prometheus 수집용 (워커 단위 값). METRICS_ENABLED=false면 404
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    if not get_settings().metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+# 관리자 요청 프로파일 (X-Profile 헤더로 측정한 요청의 응답 헤더 X-Profile-Id)
+# collapsed stack 형식이므로 flamegraph.pl 이나 speedscope로 볼 수 있다.
+@router.get("/profiles/{profile_id}", include_in_schema=False)
+async def read_profile(
+    profile_id: str,
+    current_user: UserInDB = Depends(get_current_user_async),
+):
+    if current_user.role != Role.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 프로파일을 볼 수 있습니다.",
+        )
+    profile = load_profile(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="프로파일이 없습니다."
+        )
+    return PlainTextResponse(profile)
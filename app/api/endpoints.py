@@ -1,32 +1,39 @@
+import logging
 from datetime import timedelta
-from typing import List
+from typing import Any, List, Optional, Union
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status
+from fastapi import (APIRouter, Body, Cookie, Depends, Header, HTTPException,
+                     Query, Response, status)
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.auth.dependencies import get_current_user
-from app.auth.utils import get_password_hash, verify_password
+from app.api.responses import render
+from app.auth.dependencies import get_current_user, is_owner_or_admin
+from app.auth.utils import verify_password
+from app.config import get_settings
 from app.database import get_db
 from app.domain.models.post import Post
-from app.domain.models.session import SessionModel
 from app.domain.models.user import Role, User
+from app.domain.schemas.bulk import BulkCreateResult
 from app.domain.schemas.comment import (CommentCreate, CommentRead,
                                         CommentUpdate)
+from app.domain.schemas.pagination import CursorPage
 from app.domain.schemas.post import PostCreate, PostRead, PostUpdate
 from app.domain.schemas.user import UserCreate, UserInDB, UserRead, UserUpdate
-from app.logger_setup import logger
+from app.metrics import render_metrics
+from app.profiler import ProfiledRoute, load_profile
 from app.service.comment_service import CommentService
+from app.service.etag import etag_matches
+from app.service.export import EXPORT_TABLES, ExportTable, iter_export
+from app.service.pagination import check_page_size
 from app.service.post_service import PostService
 from app.service.user_service import UserAlreadyExistsException, UserService
-from app.session_store import DBSessionStore, get_session_store
+from app.session_store import SessionStore, get_session_store
 
-router = APIRouter()
-
-
-# 권한 체크 함수: 요청자가 본인인지 또는 관리자 권한을 가지고 있는지 확인
-def is_owner_or_admin(current_user: UserInDB, user_id: str) -> bool:
-    return current_user.userid == user_id or current_user.role == Role.ADMIN
+router = APIRouter(route_class=ProfiledRoute)
+# 로거별 샘플링(LOG_SAMPLING)을 할 수 있도록 모듈 이름의 로거 사용
+logger = logging.getLogger(__name__)
 
 
 # TODO: 로거 중복 코드 제거하기. 로거를 한군데서 관리하기
@@ -45,11 +52,14 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)) -> UserRead:
         return new_user
 
     except UserAlreadyExistsException as e:
-        logger.warning(str(e.detail))
+        logger.warning("%s", e.detail)
         raise e  # 커스텀 예외는 그대로 발생
 
+    except HTTPException as e:  # 비밀번호 풀 포화(503) 등은 그대로 전달
+        raise e
+
     except Exception as e:
-        logger.error(f"회원가입 중 에러 발생: {str(e)}")
+        logger.error("회원가입 중 에러 발생: %s", e)
         db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -87,19 +97,84 @@ def create_post(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+# 여러 게시글을 한 트랜잭션으로 생성. 잘못된 항목은 errors로 돌려주고 나머지는 생성한다.
+@router.post("/posts/bulk", response_model=BulkCreateResult)
+def create_posts_bulk(
+    items: List[Any] = Body(...),
+    db: Session = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_user),
+):
+    try:
+        return PostService(db).bulk_create(items, author_id=current_user.userid)
+    except HTTPException as e:  # 최대 개수 초과(413) 등은 그대로 전달
+        raise e
+    except Exception as e:
+        logger.error("게시글 대량 생성 중 에러 발생: %s", e)
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="게시글 대량 생성 중 오류가 발생했습니다.",
+        )
+
+
+# 제목/본문 검색 (관련도 순, 커서 페이지네이션). /posts/{post_id} 보다 먼저 등록해야 함
+@router.get("/posts/search", response_model=CursorPage[PostRead])
+def search_posts(
+    q: str = Query(..., min_length=1, max_length=100),
+    cursor: Optional[str] = None,
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    items, next_cursor = PostService(db).search(q, cursor=cursor, limit=limit)
+    return render(CursorPage[PostRead], {"items": items, "next_cursor": next_cursor})
+
+
 @router.get("/posts/{post_id}", response_model=PostRead)
-def read_post(post_id: int, db: Session = Depends(get_db)):
-    post = PostService(db).get(post_id)
-    if post is None:
+def read_post(
+    post_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    post_service = PostService(db)
+    etag = post_service.get_etag(post_id)
+    if etag is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="게시글이 없습니다."
         )
-    return post
-
+    # 클라이언트의 캐시가 최신이면 본문을 읽지 않고 304
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
 
-@router.get("/posts/", response_model=List[PostRead])
-def read_posts(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    return PostService(db).get_multi(skip=skip, limit=limit)
+    loaded = post_service.get_read(post_id, etag)
+    if loaded is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="게시글이 없습니다."
+        )
+    # 본문을 읽은 시점의 ETag를 함께 보내서 본문과 ETag가 어긋나지 않도록 함
+    post, etag = loaded
+    response.headers["ETag"] = etag
+    return render(PostRead, post, response)
+
+
+# cursor 파라미터가 있으면 keyset 페이지네이션({"items", "next_cursor"})으로 응답한다.
+# 첫 페이지는 빈 커서(?cursor=)로 요청하고, 없으면 기존 skip/limit(offset) 방식을 유지한다.
+@router.get("/posts/", response_model=Union[List[PostRead], CursorPage[PostRead]])
+def read_posts(
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    if cursor is not None:
+        check_page_size(limit)
+        items, next_cursor = PostService(db).get_page(cursor=cursor, limit=limit)
+        return render(
+            CursorPage[PostRead], {"items": items, "next_cursor": next_cursor}
+        )
+    return render(List[PostRead], PostService(db).get_multi(skip=skip, limit=limit))
 
 
 def get_multi(self, skip: int = 0, limit: int = 10) -> List[Post]:
@@ -122,7 +197,9 @@ def update_post(
         )
 
     logger.debug(
-        f"현재 유저 id : {current_user.userid}, 게시글 작성자 id : {post_in_db.author_id}"
+        "현재 유저 id : %s, 게시글 작성자 id : %s",
+        current_user.userid,
+        post_in_db.author_id,
     )
 
     if not is_owner_or_admin(current_user, post_in_db.author_id):
@@ -134,11 +211,11 @@ def update_post(
     try:
         updated_post = post_service.update(post_id, post)
         db.commit()
-        logger.info(f"Post ID {post_id} 업데이트 성공.")
+        logger.info("Post ID %s 업데이트 성공.", post_id)
         return updated_post
     except Exception as e:
         db.rollback()
-        logger.error(f"게시글 업데이트 중 에러 발생: {str(e)}")
+        logger.error("게시글 업데이트 중 에러 발생: %s", e)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
@@ -170,22 +247,54 @@ def delete_post(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/users/{user_id}/posts", response_model=List[PostRead])
+@router.get(
+    "/users/{user_id}/posts",
+    response_model=Union[List[PostRead], CursorPage[PostRead]],
+)
 def read_posts_by_user(
-    user_id: str, skip: int = 0, limit: int = 10, db: Session = Depends(get_db)
+    user_id: str,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
 ):
-    return PostService(db).get_by_author(user_id, skip=skip, limit=limit)
+    if cursor is not None:
+        check_page_size(limit)
+        items, next_cursor = PostService(db).get_page_by_author(
+            user_id, cursor=cursor, limit=limit
+        )
+        return render(
+            CursorPage[PostRead], {"items": items, "next_cursor": next_cursor}
+        )
+    return render(
+        List[PostRead], PostService(db).get_by_author(user_id, skip=skip, limit=limit)
+    )
 
 
 @router.get("/users/{userid}", response_model=UserRead)
-def read_user(userid: str, db: Session = Depends(get_db)):
-    print(f"Received userid: {userid}")
+def read_user(
+    userid: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    etag = UserService(db).get_etag(userid)
+    if etag is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="유저가 없습니다."
+        )
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
     user = db.query(User).filter(User.userid == userid).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="유저가 없습니다."
         )
-    return UserRead.from_orm(user)
+    response.headers["ETag"] = etag
+    return render(UserRead, user, response)
 
 
 @router.patch("/users/{userid}", response_model=UserRead)
@@ -195,9 +304,6 @@ def update_user(
     db: Session = Depends(get_db),
     current_user: UserInDB = Depends(get_current_user),
 ):
-    if user.password:
-        user.password = get_password_hash(user.password)
-
     if not is_owner_or_admin(current_user, userid):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -205,9 +311,12 @@ def update_user(
         )
 
     try:
+        # 비밀번호 해시는 UserService.update 에서 한 번만 수행
         updated_user = UserService(db).update(userid, user)
         db.commit()
         return updated_user
+    except HTTPException as e:
+        raise e
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -236,9 +345,12 @@ def delete_user(
 
 @router.get("/users/{user_id}/comments", response_model=List[CommentRead])
 def read_comments_by_user(
-    user_id: int, skip: int = 0, limit: int = 10, db: Session = Depends(get_db)
+    user_id: str, skip: int = 0, limit: int = 10, db: Session = Depends(get_db)
 ):
-    return UserService(db).get_comments_by_user(user_id, skip=skip, limit=limit)
+    return render(
+        List[CommentRead],
+        UserService(db).get_comments_by_user(user_id, skip=skip, limit=limit),
+    )
 
 
 # Comment Endpoints
@@ -258,6 +370,25 @@ def create_comment(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/comments/bulk", response_model=BulkCreateResult)
+def create_comments_bulk(
+    items: List[Any] = Body(...),
+    db: Session = Depends(get_db),
+    current_user: UserInDB = Depends(get_current_user),
+):
+    try:
+        return CommentService(db).bulk_create(items, author_id=current_user.userid)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error("댓글 대량 생성 중 에러 발생: %s", e)
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="댓글 대량 생성 중 오류가 발생했습니다.",
+        )
+
+
 @router.get("/comments/{comment_id}", response_model=CommentRead)
 def read_comment(comment_id: int, db: Session = Depends(get_db)):
     comment = CommentService(db).get(comment_id)
@@ -265,7 +396,7 @@ def read_comment(comment_id: int, db: Session = Depends(get_db)):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="댓글이 없습니다."
         )
-    return comment
+    return render(CommentRead, comment)
 
 
 @router.patch("/comments/{comment_id}", response_model=CommentRead)
@@ -325,18 +456,50 @@ def delete_comment(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/posts/{post_id}/comments", response_model=List[CommentRead])
+@router.get(
+    "/posts/{post_id}/comments",
+    response_model=Union[List[CommentRead], CursorPage[CommentRead]],
+)
 def read_comments_by_post(
-    post_id: int, skip: int = 0, limit: int = 10, db: Session = Depends(get_db)
+    post_id: int,
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
 ):
-    return CommentService(db).get_by_post(post_id, skip=skip, limit=limit)
+    if cursor is not None:
+        check_page_size(limit)
+    comment_service = CommentService(db)
+    etag = comment_service.get_etag_by_post(post_id, skip, limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    response.headers["ETag"] = etag
+
+    if cursor is not None:
+        items, next_cursor = comment_service.get_page_by_post(
+            post_id, cursor=cursor, limit=limit
+        )
+        return render(
+            CursorPage[CommentRead],
+            {"items": items, "next_cursor": next_cursor},
+            response,
+        )
+    return render(
+        List[CommentRead],
+        comment_service.get_by_post(post_id, skip=skip, limit=limit),
+        response,
+    )
 
 
 # 세션 기반 프로필 정보 확인
 @router.get("/profile")
 def get_user_profile(
     session_id: str = Cookie(None),
-    session_store: DBSessionStore = Depends(get_session_store),
+    session_store: SessionStore = Depends(get_session_store),
 ):
     session_data = session_store.get_session(session_id)
 
@@ -354,7 +517,8 @@ def login_for_session(
     response: Response,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
-    session_store=Depends(get_session_store),  # SessionStore를 의존성으로 주입받음
+    # SessionStore를 의존성으로 주입받음 (SESSION_BACKEND 설정에 따라 선택)
+    session_store: SessionStore = Depends(get_session_store),
 ):
     user_service = UserService(db)
 
@@ -413,17 +577,16 @@ def login_for_session(
 def logout(
     response: Response,
     userid: str,  # 로그아웃할 사용자의 userid를 입력받음
-    db: Session = Depends(get_db),
-    session_store=Depends(get_session_store),  # session_store 의존성 주입
+    session_id: str = Cookie(None),
+    session_store: SessionStore = Depends(get_session_store),
 ):
-    # 해당 사용자의 세션을 조회
-    session = (
-        db.query(SessionModel)
-        .filter(SessionModel.data.contains(f'"userid": "{userid}"'))
-        .first()
-    )
+    # 요청 쿠키의 세션이 해당 사용자의 것이면 그 세션을, 아니면 사용자의 세션을 조회
+    # (signed 모드의 토큰은 서버에 저장되지 않으므로 쿠키로만 찾을 수 있음)
+    session_data = session_store.get_session(session_id) if session_id else None
+    if not session_data or session_data.get("userid") != userid:
+        session_id = session_store.find_session_id(userid)
 
-    if not session:
+    if not session_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No active session found for user: {userid}",
@@ -431,7 +594,7 @@ def logout(
 
     # 조회된 세션 삭제
     try:
-        session_store.delete_session(session.session_id)  # 세션 삭제 메서드 호출
+        session_store.delete_session(session_id)  # 세션 삭제 메서드 호출
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Session deletion failed: {str(e)}"
@@ -441,3 +604,81 @@ def logout(
     response.delete_cookie(key="session_id")
 
     return {"message": f"Logout successful for user {userid}"}
+
+
+# 해당 사용자의 모든 세션 폐기 (모든 기기에서 로그아웃)
+@router.delete("/users/{userid}/sessions")
+def revoke_user_sessions(
+    response: Response,
+    userid: str,
+    current_user: UserInDB = Depends(get_current_user),
+    session_store: SessionStore = Depends(get_session_store),
+):
+    if not is_owner_or_admin(current_user, userid):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="세션을 폐기할 권한이 없습니다.",
+        )
+
+    try:
+        revoked = session_store.revoke_user_sessions(userid)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Session revocation failed: {str(e)}"
+        )
+
+    if current_user.userid == userid:
+        response.delete_cookie(key="session_id")
+
+    return {"message": f"All sessions revoked for user {userid}", "revoked": revoked}
+
+
+# 관리자 전용 전체 내보내기 (NDJSON, 한 줄에 한 행). gzip=true면 gzip으로 압축해서 응답
+# 중간에 끊기면 마지막으로 받은 행의 id를 after_id로 넘겨 이어받는다.
+@router.get("/export/{table}")
+def export_table(
+    table: ExportTable,
+    after_id: int = Query(0, ge=0),
+    gzip: bool = False,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    if current_user.role != Role.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 데이터를 내보낼 수 있습니다.",
+        )
+    return StreamingResponse(
+        iter_export(EXPORT_TABLES[table.value], after_id=after_id, compress=gzip),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "gzip"} if gzip else None,
+    )
+
+
+# Prometheus 수집용 (워커 단위 값). METRICS_ENABLED=false면 404
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    if not get_settings().metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(
+        render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+# 관리자 요청 프로파일 (X-Profile 헤더로 측정한 요청의 응답 헤더 X-Profile-Id)
+# collapsed stack 형식이므로 flamegraph.pl 이나 speedscope로 볼 수 있다.
+@router.get("/profiles/{profile_id}", include_in_schema=False)
+def read_profile(
+    profile_id: str,
+    current_user: UserInDB = Depends(get_current_user),
+):
+    if current_user.role != Role.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 프로파일을 볼 수 있습니다.",
+        )
+    profile = load_profile(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="프로파일이 없습니다."
+        )
+    return PlainTextResponse(profile)
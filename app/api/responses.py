@@ -0,0 +1,47 @@
+# 응답 직렬화 (FAST_JSON=true 일 때)
+# - 조회 엔드포인트는 pydantic-core로 한 번만 검증/직렬화한 JSON 바이트를 그대로 응답한다.
+#   기본 경로에서는 FastAPI가 반환값을 response_model로 다시 검증한 뒤 표준 json 모듈로 인코딩한다.
+# - 나머지 엔드포인트는 orjson을 쓰는 ORJSONResponse를 기본 응답 클래스로 사용한다. (orjson 설치 시)
+from functools import lru_cache
+from typing import Any, Optional, Type
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.config import get_settings
+from app.logger_setup import logger
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type) -> TypeAdapter:
+    return TypeAdapter(response_type)
+
+
+def render(response_type, data: Any, response: Optional[Response] = None) -> Any:
+    # FAST_JSON이 꺼져 있으면 data를 그대로 반환해서 FastAPI가 response_model로 직렬화
+    if not get_settings().fast_json:
+        return data
+
+    adapter = _adapter(response_type)
+    body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+    # 핸들러에서 주입받은 response에 설정한 헤더(ETag 등)를 옮긴다
+    headers = None
+    if response is not None:
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key not in ("content-length", "content-type")
+        }
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def default_response_class() -> Type[Response]:
+    if not get_settings().fast_json:
+        return JSONResponse
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        logger.warning("orjson이 설치되어 있지 않아 기본 JSONResponse를 사용합니다.")
+        return JSONResponse
+    return ORJSONResponse
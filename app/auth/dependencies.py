@@ -1,21 +1,21 @@
 from fastapi import Cookie, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from app.database import get_db  # 세션 관리를 위한 DB 의존성 가져오기
+from app.domain.models.user import Role
 from app.domain.schemas.user import UserInDB
-from app.session_store import DBSessionStore  # DBSessionStore 사용
+from app.session_store import (AsyncSessionStore, SessionStore,
+                               get_async_session_store, get_session_store)
 
 
-# DBSessionStore 인스턴스 생성
-def get_db_session_store(db: Session = Depends(get_db)):
-    return DBSessionStore(db)
+# 권한 체크 함수: 요청자가 본인인지 또는 관리자 권한을 가지고 있는지 확인
+# (동기/asyncio 라우터가 함께 사용)
+def is_owner_or_admin(current_user: UserInDB, user_id: str) -> bool:
+    return current_user.userid == user_id or current_user.role == Role.ADMIN
 
 
 def get_current_user(
     session_id: str = Cookie(None),
-    session_store: DBSessionStore = Depends(
-        get_db_session_store
-    ),  # DBSessionStore 사용
+    # SESSION_BACKEND 설정에 따른 세션 스토어 사용
+    session_store: SessionStore = Depends(get_session_store),
 ) -> UserInDB:
     # 쿠키에 세션 ID가 없을 경우
     if not session_id:
@@ -35,3 +35,25 @@ def get_current_user(
 
     # session_data에서 유저 정보를 UserInDB로 변환
     return UserInDB(**session_data)
+
+
+# asyncio 모드용 현재 사용자 조회
+async def get_current_user_async(
+    session_id: str = Cookie(None),
+    session_store: AsyncSessionStore = Depends(get_async_session_store),
+) -> UserInDB:
+    if not session_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="세션 ID가 없거나 유효하지 않습니다.",
+        )
+
+    session_data = await session_store.get_session(session_id)
+
+    if not session_data:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="세션을 찾을 수 없거나 만료되었습니다.",
+        )
+
+    return UserInDB(**session_data)
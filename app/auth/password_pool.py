@@ -0,0 +1,144 @@
+# bcrypt 해시/검증 전용 프로세스 풀
+# bcrypt는 호출당 수백 ms의 CPU를 쓰므로 요청 스레드(또는 이벤트 루프)에서 직접 실행하면
+# 로그인이 몰릴 때 다른 엔드포인트까지 느려진다. 별도 프로세스에서 실행하고,
+# 대기 중인 작업 수가 한도를 넘으면 즉시 503(Retry-After)으로 거절해서 부하를 되돌려 보낸다.
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException, status
+
+from app.config import get_settings
+
+# 지연 시간 히스토그램 버킷 (ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PasswordPoolBusyException(HTTPException):
+    def __init__(self, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+
+class PasswordHashPool:
+    def __init__(self, workers: int = 2, max_queue: int = 16, retry_after: int = 1):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self._executor = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.latency_sum_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 스레드가 있는 서버 프로세스에서 fork 하지 않도록 spawn 사용
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self.in_flight >= self.max_queue:
+                self.rejected += 1
+                raise PasswordPoolBusyException(self.retry_after)
+            self.in_flight += 1
+            self.submitted += 1
+            executor = self._get_executor()
+
+        started = time.perf_counter()
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self.in_flight -= 1
+            raise
+        future.add_done_callback(lambda done: self._record(done, started))
+        return future
+
+    def _record(self, future: Future, started: float):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.in_flight -= 1
+            if future.cancelled():
+                # 종료(shutdown) 시 취소된 대기 작업은 처리한 것이 아니므로 처리 수/지연 시간에서 제외
+                return
+            self.completed += 1
+            self.latency_sum_ms += elapsed_ms
+            self.latency_max_ms = max(self.latency_max_ms, elapsed_ms)
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if elapsed_ms <= bound:
+                    self.latency_buckets[i] += 1
+                    break
+            else:
+                self.latency_buckets[-1] += 1
+
+    def run(self, fn, *args):
+        # 동기 핸들러용: 요청 스레드는 결과를 기다리기만 하고 CPU는 풀 프로세스가 사용
+        return self.submit(fn, *args).result()
+
+    async def arun(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queue_depth": self.in_flight,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "latency_avg_ms": (
+                    self.latency_sum_ms / self.completed if self.completed else 0.0
+                ),
+                "latency_max_ms": self.latency_max_ms,
+                "latency_buckets_ms": dict(
+                    zip([*LATENCY_BUCKETS_MS, "+Inf"], self.latency_buckets)
+                ),
+            }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_password_pool = None
+_password_pool_lock = threading.Lock()
+
+
+def get_password_pool() -> Optional[PasswordHashPool]:
+    # PASSWORD_POOL_ENABLED=false 이면 None (호출한 스레드에서 직접 해시)
+    global _password_pool
+    settings = get_settings()
+    if not settings.password_pool_enabled:
+        return None
+    if _password_pool is None:
+        with _password_pool_lock:
+            if _password_pool is None:
+                _password_pool = PasswordHashPool(
+                    workers=settings.password_pool_workers,
+                    max_queue=settings.password_pool_max_queue,
+                    retry_after=settings.password_pool_retry_after,
+                )
+    return _password_pool
+
+
+def shutdown_password_pool():
+    if _password_pool is not None:
+        _password_pool.shutdown()
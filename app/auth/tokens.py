@@ -0,0 +1,124 @@
+# HMAC 서명 세션 토큰 (SESSION_BACKEND=signed)
+# 토큰 자체에 사용자 정보와 만료 시각을 담고 서명을 검증하므로 인증 시 DB 조회가 필요 없다.
+# 형식: base64url(JSON payload) + "." + base64url(HMAC-SHA256(secret, payload 부분))
+import base64
+import hashlib
+import hmac
+import json
+import threading
+import time
+
+
+class InvalidTokenError(Exception):
+    pass
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _b64decode(value: str) -> bytes:
+    return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+
+
+def _signature(body: str, secret: str) -> str:
+    digest = hmac.new(secret.encode(), body.encode(), hashlib.sha256).digest()
+    return _b64encode(digest)
+
+
+def sign_token(payload: dict, secret: str) -> str:
+    body = _b64encode(json.dumps(payload, separators=(",", ":")).encode())
+    return f"{body}.{_signature(body, secret)}"
+
+
+def verify_token(token: str, secret: str) -> dict:
+    try:
+        body, signature = token.split(".")
+    except (AttributeError, ValueError):
+        raise InvalidTokenError("토큰 형식이 올바르지 않습니다.")
+
+    if not hmac.compare_digest(signature, _signature(body, secret)):
+        raise InvalidTokenError("토큰 서명이 올바르지 않습니다.")
+
+    try:
+        payload = json.loads(_b64decode(body))
+    except ValueError:
+        raise InvalidTokenError("토큰 내용을 해석할 수 없습니다.")
+
+    if payload.get("exp", 0) <= time.time():
+        raise InvalidTokenError("만료된 토큰입니다.")
+    return payload
+
+
+# 로그아웃한 토큰(jti)의 거부 목록. 항목은 토큰이 원래 만료되는 시점까지만 보관한다.
+# 사용자 단위 폐기는 폐기 시각을 기록해서 그 이전에 발급된(iat) 토큰을 모두 거부한다.
+class MemoryDenylist:
+    def __init__(self):
+        self._entries = {}  # jti -> deadline(epoch seconds)
+        self._user_revocations = {}  # userid -> (revoked_at, deadline)
+        self._lock = threading.Lock()
+
+    def add(self, jti: str, ttl: float):
+        now = time.time()
+        with self._lock:
+            # 만료된 항목 정리 (로그아웃 빈도가 낮으므로 추가 시점에 전체 확인)
+            for key in [k for k, v in self._entries.items() if v <= now]:
+                del self._entries[key]
+            self._entries[jti] = now + ttl
+
+    def contains(self, jti: str) -> bool:
+        deadline = self._entries.get(jti)
+        return deadline is not None and deadline > time.time()
+
+    def revoke_user(self, userid: str, ttl: float):
+        now = time.time()
+        with self._lock:
+            self._user_revocations[userid] = (now, now + ttl)
+
+    def user_revoked_at(self, userid: str):
+        entry = self._user_revocations.get(userid)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+
+class RedisDenylist:
+    # 여러 워커/노드가 같은 거부 목록을 보도록 Redis TTL 키로 저장
+    def __init__(self, client):
+        self.client = client
+
+    def add(self, jti: str, ttl: float):
+        self.client.set(f"token_denylist:{jti}", 1, ex=max(1, int(ttl) + 1))
+
+    def contains(self, jti: str) -> bool:
+        return bool(self.client.exists(f"token_denylist:{jti}"))
+
+    def revoke_user(self, userid: str, ttl: float):
+        self.client.set(
+            f"token_user_revoked:{userid}", time.time(), ex=max(1, int(ttl) + 1)
+        )
+
+    def user_revoked_at(self, userid: str):
+        revoked_at = self.client.get(f"token_user_revoked:{userid}")
+        return float(revoked_at) if revoked_at is not None else None
+
+
+class AsyncRedisDenylist:
+    # asyncio 모드용 (redis.asyncio.Redis 호환 client). 키는 RedisDenylist와 같음
+    def __init__(self, client):
+        self.client = client
+
+    async def add(self, jti: str, ttl: float):
+        await self.client.set(f"token_denylist:{jti}", 1, ex=max(1, int(ttl) + 1))
+
+    async def contains(self, jti: str) -> bool:
+        return bool(await self.client.exists(f"token_denylist:{jti}"))
+
+    async def revoke_user(self, userid: str, ttl: float):
+        await self.client.set(
+            f"token_user_revoked:{userid}", time.time(), ex=max(1, int(ttl) + 1)
+        )
+
+    async def user_revoked_at(self, userid: str):
+        revoked_at = await self.client.get(f"token_user_revoked:{userid}")
+        return float(revoked_at) if revoked_at is not None else None
@@ -1,26 +1,54 @@
-from passlib.context import CryptContext
-from passlib.hash import bcrypt
+from functools import lru_cache
+
+from starlette.concurrency import run_in_threadpool
+
+from app.auth.password_pool import get_password_pool
 
-from app.logger_setup import logger
 
 # 패스워드 암호화 및 검증을 위한 CryptContext 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# passlib import와 bcrypt 백엔드 탐색이 느리므로 처음 해시/검증할 때 만든다.
+@lru_cache
+def _pwd_context():
+    from passlib.context import CryptContext
 
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
 
+# 풀 프로세스에서 실행되는 실제 bcrypt 작업 (pickle 가능한 모듈 최상위 함수여야 함)
+def _verify_password(plain_password, hashed_password):
+    return _pwd_context().verify(plain_password, hashed_password)
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
 
+def _get_password_hash(password):
+    return _pwd_context().hash(password)
 
-# 예시 비밀번호 해시화 및 비교
-hashed_password = bcrypt.hash("Qwer1234")
-logger.info(f"Hashed Password: {hashed_password}")
 
-# 비교
-if bcrypt.verify("Qwer1234", hashed_password):
-    logger.info("비밀번호 일치")
-else:
-    logger.warning("비밀번호 불일치")
+def verify_password(plain_password, hashed_password):
+    pool = get_password_pool()
+    if pool is None:
+        return _verify_password(plain_password, hashed_password)
+    return pool.run(_verify_password, plain_password, hashed_password)
+
+
+def get_password_hash(password):
+    pool = get_password_pool()
+    if pool is None:
+        return _get_password_hash(password)
+    return pool.run(_get_password_hash, password)
+
+
+# asyncio 모드용: 이벤트 루프를 막지 않고 풀(또는 스레드풀)의 결과를 기다림
+async def averify_password(plain_password, hashed_password):
+    pool = get_password_pool()
+    if pool is None:
+        return await run_in_threadpool(
+            _verify_password, plain_password, hashed_password
+        )
+    return await pool.arun(_verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password):
+    pool = get_password_pool()
+    if pool is None:
+        return await run_in_threadpool(_get_password_hash, password)
+    return await pool.arun(_get_password_hash, password)
@@ -1,13 +1,95 @@
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    database_url: str
-    secret_key: str
+    database_url: str = "mysql+pymysql://root:password@db:3306/mydatabase"
+    secret_key: str = ""
+
+    # 커넥션 풀 설정 (프로세스당 하나의 엔진이 공유)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800  # 초 단위, MySQL wait_timeout 보다 짧게 유지
+    db_pool_pre_ping: bool = True
+    db_pool_timeout: int = 30  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초)
+
+    # asyncio 모드: True면 async def 라우터와 비동기 드라이버(aiomysql/aiosqlite)를 사용
+    db_async: bool = False
+    # 비어 있으면 DATABASE_URL에서 드라이버만 바꿔서 사용 (예: mysql+asyncmy://... 로 지정 가능)
+    async_database_url: str = ""
+
+    # 워커별 세션 캐시 (get_current_user의 sessions 조회를 줄임)
+    session_cache_enabled: bool = False
+    session_cache_maxsize: int = 10000
+    # 초 단위, 다른 워커의 로그아웃이 이 워커에 반영되기까지의 최대 지연
+    session_cache_ttl: int = 30
+
+    # 세션 저장소 백엔드: db(sessions 테이블) | memory(단일 노드) | redis(공유 키-값 저장소)
+    # | signed(SECRET_KEY로 서명한 무상태 토큰, 인증 시 DB 조회 없음)
+    session_backend: Literal["db", "memory", "redis", "signed"] = "db"
+    session_memory_shards: int = 16
+    redis_url: str = "redis://localhost:6379/0"  # Redis 7 이상 (EXPIRE GT/NX 사용)
+    # signed 모드에서 로그아웃한 토큰 거부 목록 저장 위치 (여러 워커면 redis 권장)
+    session_denylist_backend: Literal["memory", "redis"] = "memory"
+
+    # bcrypt 전용 프로세스 풀: 대기 작업이 max_queue를 넘으면 503 + Retry-After
+    password_pool_enabled: bool = True
+    password_pool_workers: int = 2
+    password_pool_max_queue: int = 16
+    password_pool_retry_after: int = 1  # 초 단위
+
+    # 게시글 단건 조회 캐시 (워커 단위), TTL은 초 단위
+    post_cache_enabled: bool = False
+    post_cache_maxsize: int = 10000
+    post_cache_ttl: int = 30
+    # TTL이 지난 뒤 기존 값을 응답하면서 한 요청만 갱신하는 기간 (0이면 사용 안 함)
+    post_cache_stale_ttl: int = 30
+
+    # 조회 응답을 pydantic-core로 한 번만 직렬화하고, 그 외 응답은 orjson으로 인코딩
+    fast_json: bool = False
+
+    # 만료 세션 정리 (SESSION_BACKEND=db), 주기는 초 단위
+    session_sweeper_enabled: bool = True
+    session_sweep_interval: int = 300
+    session_sweep_batch_size: int = 500
+
+    # 게시글 검색: fulltext(MySQL FULLTEXT) | memory(워커별 역색인) | auto(MySQL이면 fulltext)
+    search_backend: Literal["auto", "fulltext", "memory"] = "auto"
+
+    # POST /posts/bulk, /comments/bulk 한 요청의 최대 항목 수
+    bulk_max_batch_size: int = 1000
+
+    # GET /export/* 에서 서버 측 커서로 한 번에 읽는 행 수
+    export_batch_size: int = 1000
+
+    # python -m app.tools.import_jsonl 의 기본 배치 크기 (--batch-size로 변경)
+    import_batch_size: int = 1000
+
+    # 시작 시 스키마 처리: check(미적용 마이그레이션이 있으면 시작 중단) | migrate(시작 시 적용)
+    # | skip. 여러 워커가 동시에 migrate 하지 않도록 배포 전에 python -m app.migrations 실행을 권장
+    schema_on_startup: Literal["check", "migrate", "skip"] = "check"
+
+    # GET /metrics (Prometheus 텍스트 형식)와 요청 지표 수집 미들웨어
+    metrics_enabled: bool = True
+
+    # 요청 단위 SQL 통계: 이 시간(ms) 이상 걸린 SQL 문은 경고 로그 (0이면 끔),
+    # 한 요청에서 같은 SQL 문이 이 횟수 이상 실행되면 N+1 의심 경고 (0이면 끔)
+    slow_query_ms: int = 500
+    n_plus_one_threshold: int = 5
+    # 디버그용: 응답에 Server-Timing 헤더(DB 시간, 쿼리 수) 추가
+    server_timing: bool = False
+
+    # 관리자 요청 프로파일러 (X-Profile 헤더): 저장 위치와 스택 샘플링 간격
+    profile_dir: str = "/tmp/app-profiles"
+    profile_interval_ms: float = 1.0
 
     class Config:
         env_file = ".env.test"
+        extra = "ignore"  # .env 파일의 MYSQL_* 등 다른 변수는 무시
 
 
+@lru_cache
 def get_settings():
     return Settings()
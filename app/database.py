@@ -1,26 +1,95 @@
 # database.py
-import os
+import threading
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from app.auth.password_pool import shutdown_password_pool
+from app.config import get_settings
 from app.logger_setup import logger
+from app.metrics import instrument_engine
+from app.query_stats import track_queries
+from app.startup import startup_timer
 
 Base = declarative_base()
 
+# 프로세스당 하나의 엔진(커넥션 풀)과 sessionmaker를 공유한다.
+# 요청마다 엔진을 만들면 매번 새 커넥션 풀과 MySQL 핸드셰이크 비용이 발생한다.
+_engine = None
+_session_local = None
+_async_engine = None
+_async_session_local = None
+_engine_lock = threading.RLock()
+
+
+def get_database_url() -> str:
+    # 동기/비동기 엔진이 같은 설정(DATABASE_URL)을 보도록 Settings에서 읽음
+    return get_settings().database_url
+
+
+# 동기 드라이버 -> asyncio 드라이버 매핑
+_ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url() -> str:
+    settings = get_settings()
+    if settings.async_database_url:
+        return settings.async_database_url
+
+    url = make_url(get_database_url())
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"asyncio 드라이버를 지원하지 않는 데이터베이스입니다: {url}")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def _pool_options(database_url: str) -> dict:
+    # SQLite는 QueuePool 옵션(max_overflow 등)을 지원하지 않는 풀을 쓸 수 있으므로 제외
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+
+    settings = get_settings()
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_timeout": settings.db_pool_timeout,
+    }
+
 
 def get_engine():
-    SQLALCHEMY_DATABASE_URL = os.getenv(
-        "DATABASE_URL", "mysql+pymysql://root:password@db:3306/mydatabase"
-    )
-    return create_engine(SQLALCHEMY_DATABASE_URL, connect_args={})
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                SQLALCHEMY_DATABASE_URL = get_database_url()
+                _engine = create_engine(
+                    SQLALCHEMY_DATABASE_URL,
+                    connect_args={},
+                    **_pool_options(SQLALCHEMY_DATABASE_URL),
+                )
+                instrument_engine("sync", _engine)
+                track_queries(_engine)
+    return _engine
 
 
 def get_session_local():
-    engine = get_engine()
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    global _session_local
+    if _session_local is None:
+        with _engine_lock:
+            if _session_local is None:
+                _session_local = sessionmaker(
+                    autocommit=False, autoflush=False, bind=get_engine()
+                )
+    return _session_local
 
 
 def get_db():
@@ -32,10 +101,104 @@ def get_db():
         db.close()
 
 
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                ASYNC_DATABASE_URL = get_async_database_url()
+                _async_engine = create_async_engine(
+                    ASYNC_DATABASE_URL, **_pool_options(ASYNC_DATABASE_URL)
+                )
+                instrument_engine("async", _async_engine.sync_engine)
+                track_queries(_async_engine.sync_engine)
+    return _async_engine
+
+
+def get_async_session_local():
+    global _async_session_local
+    if _async_session_local is None:
+        with _engine_lock:
+            if _async_session_local is None:
+                # 커밋 후 속성 만료 시 lazy load가 이벤트 루프 밖에서 일어나지 않도록 expire_on_commit=False
+                _async_session_local = async_sessionmaker(
+                    bind=get_async_engine(), autoflush=False, expire_on_commit=False
+                )
+    return _async_session_local
+
+
+async def get_async_db():
+    AsyncSessionLocal = get_async_session_local()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def dispose_engine():
+    global _engine, _session_local
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _session_local = None
+
+
+async def dispose_async_engine():
+    global _async_engine, _async_session_local
+    engine = _async_engine
+    with _engine_lock:
+        _async_engine = None
+        _async_session_local = None
+    # 비동기 커넥션은 만들어진 이벤트 루프에 묶여 있으므로 종료 시 반드시 정리
+    if engine is not None:
+        await engine.dispose()
+
+
+class SchemaOutdatedError(RuntimeError):
+    pass
+
+
+def prepare_schema():
+    # 워커 시작 시 스키마를 만들거나 지우지 않고 적용된 버전만 확인한다. (SCHEMA_ON_STARTUP)
+    from app.migrations import migrate, pending_versions
+
+    mode = get_settings().schema_on_startup
+    if mode == "skip":
+        return
+    engine = get_engine()
+    if mode == "migrate":
+        applied = migrate(engine)
+        if applied:
+            logger.info("마이그레이션 완료: %s", applied)
+        return
+    pending = pending_versions(engine)
+    if pending:
+        raise SchemaOutdatedError(
+            f"DB 스키마가 최신이 아닙니다 (미적용 마이그레이션: {pending}). "
+            "python -m app.migrations 를 먼저 실행하세요."
+        )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # session_store, session_sweeper가 database를 import 하므로 순환 import를 피하기 위해 여기서 import
+    from app.session_store import close_session_stores
+    from app.session_sweeper import get_session_sweeper
+
+    with startup_timer.step("schema"):
+        prepare_schema()
+    with startup_timer.step("session sweeper"):
+        sweeper = get_session_sweeper()
+        if sweeper is not None:
+            sweeper.start()
+    startup_timer.log()
     logger.info("애플리케이션이 시작되었습니다.")
     try:
         yield
     finally:
+        if sweeper is not None:
+            await sweeper.stop()
+        dispose_engine()
+        await dispose_async_engine()
+        await close_session_stores()
+        shutdown_password_pool()
         logger.info("애플리케이션이 종료되었습니다.")
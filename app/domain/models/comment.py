@@ -1,15 +1,21 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (Column, DateTime, ForeignKey, Index, Integer, String,
+                        Text)
 from sqlalchemy.orm import relationship
 
 from app.database import Base
 from app.domain.models.post import Post
 from app.domain.models.user import User
+from app.domain.models.version import version_column
 
 
 class Comment(Base):
     __tablename__ = "comments"
+    # 게시글별 댓글 keyset 페이지네이션용 복합 인덱스
+    __table_args__ = (
+        Index("ix_comments_post_id_created_at_id", "post_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     author_id = Column(String(255), ForeignKey("users.userid"), nullable=False)
@@ -18,6 +24,8 @@ class Comment(Base):
     )
     content = Column(Text, nullable=False)  # 내용 필드 필수로 설정, 인덱스 제거
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # 수정될 때마다 증가, ETag 계산용
+    version = version_column()
 
     author = relationship("User", back_populates="comments")
     post = relationship("Post", back_populates="comments")
@@ -1,14 +1,29 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (Column, DateTime, ForeignKey, Index, Integer, String,
+                        Text)
 from sqlalchemy.orm import joinedload, relationship
 
 from app.database import Base
 from app.domain.models.user import User
+from app.domain.models.version import version_column
 
 
 class Post(Base):
     __tablename__ = "posts"
+    # keyset 페이지네이션 (created_at, id) 정렬/범위 검색용 복합 인덱스
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_author_id_created_at_id", "author_id", "created_at", "id"),
+        # GET /posts/search 용 (MySQL 전용, ngram 파서로 한글 검색). 다른 DB는 메모리 역색인 사용
+        Index(
+            "ix_posts_title_content_fulltext",
+            "title",
+            "content",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     author_id = Column(
@@ -19,6 +34,10 @@ class Post(Base):
     )  # 제목 필드, nullable=False 추가
     content = Column(Text, nullable=False)  # 내용 필드, nullable=False 추가
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # 수정될 때마다 증가, ETag 계산용
+    version = version_column()
+    # 댓글 수 (비정규화). CommentService가 댓글 작성/삭제와 같은 트랜잭션에서 증감한다.
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     author = relationship("User", back_populates="posts")
     comments = relationship(
@@ -9,12 +9,14 @@ class SessionModel(Base):
 
     session_id = Column(String(36), primary_key=True, index=True)
     data = Column(String(255))
-    expires_at = Column(DateTime)
+    # 만료 세션 정리(session_sweeper)가 범위 스캔할 수 있도록 인덱스
+    expires_at = Column(DateTime, index=True)
 
-    # `user_id`는 `users` 테이블의 `id`를 참조하는 외래 키입니다.
-    user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True
-    )  # 각 User당 하나의 Session만 허용
+    # 세션 소유자. `user_id`는 `users` 테이블의 `id`를 참조하는 외래 키이고,
+    # `userid`는 로그인 ID로 로그아웃/전체 세션 폐기 시 인덱스로 바로 찾기 위해 저장한다.
+    # 한 사용자가 여러 기기에서 로그인할 수 있으므로 unique가 아니다.
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    userid = Column(String(50), index=True)
 
-    # User와의 1:1 관계 설정
-    user = relationship("User", back_populates="session")
+    # User와의 1:N 관계 설정
+    user = relationship("User", back_populates="sessions")
@@ -5,6 +5,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
+from app.domain.models.version import version_column
 
 
 class Role(str, enum.Enum):
@@ -23,16 +24,17 @@ class User(Base):
     created_at = Column(
         DateTime, default=func.now(), nullable=False, server_default=func.now()
     )
+    # 수정될 때마다 증가, ETag 계산용 (게시글 응답에 포함되는 작성자 정보도 이 값으로 판단)
+    version = version_column()
 
     posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
     comments = relationship(
         "Comment", back_populates="author", cascade="all, delete-orphan"
     )
 
-    # 1:1 관계 설정: 유저당 하나의 세션만 허용
-    session = relationship(
+    # 1:N 관계 설정: 유저는 여러 세션(기기)을 가질 수 있음
+    sessions = relationship(
         "SessionModel",
         back_populates="user",
-        uselist=False,
         cascade="all, delete-orphan",
     )
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, literal_column
+
+
+# 행이 수정될 때마다 1씩 증가하는 버전 컬럼 (ETag 계산용)
+# UPDATE 문마다 version = version + 1 이 적용된다. (ORM 수정과 Core update() 모두)
+def version_column() -> Column:
+    return Column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version + 1"),
+    )
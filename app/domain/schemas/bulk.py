@@ -0,0 +1,14 @@
+from typing import Any, List, Optional
+
+from pydantic import BaseModel
+
+
+class BulkItemError(BaseModel):
+    index: int  # 요청 목록에서의 위치 (0부터)
+    detail: Any
+
+
+# ids는 요청 목록과 같은 순서이며, 오류가 난 항목은 None
+class BulkCreateResult(BaseModel):
+    ids: List[Optional[int]]
+    errors: List[BulkItemError] = []
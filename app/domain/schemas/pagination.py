@@ -0,0 +1,11 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+# 커서(keyset) 페이지네이션 응답. next_cursor가 None이면 마지막 페이지
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
@@ -21,6 +21,7 @@ class PostRead(BaseModel):
     content: str
     author: Optional[UserRead]  # author 필드를 Optional로 설정
     created_at: datetime
+    comment_count: int = 0
 
     class Config:
         from_attributes = True
@@ -56,6 +56,7 @@ class UserUpdate(BaseModel):
 
 
 class UserInDB(UserRead):
-    hashed_password: str
+    # 서명 토큰(SESSION_BACKEND=signed)으로 인증한 사용자는 비밀번호 해시를 갖지 않음
+    hashed_password: Optional[str] = None
 
     model_config = ConfigDict(from_attributes=True)
@@ -5,8 +5,8 @@ from app.logger_setup import logger
 def test_password_hash():
     password = "TestPassword123"
     hashed_password = get_password_hash(password)
-    logger.info(f"Original password: {password}")
-    logger.info(f"Hashed password: {hashed_password}")
+    logger.info("Original password: %s", password)
+    logger.info("Hashed password: %s", hashed_password)
 
 
 if __name__ == "__main__":
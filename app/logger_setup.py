@@ -1,5 +1,14 @@
+import atexit
+import json
 import logging
 import os
+import queue
+import random
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 
 from dotenv import load_dotenv
 
@@ -9,14 +18,147 @@ log_level = os.getenv("LOG_LEVEL", "DEBUG").upper()
 log_format = os.getenv(
     "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+# LOG_JSON=true 면 한 줄에 JSON 하나 (시각, 레벨, 로거, 메시지, request_id)
+log_json = os.getenv("LOG_JSON", "false").lower() == "true"
+# 로거별 샘플링 비율: "app.api.endpoints=0.1,uvicorn.access=0.01" (WARNING 이상은 항상 기록)
+log_sampling = os.getenv("LOG_SAMPLING", "")
+# 출력 스레드가 밀려서 큐가 가득 차면 요청 스레드를 막지 않고 버린다
+log_queue_size = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# 요청 ID (RequestIdMiddleware가 요청마다 설정)
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+class RequestIdFilter(logging.Filter):
+    # 로그를 남긴 스레드/태스크의 요청 ID를 레코드에 붙임 (큐에 넣기 전에 실행되어야 함)
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    # 로거 이름(가장 길게 일치하는 상위 로거 포함)별로 WARNING 미만 로그를 비율만큼만 남김
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+        self._resolved: Dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = 1.0
+            parts = name.split(".")
+            for i in range(len(parts), 0, -1):
+                prefix = ".".join(parts[:i])
+                if prefix in self.rates:
+                    rate = self.rates[prefix]
+                    break
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+def parse_sampling(value: str) -> Dict[str, float]:
+    rates = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, rate = item.partition("=")
+        rates[name.strip()] = float(rate)
+    return rates
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    def format(self, record):
+        message = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        return f"{message} [request_id={request_id}]" if request_id else message
 
-logger = logging.getLogger(__name__)
-logger.setLevel(getattr(logging, log_level, logging.DEBUG))
+
+class NonBlockingQueueHandler(QueueHandler):
+    # 큐가 가득 차면 기다리지 않고 버린 개수만 센다
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RequestIdMiddleware:
+    # 요청 헤더의 X-Request-ID를 쓰거나 새로 만들어 로그와 응답 헤더에 붙이는 ASGI 미들웨어
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                header = (b"x-request-id", request_id.encode("latin-1"))
+                message = {**message, "headers": [*message.get("headers", []), header]}
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+# 요청 스레드(이벤트 루프)는 레코드를 큐에 넣기만 하고, stdout 쓰기는 QueueListener 스레드가 한다.
+# app.* 모듈의 로거는 모두 "app" 로거로 전달된다.
+log_queue = queue.Queue(maxsize=log_queue_size)
+queue_handler = NonBlockingQueueHandler(log_queue)
+queue_handler.addFilter(RequestIdFilter())
+queue_handler.addFilter(SamplingFilter(parse_sampling(log_sampling)))
 
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.DEBUG)
+console_handler.setFormatter(JsonFormatter() if log_json else TextFormatter(log_format))
 
-formatter = logging.Formatter(log_format)
-console_handler.setFormatter(formatter)
+listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+listener.start()
+atexit.register(listener.stop)  # 종료 전에 큐에 남은 로그를 모두 출력
 
-logger.addHandler(console_handler)
+app_logger = logging.getLogger("app")
+app_logger.setLevel(getattr(logging, log_level, logging.DEBUG))
+app_logger.addHandler(queue_handler)
+
+# uvicorn이 먼저 설정한 접근 로그도 같은 큐로 보냄 (요청마다 stdout에 직접 쓰지 않도록)
+_access_logger = logging.getLogger("uvicorn.access")
+if _access_logger.handlers:
+    _access_logger.handlers = [queue_handler]
+    _access_logger.propagate = False
+
+logger = logging.getLogger(__name__)
@@ -1,19 +1,43 @@
+# isort: off
+# 시작 시간 측정을 위해 가장 먼저 import
+from app.startup import FirstRequestTimer, startup_timer
+
+# isort: on
 from fastapi import FastAPI
 
-from app.api.endpoints import router
-from app.database import get_db  # `engine` 대신 `get_engine`만 가져옴
-from app.database import Base, get_engine, lifespan
+from app.api.responses import default_response_class
+from app.config import get_settings
+from app.database import lifespan
+from app.logger_setup import RequestIdMiddleware
+from app.metrics import MetricsMiddleware
+from app.profiler import ProfilerMiddleware
+from app.query_stats import QueryStatsMiddleware
 
 app = FastAPI(lifespan=lifespan)
 
+# 스키마는 import 시점에 건드리지 않는다. 시작(lifespan) 시 버전만 확인하고,
+# 테이블 생성/변경은 python -m app.migrations 로 한다. (SCHEMA_ON_STARTUP 참고)
+
+# DB_ASYNC=true 이면 async def 라우터(비동기 드라이버)를 사용
+# 사용하지 않는 쪽 라우터 모듈은 import 하지 않는다.
+if get_settings().db_async:
+    from app.api import async_endpoints
 
-# 데이터베이스 초기화 코드 (필요 시 사용)
-def initialize_database():
-    engine = get_engine()  # 필요한 시점에 엔진을 생성
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        async_endpoints.router, default_response_class=default_response_class()
+    )
+else:
+    from app.api import endpoints
 
+    app.include_router(
+        endpoints.router, default_response_class=default_response_class()
+    )
 
-initialize_database()  # 애플리케이션 시작 시 데이터베이스 초기화
+app.add_middleware(QueryStatsMiddleware)
+if get_settings().metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+app.add_middleware(ProfilerMiddleware)
+app.add_middleware(RequestIdMiddleware)
+app.add_middleware(FirstRequestTimer)
 
-app.include_router(router)
+startup_timer.record("import", startup_timer.started)
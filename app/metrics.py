@@ -0,0 +1,346 @@
+# Prometheus 텍스트 형식(0.0.4) 메트릭 (GET /metrics)
+# 외부 라이브러리 없이 워커(프로세스) 단위로 집계한다. 워커가 여러 개면 Prometheus가
+# 워커별로 수집하도록 하거나 합산해서 봐야 한다.
+# - 요청: 라우트 템플릿(/posts/{post_id})별 지연 시간 히스토그램, 상태 코드별 응답 수, 처리 중인 요청 수
+# - 커넥션 풀: 크기, 사용 중/대기/overflow 커넥션 수, 체크아웃 대기 시간 히스토그램
+# - 세션 조회 결과(백엔드별 hit/miss, 항상 수집)
+# - 세션 캐시, 게시글 캐시, 비밀번호 해시 풀, 만료 세션 정리 작업의 stats()
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+# 지연 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 라우트에 매칭되지 않은 요청(404 등)은 경로 대신 이 값으로 묶어서 라벨 수가 늘지 않게 함
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 구간별 개수 (마지막은 +Inf)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.sum
+
+
+class RequestMetrics:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.in_flight = 0
+        self._latency: Dict[Tuple[str, str], Histogram] = {}  # (method, route)
+        self._responses: Dict[Tuple[str, str, int], int] = {}  # (method, route, status)
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, seconds: float):
+        key = (method, route)
+        histogram = self._latency.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._latency.setdefault(key, Histogram(self.buckets))
+        histogram.observe(seconds)
+        with self._lock:
+            response_key = (method, route, status)
+            self._responses[response_key] = self._responses.get(response_key, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self._latency), dict(self._responses)
+
+    def reset(self):
+        with self._lock:
+            self._latency = {}
+            self._responses = {}
+
+
+request_metrics = RequestMetrics()
+
+
+class MetricsMiddleware:
+    # 요청마다 시간 측정과 딕셔너리 갱신만 하는 ASGI 미들웨어 (BaseHTTPMiddleware보다 가벼움).
+    # 라우트 템플릿은 FastAPI가 라우팅하면서 scope["route"]에 넣어 두는 값을 응답 후에 읽는다.
+    def __init__(self, app, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = 500  # 응답을 시작하기 전에 예외가 나면 500으로 기록
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            metrics.in_flight -= 1
+            route = scope.get("route")
+            metrics.observe(
+                scope["method"],
+                route.path if route is not None else UNMATCHED_ROUTE,
+                status,
+                time.perf_counter() - started,
+            )
+
+
+# 커넥션 풀: 이름(sync/async) -> (엔진, 체크아웃 대기 시간)
+_engines: Dict[str, Tuple[object, Histogram]] = {}
+
+
+def _time_checkout(pool, histogram: Histogram):
+    # SQLAlchemy에는 체크아웃 대기 시작 이벤트가 없어서 풀의 _do_get을 감싼다.
+    # 풀에 여유가 있으면 새 커넥션을 맺는 시간이, 가득 찼으면 반환을 기다린 시간이 들어간다.
+    do_get = pool._do_get
+
+    def timed_do_get():
+        started = time.perf_counter()
+        try:
+            return do_get()
+        finally:
+            histogram.observe(time.perf_counter() - started)
+
+    pool._do_get = timed_do_get
+
+
+def instrument_engine(name: str, engine):
+    # engine: 동기 Engine (AsyncEngine이면 .sync_engine)
+    histogram = Histogram()
+    _engines[name] = (engine, histogram)
+    _time_checkout(engine.pool, histogram)
+    # engine.dispose()는 풀을 새로 만들므로 새 풀도 감싼다
+    event.listen(engine, "engine_disposed", lambda e: _time_checkout(e.pool, histogram))
+
+
+def pool_stats() -> Dict[str, dict]:
+    stats = {}
+    for name, (engine, _) in _engines.items():
+        pool = engine.pool
+        if not hasattr(pool, "checkedout"):
+            continue  # QueuePool 계열만 (SQLite 메모리 DB의 SingletonThreadPool 등 제외)
+        stats[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+        }
+    return stats
+
+
+def _labels(**labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in labels.values()
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in zip(labels, escaped)) + "}"
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Writer:
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def header(self, name: str, kind: str, help_text: str):
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value, **labels):
+        self.lines.append(f"{name}{_labels(**labels)} {_number(value)}")
+
+    def metric(self, name: str, kind: str, help_text: str, value, **labels):
+        self.header(name, kind, help_text)
+        self.sample(name, value, **labels)
+
+    def histogram(self, name, buckets, counts: List[int], total: float, **labels):
+        cumulative = 0
+        for bound, count in zip([*buckets, "+Inf"], counts):
+            cumulative += count
+            le = bound if isinstance(bound, str) else _number(float(bound))
+            self.sample(f"{name}_bucket", cumulative, **labels, le=le)
+        self.sample(f"{name}_sum", total, **labels)
+        self.sample(f"{name}_count", cumulative, **labels)
+
+
+def _write_requests(out: _Writer, metrics: RequestMetrics):
+    latency, responses = metrics.snapshot()
+    out.metric(
+        "http_requests_in_flight", "gauge", "처리 중인 HTTP 요청 수", metrics.in_flight
+    )
+    out.header(
+        "http_request_duration_seconds", "histogram", "라우트별 요청 처리 시간(초)"
+    )
+    for (method, route), histogram in sorted(latency.items()):
+        counts, total = histogram.snapshot()
+        out.histogram(
+            "http_request_duration_seconds",
+            metrics.buckets,
+            counts,
+            total,
+            method=method,
+            route=route,
+        )
+    out.header("http_responses_total", "counter", "라우트, 상태 코드별 응답 수")
+    for (method, route, status), count in sorted(responses.items()):
+        out.sample(
+            "http_responses_total", count, method=method, route=route, status=status
+        )
+
+
+def _write_pools(out: _Writer):
+    stats = pool_stats()
+    gauges = {
+        "size": "풀 크기(pool_size)",
+        "checked_out": "사용 중인 커넥션 수",
+        "checked_in": "풀에서 대기 중인 커넥션 수",
+        "overflow": "pool_size를 넘어 추가로 연 커넥션 수",
+    }
+    for field, help_text in gauges.items():
+        out.header(f"db_pool_{field}", "gauge", help_text)
+        for name, values in stats.items():
+            out.sample(f"db_pool_{field}", values[field], engine=name)
+    out.header(
+        "db_pool_checkout_wait_seconds",
+        "histogram",
+        "커넥션 체크아웃 대기 시간(초, 새 연결 포함)",
+    )
+    for name, (_, histogram) in _engines.items():
+        counts, total = histogram.snapshot()
+        out.histogram(
+            "db_pool_checkout_wait_seconds",
+            histogram.buckets,
+            counts,
+            total,
+            engine=name,
+        )
+
+
+_CACHE_COUNTERS = {
+    "hits": "적중 수",
+    "stale_hits": "TTL이 지난 값으로 응답한 수",
+    "misses": "미스 수",
+    "evictions": "용량 초과로 제거한 항목 수",
+}
+_PASSWORD_POOL_COUNTERS = {
+    "submitted": "비밀번호 해시 풀에 제출한 작업 수",
+    "completed": "비밀번호 해시 풀에서 완료한 작업 수",
+    "rejected": "대기 한도를 넘어 거절한 작업 수",
+}
+_SWEEPER_COUNTERS = {
+    "runs": "만료 세션 정리 실행 횟수",
+    "batches": "만료 세션 삭제 배치 수",
+    "rows_purged": "삭제한 만료 세션 수",
+}
+
+
+def _write_session_lookups(out: _Writer, counts: dict, backend: str):
+    out.header(
+        "session_lookups_total", "counter", "세션 조회 수 (백엔드, 결과별: hit, miss)"
+    )
+    # 현재 백엔드는 조회가 없어도 0으로 내보내서 적중률 계산식이 비지 않게 함
+    for result in ("hit", "miss"):
+        counts.setdefault((backend, result), 0)
+    for (name, result), count in sorted(counts.items()):
+        out.sample("session_lookups_total", count, backend=name, result=result)
+
+
+def _write_cache(out: _Writer, prefix: str, label: str, stats: Optional[dict]):
+    if stats is None:
+        return  # 비활성화된 캐시
+    out.metric(f"{prefix}_size", "gauge", f"{label} 항목 수", stats["size"])
+    for field, help_text in _CACHE_COUNTERS.items():
+        if field in stats:
+            out.metric(
+                f"{prefix}_{field}_total",
+                "counter",
+                f"{label} {help_text}",
+                stats[field],
+            )
+
+
+def _write_password_pool(out: _Writer, stats: Optional[dict]):
+    if stats is None:
+        return
+    out.metric(
+        "password_pool_queue_depth",
+        "gauge",
+        "비밀번호 해시 풀에서 처리/대기 중인 작업 수",
+        stats["queue_depth"],
+    )
+    for field, help_text in _PASSWORD_POOL_COUNTERS.items():
+        out.metric(f"password_pool_{field}_total", "counter", help_text, stats[field])
+    buckets_ms = stats["latency_buckets_ms"]
+    bounds = [bound / 1000 for bound in buckets_ms if bound != "+Inf"]
+    out.header(
+        "password_pool_latency_seconds", "histogram", "해시/검증 작업 처리 시간(초)"
+    )
+    out.histogram(
+        "password_pool_latency_seconds",
+        bounds,
+        list(buckets_ms.values()),
+        stats["latency_avg_ms"] * stats["completed"] / 1000,
+    )
+
+
+def _write_sweeper(out: _Writer, stats: Optional[dict]):
+    if stats is None:
+        return
+    for field, help_text in _SWEEPER_COUNTERS.items():
+        out.metric(f"session_sweeper_{field}_total", "counter", help_text, stats[field])
+    out.metric(
+        "session_sweeper_last_batch_seconds",
+        "gauge",
+        "마지막 정리 배치 소요 시간(초)",
+        stats["last_batch_ms"] / 1000,
+    )
+
+
+def render_metrics(metrics: RequestMetrics = request_metrics) -> str:
+    # 순환 import를 피하기 위해 여기서 import
+    from app.auth.password_pool import get_password_pool
+    from app.config import get_settings
+    from app.post_cache import get_post_cache
+    from app.session_backends import session_lookups
+    from app.session_cache import get_session_cache
+    from app.session_sweeper import get_session_sweeper
+
+    out = _Writer()
+    _write_requests(out, metrics)
+    _write_pools(out)
+    _write_session_lookups(
+        out, session_lookups.snapshot(), get_settings().session_backend
+    )
+    session_cache = get_session_cache()
+    _write_cache(
+        out, "session_cache", "세션 캐시", session_cache and session_cache.stats()
+    )
+    post_cache = get_post_cache()
+    _write_cache(out, "post_cache", "게시글 캐시", post_cache and post_cache.stats())
+    password_pool = get_password_pool()
+    _write_password_pool(out, password_pool and password_pool.stats())
+    sweeper = get_session_sweeper()
+    _write_sweeper(out, sweeper and sweeper.stats())
+    return "\n".join(out.lines) + "\n"
@@ -0,0 +1,78 @@
+# 스키마 마이그레이션
+# create_all은 이미 있는 테이블에 컬럼이나 인덱스를 추가하지 않으므로, 운영 중인 DB는
+# 여기 등록된 단계를 버전 순서대로 적용한다. (python -m app.migrations)
+# 각 단계는 현재 스키마를 확인한 뒤 필요한 변경만 하므로 다시 실행해도 안전하다.
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import (Column, DateTime, Integer, MetaData, String, Table,
+                        inspect, select)
+from sqlalchemy.engine import Engine
+
+from app.database import Base
+from app.logger_setup import logger
+from app.migrations import (v001_keyset_indexes, v002_session_expires_at_index,
+                            v003_session_owner_columns, v004_row_versions,
+                            v005_post_comment_count, v006_post_fulltext_index)
+
+# (버전, 설명, upgrade 함수)
+MIGRATIONS = [
+    (1, "keyset pagination indexes", v001_keyset_indexes.upgrade),
+    (2, "sessions.expires_at index", v002_session_expires_at_index.upgrade),
+    (3, "session owner columns", v003_session_owner_columns.upgrade),
+    (4, "row versions for ETag", v004_row_versions.upgrade),
+    (5, "posts.comment_count", v005_post_comment_count.upgrade),
+    (6, "posts fulltext index", v006_post_fulltext_index.upgrade),
+]
+
+# 적용한 버전 기록 (모델의 Base.metadata와 분리해서 drop_all 대상에서 제외)
+metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def applied_versions(engine: Engine) -> set:
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def upgrade(engine: Engine) -> List[int]:
+    # 아직 적용하지 않은 단계를 하나씩 별도 트랜잭션으로 적용하고, 적용한 버전 목록을 반환
+    applied = applied_versions(engine)
+    newly_applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        logger.info("마이그레이션 %s (%s) 적용 중", version, name)
+        with engine.begin() as connection:
+            migrate(connection)
+            connection.execute(
+                schema_migrations.insert().values(
+                    version=version, name=name, applied_at=datetime.utcnow()
+                )
+            )
+        newly_applied.append(version)
+    return newly_applied
+
+
+def pending_versions(engine: Engine) -> List[int]:
+    # 아직 적용하지 않은 버전 (읽기만 하므로 워커 시작 시 확인용으로 사용)
+    if not inspect(engine).has_table(schema_migrations.name):
+        return [version for version, _, _ in MIGRATIONS]
+    with engine.connect() as connection:
+        applied = set(connection.execute(select(schema_migrations.c.version)).scalars())
+    return [version for version, _, _ in MIGRATIONS if version not in applied]
+
+
+def migrate(engine: Engine) -> List[int]:
+    # 기존 테이블은 마이그레이션으로 변경하고, 없는 테이블은 현재 모델대로 만든다.
+    # (빈 DB에서는 모든 단계가 건너뛰어진 채 기록되고 create_all이 최신 스키마로 생성)
+    newly_applied = upgrade(engine)
+    Base.metadata.create_all(engine)
+    return newly_applied
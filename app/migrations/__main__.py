@@ -0,0 +1,11 @@
+# 사용법: DATABASE_URL=... python -m app.migrations
+from app.database import get_engine
+from app.logger_setup import logger
+from app.migrations import migrate
+
+if __name__ == "__main__":
+    applied = migrate(get_engine())
+    if applied:
+        logger.info("마이그레이션 완료: %s", applied)
+    else:
+        logger.info("적용할 마이그레이션이 없습니다.")
@@ -0,0 +1,20 @@
+# 마이그레이션 단계에서 공통으로 쓰는 스키마 확인 함수
+from sqlalchemy import Index, inspect
+from sqlalchemy.engine import Connection
+
+
+def has_table(connection: Connection, table: str) -> bool:
+    return inspect(connection).has_table(table)
+
+
+def has_column(connection: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(connection).get_columns(table))
+
+
+def create_index(connection: Connection, index: Index):
+    # 이미 같은 이름의 인덱스가 있으면 건너뜀
+    index.create(connection, checkfirst=True)
+
+
+def model_index(model, name: str) -> Index:
+    return next(index for index in model.__table__.indexes if index.name == name)
@@ -0,0 +1,16 @@
+# 게시글/댓글 keyset 페이지네이션용 복합 인덱스
+from sqlalchemy.engine import Connection
+
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.migrations.utils import create_index, has_table, model_index
+
+
+def upgrade(connection: Connection):
+    if has_table(connection, "posts"):
+        create_index(connection, model_index(Post, "ix_posts_created_at_id"))
+        create_index(connection, model_index(Post, "ix_posts_author_id_created_at_id"))
+    if has_table(connection, "comments"):
+        create_index(
+            connection, model_index(Comment, "ix_comments_post_id_created_at_id")
+        )
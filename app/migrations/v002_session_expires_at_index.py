@@ -0,0 +1,10 @@
+# 만료 세션 정리(session_sweeper)용 expires_at 인덱스
+from sqlalchemy.engine import Connection
+
+from app.domain.models.session import SessionModel
+from app.migrations.utils import create_index, has_table, model_index
+
+
+def upgrade(connection: Connection):
+    if has_table(connection, "sessions"):
+        create_index(connection, model_index(SessionModel, "ix_sessions_expires_at"))
@@ -0,0 +1,112 @@
+# 세션 소유자 컬럼(user_id, userid)과 인덱스
+# - sessions.userid 컬럼 추가, user_id/userid 인덱스 생성
+# - user_id의 unique 제약 제거 (한 사용자가 여러 세션을 가질 수 있음)
+# - 기존 행은 data(JSON)의 id/userid 값으로 채움
+import json
+
+from sqlalchemy import bindparam, inspect, select, text, update
+from sqlalchemy.engine import Connection
+
+from app.domain.models.session import SessionModel
+from app.migrations.utils import (create_index, has_column, has_table,
+                                  model_index)
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _user_id_unique_names(connection: Connection) -> list:
+    inspector = inspect(connection)
+    names = [
+        c["name"]
+        for c in inspector.get_unique_constraints("sessions")
+        if c["column_names"] == ["user_id"]
+    ]
+    names += [
+        i["name"]
+        for i in inspector.get_indexes("sessions")
+        if i["unique"] and i["column_names"] == ["user_id"] and i["name"] not in names
+    ]
+    return names
+
+
+def _rebuild_sqlite_table(connection: Connection):
+    # SQLite는 컬럼에 선언된 unique 제약을 ALTER로 제거할 수 없으므로 테이블을 새로 만들어 복사
+    inspector = inspect(connection)
+    old_columns = {c["name"] for c in inspector.get_columns("sessions")}
+    for index in inspector.get_indexes("sessions"):
+        connection.execute(text(f"DROP INDEX {index['name']}"))
+    connection.execute(text("ALTER TABLE sessions RENAME TO sessions_old"))
+    SessionModel.__table__.create(connection)
+    columns = ", ".join(
+        c.name for c in SessionModel.__table__.columns if c.name in old_columns
+    )
+    connection.execute(
+        text(f"INSERT INTO sessions ({columns}) SELECT {columns} FROM sessions_old")
+    )
+    connection.execute(text("DROP TABLE sessions_old"))
+
+
+def _backfill(connection: Connection):
+    # session_id 순서로 배치 단위 처리 (userid가 없는 행만 대상)
+    table = SessionModel.__table__
+    stmt = (
+        update(table)
+        .where(table.c.session_id == bindparam("b_session_id"))
+        .values(user_id=bindparam("b_user_id"), userid=bindparam("b_userid"))
+    )
+    last_id = ""
+    while True:
+        rows = connection.execute(
+            select(table.c.session_id, table.c.data)
+            .where(table.c.userid.is_(None), table.c.session_id > last_id)
+            .order_by(table.c.session_id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        params = []
+        for session_id, data in rows:
+            try:
+                payload = json.loads(data or "{}")
+            except ValueError:
+                continue
+            if payload.get("userid") is not None:
+                params.append(
+                    {
+                        "b_session_id": session_id,
+                        "b_user_id": payload.get("id"),
+                        "b_userid": payload["userid"],
+                    }
+                )
+        if params:
+            connection.execute(stmt, params)
+        last_id = rows[-1].session_id
+
+
+def upgrade(connection: Connection):
+    if not has_table(connection, "sessions"):
+        return
+
+    unique_names = _user_id_unique_names(connection)
+    if connection.dialect.name == "sqlite":
+        if unique_names or not has_column(connection, "sessions", "userid"):
+            _rebuild_sqlite_table(connection)
+    else:
+        if not has_column(connection, "sessions", "userid"):
+            connection.execute(
+                text("ALTER TABLE sessions ADD COLUMN userid VARCHAR(50)")
+            )
+        # MySQL은 외래 키에 인덱스가 필요하므로 새 인덱스를 먼저 만들고 unique 인덱스를 제거
+        create_index(connection, model_index(SessionModel, "ix_sessions_user_id"))
+        for name in unique_names:
+            if connection.dialect.name == "mysql":
+                connection.execute(text(f"ALTER TABLE sessions DROP INDEX `{name}`"))
+            else:
+                connection.execute(
+                    text(f'ALTER TABLE sessions DROP CONSTRAINT "{name}"')
+                )
+
+    create_index(connection, model_index(SessionModel, "ix_sessions_user_id"))
+    create_index(connection, model_index(SessionModel, "ix_sessions_userid"))
+    create_index(connection, model_index(SessionModel, "ix_sessions_expires_at"))
+    _backfill(connection)
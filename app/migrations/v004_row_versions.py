@@ -0,0 +1,17 @@
+# ETag 계산용 version 컬럼 (posts, comments, users)
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.migrations.utils import has_column, has_table
+
+
+def upgrade(connection: Connection):
+    for table in ("users", "posts", "comments"):
+        if has_table(connection, table) and not has_column(
+            connection, table, "version"
+        ):
+            connection.execute(
+                text(
+                    f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+                )
+            )
@@ -0,0 +1,22 @@
+# posts.comment_count (비정규화 댓글 수) 컬럼 추가 후 현재 댓글 수로 채움
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.migrations.utils import has_column, has_table
+
+
+def upgrade(connection: Connection):
+    if not has_table(connection, "posts") or has_column(
+        connection, "posts", "comment_count"
+    ):
+        return
+    connection.execute(
+        text("ALTER TABLE posts ADD COLUMN comment_count INTEGER NOT NULL DEFAULT 0")
+    )
+    if has_table(connection, "comments"):
+        connection.execute(
+            text(
+                "UPDATE posts SET comment_count = ("
+                "SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)"
+            )
+        )
@@ -0,0 +1,10 @@
+# GET /posts/search 용 FULLTEXT 인덱스 (MySQL에서만 생성, 다른 DB에서는 건너뜀)
+from sqlalchemy.engine import Connection
+
+from app.domain.models.post import Post
+from app.migrations.utils import create_index, has_table, model_index
+
+
+def upgrade(connection: Connection):
+    if has_table(connection, "posts"):
+        create_index(connection, model_index(Post, "ix_posts_title_content_fulltext"))
@@ -0,0 +1,212 @@
+# 워커(프로세스) 단위 게시글 캐시 (GET /posts/{post_id})
+# PostRead를 직렬화한 dict와 그 본문을 읽은 시점의 ETag를 게시글 ID로 캐시한다.
+# 게시글 수정/삭제와 작성자 정보 변경 시 무효화한다.
+# 다른 워커에서 수정된 게시글은 TTL 동안 이 워커에 남을 수 있으므로 TTL은 짧게 유지한다.
+#
+# stale-while-revalidate: TTL이 지난 뒤 stale_ttl 동안은 기존 값을 그대로 응답하고,
+# 그 사이 첫 번째 요청 하나만 DB에서 다시 읽는다. 인기 게시글이 만료되는 순간
+# 동시에 들어온 요청이 모두 MySQL로 몰리는 것을 막는다.
+#
+# 조회할 때 DB의 현재 ETag를 넘기면 캐시된 ETag와 다른 항목(다른 워커에서 수정됨)은
+# 미스로 보고 다시 읽는다. 응답 본문과 ETag는 항상 같은 항목에서 꺼내므로 서로 어긋나지 않는다.
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+from app.config import get_settings
+
+_MISS = object()
+
+# (PostRead dict, 그 본문의 ETag)
+Loaded = Optional[Tuple[dict, Optional[str]]]
+
+
+class _Entry:
+    __slots__ = ("payload", "etag", "fresh_until", "stale_until", "refreshing")
+
+    def __init__(
+        self,
+        payload: dict,
+        etag: Optional[str],
+        fresh_until: float,
+        stale_until: float,
+    ):
+        self.payload = payload
+        self.etag = etag
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class PostCache:
+    def __init__(self, maxsize: int = 10000, ttl: float = 30.0, stale_ttl: float = 0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries = OrderedDict()  # post_id -> _Entry
+        self._by_author = {}  # author userid -> set(post_id)
+        self._lock = threading.Lock()
+        # 무효화할 때마다 증가. DB에서 읽는 동안 무효화가 있었으면 읽은 값을 캐시하지 않는다.
+        self._version = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _lookup(self, post_id: int, etag: Optional[str]):
+        # 반환값: (캐시된 (payload, etag) 또는 DB에서 읽어야 하면 _MISS, 조회 시점의 버전)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(post_id)
+            if (
+                entry is None
+                or entry.stale_until <= now
+                or (etag is not None and entry.etag != etag)
+            ):
+                self.misses += 1
+                return _MISS, self._version
+            self._entries.move_to_end(post_id)
+            if now < entry.fresh_until:
+                self.hits += 1
+                return (entry.payload, entry.etag), self._version
+            if entry.refreshing:
+                # 다른 요청이 갱신 중이므로 기존 값으로 응답
+                self.stale_hits += 1
+                return (entry.payload, entry.etag), self._version
+            entry.refreshing = True
+            self.misses += 1
+            return _MISS, self._version
+
+    def get_or_load(
+        self,
+        post_id: int,
+        loader: Callable[[int], Loaded],
+        etag: Optional[str] = None,
+    ) -> Loaded:
+        loaded, version = self._lookup(post_id, etag)
+        if loaded is _MISS:
+            try:
+                loaded = loader(post_id)
+            except Exception:
+                self._release(post_id)
+                raise
+            self._store(post_id, loaded, version)
+        return loaded
+
+    async def aget_or_load(
+        self,
+        post_id: int,
+        loader: Callable[[int], Awaitable[Loaded]],
+        etag: Optional[str] = None,
+    ) -> Loaded:
+        loaded, version = self._lookup(post_id, etag)
+        if loaded is _MISS:
+            try:
+                loaded = await loader(post_id)
+            except Exception:
+                self._release(post_id)
+                raise
+            self._store(post_id, loaded, version)
+        return loaded
+
+    def _store(self, post_id: int, loaded: Loaded, version: int):
+        if loaded is None:
+            self.invalidate(post_id)
+        elif version == self._version:
+            self.set(post_id, *loaded)
+        else:
+            self._release(post_id)
+
+    def _release(self, post_id: int):
+        # 갱신에 실패하면 다음 요청이 다시 시도할 수 있도록 표시를 해제
+        with self._lock:
+            entry = self._entries.get(post_id)
+            if entry is not None:
+                entry.refreshing = False
+
+    def set(self, post_id: int, payload: dict, etag: Optional[str] = None):
+        now = time.monotonic()
+        entry = _Entry(payload, etag, now + self.ttl, now + self.ttl + self.stale_ttl)
+        author = (payload.get("author") or {}).get("userid")
+        with self._lock:
+            self._entries[post_id] = entry
+            self._entries.move_to_end(post_id)
+            self._by_author.setdefault(author, set()).add(post_id)
+            while len(self._entries) > self.maxsize:
+                evicted_id, evicted = self._entries.popitem(last=False)
+                self._unindex(evicted_id, evicted)
+                self.evictions += 1
+
+    def _unindex(self, post_id: int, entry: _Entry):
+        # self._lock을 잡은 상태에서 호출
+        author = (entry.payload.get("author") or {}).get("userid")
+        post_ids = self._by_author.get(author)
+        if post_ids is not None:
+            post_ids.discard(post_id)
+            if not post_ids:
+                del self._by_author[author]
+
+    def invalidate(self, post_id: int):
+        with self._lock:
+            self._version += 1
+            entry = self._entries.pop(post_id, None)
+            if entry is not None:
+                self._unindex(post_id, entry)
+
+    def invalidate_author(self, userid: str):
+        # 작성자 닉네임 등이 바뀌면 해당 작성자의 캐시된 게시글을 모두 제거
+        with self._lock:
+            self._version += 1
+            for post_id in self._by_author.pop(userid, ()):
+                self._entries.pop(post_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._by_author.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_post_cache = None
+_post_cache_lock = threading.Lock()
+
+
+def get_post_cache() -> Optional[PostCache]:
+    # POST_CACHE_ENABLED=false(기본값)이면 None을 반환해서 캐시를 사용하지 않음
+    global _post_cache
+    settings = get_settings()
+    if not settings.post_cache_enabled:
+        return None
+    if _post_cache is None:
+        with _post_cache_lock:
+            if _post_cache is None:
+                _post_cache = PostCache(
+                    maxsize=settings.post_cache_maxsize,
+                    ttl=settings.post_cache_ttl,
+                    stale_ttl=settings.post_cache_stale_ttl,
+                )
+    return _post_cache
+
+
+# 서비스 계층에서 쓰는 무효화 함수 (캐시를 사용하지 않으면 아무 일도 하지 않음)
+def invalidate_post(post_id: int):
+    cache = get_post_cache()
+    if cache is not None:
+        cache.invalidate(post_id)
+
+
+def invalidate_author_posts(userid: str):
+    cache = get_post_cache()
+    if cache is not None:
+        cache.invalidate_author(userid)
@@ -0,0 +1,205 @@
+# 요청 단위 프로파일러 (관리자 전용)
+# 관리자 세션으로 X-Profile: 1 헤더를 보낸 요청 하나만 샘플링 프로파일러로 측정해서
+# PROFILE_DIR에 flamegraph 입력 형식(collapsed stack, 한 줄에 "프레임;프레임;... 샘플 수")으로 저장한다.
+# 응답의 X-Profile-Id로 GET /profiles/{profile_id} 에서 받아 flamegraph.pl, speedscope 등으로 본다.
+#
+# 헤더가 없는 요청은 헤더 목록만 확인하고 그대로 넘긴다. 측정 중에는 별도 스레드가
+# PROFILE_INTERVAL_MS마다 이벤트 루프 스레드와 동기 핸들러를 실행 중인 스레드풀 스레드의 스택을 읽는다.
+# 같은 시간에 이벤트 루프에서 실행된 다른 요청의 코드도 함께 잡힐 수 있다.
+import asyncio
+import functools
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar
+from http.cookies import SimpleCookie
+from typing import Optional
+
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.logger_setup import logger
+
+PROFILE_HEADER = b"x-profile"
+_SITE_PACKAGES = "site-packages" + os.sep
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+_PROFILE_ID = re.compile(r"^[0-9A-Za-z-]+$")
+_active: ContextVar[Optional["StackSampler"]] = ContextVar(
+    "profile_sampler", default=None
+)
+
+
+def _frame_label(code, cache: dict) -> str:
+    label = cache.get(code)
+    if label is None:
+        filename = code.co_filename
+        if _SITE_PACKAGES in filename:
+            filename = filename.rsplit(_SITE_PACKAGES, 1)[1]
+        elif filename.startswith(_PROJECT_ROOT):
+            filename = filename[len(_PROJECT_ROOT) :]
+        name = getattr(code, "co_qualname", code.co_name)
+        # collapsed stack 형식에서 ;와 공백은 구분자이므로 바꿔 씀
+        label = f"{name}({filename}:{code.co_firstlineno})"
+        label = label.replace(";", ":").replace(" ", "_")
+        cache[code] = label
+    return label
+
+
+class StackSampler:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.thread_ids = set()
+        self.samples = Counter()
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def add_thread(self, thread_id: int):
+        self.thread_ids.add(thread_id)
+
+    def remove_thread(self, thread_id: int):
+        self.thread_ids.discard(thread_id)
+
+    def _fold(self, frame) -> str:
+        stack = []
+        while frame is not None:
+            stack.append(_frame_label(frame.f_code, self._labels))
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in list(self.thread_ids):
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.samples[self._fold(frame)] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.items())
+
+
+def profiled_endpoint(endpoint):
+    # 동기 핸들러는 스레드풀에서 실행되므로, 측정 중인 요청이면 실행하는 동안 그 스레드도 샘플링.
+    # async 핸들러는 이벤트 루프 스레드에서 실행되어 미들웨어가 이미 샘플링하므로 감싸지 않는다.
+    if asyncio.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        sampler = _active.get()
+        if sampler is None:
+            return endpoint(*args, **kwargs)
+        thread_id = threading.get_ident()
+        sampler.add_thread(thread_id)
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            sampler.remove_thread(thread_id)
+
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    # APIRouter(route_class=ProfiledRoute)
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, profiled_endpoint(endpoint), **kwargs)
+
+
+def _profile_path(profile_id: str) -> str:
+    return os.path.join(get_settings().profile_dir, f"{profile_id}.folded")
+
+
+def save_profile(profile_id: str, collapsed: str):
+    os.makedirs(get_settings().profile_dir, exist_ok=True)
+    with open(_profile_path(profile_id), "w", encoding="utf-8") as f:
+        f.write(collapsed)
+
+
+def load_profile(profile_id: str) -> Optional[str]:
+    if not _PROFILE_ID.match(profile_id):
+        return None
+    try:
+        with open(_profile_path(profile_id), encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _session_id(headers) -> Optional[str]:
+    for name, value in headers:
+        if name == b"cookie":
+            morsel = SimpleCookie(value.decode("latin-1")).get("session_id")
+            if morsel is not None:
+                return morsel.value
+    return None
+
+
+def is_admin_session(session_id: Optional[str]) -> bool:
+    # 순환 import를 피하기 위해 여기서 import
+    from app.database import get_session_local
+    from app.domain.models.user import Role
+    from app.session_store import DBSessionStore, get_shared_session_store
+
+    if not session_id:
+        return False
+    if get_settings().session_backend == "db":
+        with get_session_local()() as db:
+            session_data = DBSessionStore(db).get_session(session_id)
+    else:
+        session_data = get_shared_session_store().get_session(session_id)
+    return bool(session_data) and session_data.get("role") == Role.ADMIN
+
+
+class ProfilerMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            name == PROFILE_HEADER for name, _ in scope["headers"]
+        ):
+            return await self.app(scope, receive, send)
+        # 관리자가 아니면 헤더를 무시하고 평소처럼 처리
+        if not await run_in_threadpool(is_admin_session, _session_id(scope["headers"])):
+            return await self.app(scope, receive, send)
+
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                header = (b"x-profile-id", profile_id.encode())
+                message = {**message, "headers": [*message.get("headers", []), header]}
+            await send(message)
+
+        sampler = StackSampler(get_settings().profile_interval_ms / 1000)
+        sampler.add_thread(threading.get_ident())
+        token = _active.set(sampler)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            _active.reset(token)
+            await run_in_threadpool(save_profile, profile_id, sampler.collapsed())
+            logger.info(
+                "프로파일 저장: %s (%s %s, 샘플 %d개)",
+                profile_id,
+                scope["method"],
+                scope["path"],
+                sum(sampler.samples.values()),
+            )
@@ -0,0 +1,131 @@
+# 요청 단위 SQL 통계
+# 엔진의 커서 실행 이벤트로 요청마다 실행한 SQL 문 수와 DB 시간을 모은다.
+# - SLOW_QUERY_MS 이상 걸린 SQL 문은 파라미터 값을 지우고(타입만 남김) 경고 로그로 남긴다.
+# - 한 요청에서 같은 SQL 문이 N_PLUS_ONE_THRESHOLD번 이상 실행되면 N+1 의심으로 경고한다.
+# - SERVER_TIMING=true(디버그용)면 응답에 Server-Timing 헤더(db 시간, 쿼리 수, 전체 시간)를 붙인다.
+# 요청 정보는 ContextVar에 두므로 스레드풀에서 실행되는 동기 핸들러에서도 같은 객체를 본다.
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+
+from app.config import get_settings
+from app.logger_setup import logger
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements = Counter()  # SQL 문 -> 실행 횟수
+
+    def record(self, statement: str, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        return [(sql, n) for sql, n in self.statements.items() if n >= threshold]
+
+    def server_timing(self, total_ms: float) -> str:
+        return (
+            f'db;dur={self.total_ms:.1f};desc="{self.count} queries", '
+            f"total;dur={total_ms:.1f}"
+        )
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _one_line(statement: str) -> str:
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def redact(parameters, executemany: bool = False):
+    # 값 대신 타입 이름만 남김 (비밀번호 해시, 세션 데이터 등이 로그에 남지 않도록)
+    if executemany:
+        return f"<{len(parameters)}행>"
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_started"].pop()) * 1000
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed_ms)
+    slow_query_ms = get_settings().slow_query_ms
+    if slow_query_ms and elapsed_ms >= slow_query_ms:
+        logger.warning(
+            "느린 쿼리 %.1fms: %s 파라미터=%s",
+            elapsed_ms,
+            _one_line(statement),
+            redact(parameters, executemany),
+        )
+
+
+def _handle_error(exception_context):
+    # 실패한 문은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def track_queries(engine):
+    # engine: 동기 Engine (AsyncEngine이면 .sync_engine)
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    # 요청마다 QueryStats를 만들어 ContextVar에 넣고, 응답이 끝나면 N+1 의심 SQL을 기록한다.
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        settings = get_settings()
+        stats = QueryStats()
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                header = (b"server-timing", stats.server_timing(total_ms).encode())
+                message = {**message, "headers": [*message.get("headers", []), header]}
+            await send(message)
+
+        token = _current.set(stats)
+        try:
+            await self.app(
+                scope, receive, send_with_timing if settings.server_timing else send
+            )
+        finally:
+            _current.reset(token)
+            threshold = settings.n_plus_one_threshold
+            if threshold:
+                for statement, times in stats.repeated(threshold):
+                    logger.warning(
+                        "N+1 의심: %s %s 에서 같은 SQL이 %d번 실행됨: %s",
+                        scope["method"],
+                        scope["path"],
+                        times,
+                        _one_line(statement),
+                    )
@@ -0,0 +1,188 @@
+# 게시글 검색용 메모리 역색인 (SEARCH_BACKEND=memory, 또는 auto이면서 MySQL이 아닐 때)
+# MySQL에서는 FULLTEXT 인덱스(ngram 파서)를 쓰고, SQLite/로컬 실행에서는 이 색인을 쓴다.
+# 첫 검색 때 posts 테이블 전체를 읽어 만들고, 이후에는 PostService의 작성/수정/삭제가
+# 색인을 바로 갱신한다. 워커(프로세스) 단위라 다른 워커의 변경은 반영되지 않는다.
+#
+# 점수는 BM25이며, 제목에 나온 단어는 본문보다 TITLE_WEIGHT배 가중한다.
+# 한글은 조사가 붙어도 찾을 수 있도록 단어를 글자 2개씩(bigram) 나눠서 색인한다.
+import math
+import re
+import threading
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+from app.config import get_settings
+
+TITLE_WEIGHT = 2
+
+_WORD = re.compile(r"\w+")
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) > 1 and _HANGUL.search(word):
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+class SearchIndex:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings = {}  # term -> {post_id: tf}
+        self._doc_terms = {}  # post_id -> Counter(term -> tf), 삭제/수정 시 사용
+        self._doc_len = {}  # post_id -> 가중치를 반영한 단어 수
+        self._total_len = 0
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self.ready = False
+        self._building = False
+        # 전체 로딩 중에 작성/수정/삭제된 게시글. 로딩한 (더 오래된) 행으로 덮어쓰지 않는다.
+        self._touched = set()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def _remove(self, post_id: int):
+        # self._lock을 잡은 상태에서 호출
+        terms = self._doc_terms.pop(post_id, None)
+        if terms is None:
+            return
+        self._total_len -= self._doc_len.pop(post_id)
+        for term in terms:
+            postings = self._postings[term]
+            del postings[post_id]
+            if not postings:
+                del self._postings[term]
+
+    def _add(self, post_id: int, title: str, content: str):
+        # self._lock을 잡은 상태에서 호출
+        self._remove(post_id)
+        terms = Counter(tokenize(content))
+        for term in tokenize(title):
+            terms[term] += TITLE_WEIGHT
+        self._doc_terms[post_id] = terms
+        self._doc_len[post_id] = sum(terms.values())
+        self._total_len += self._doc_len[post_id]
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[post_id] = tf
+
+    def add(self, post_id: int, title: str, content: str):
+        with self._lock:
+            if self._building:
+                self._touched.add(post_id)
+            self._add(post_id, title, content)
+
+    def remove(self, post_id: int):
+        with self._lock:
+            if self._building:
+                self._touched.add(post_id)
+            self._remove(post_id)
+
+    @property
+    def accepts_updates(self) -> bool:
+        # 아직 만들지 않은 색인은 갱신할 필요가 없음 (처음 만들 때 DB에서 읽음)
+        return self.ready or self._building
+
+    def start_build(self) -> bool:
+        # 이미 다른 요청이 만들고 있으면 False
+        with self._lock:
+            if self.ready or self._building:
+                return False
+            self._building = True
+            self._touched = set()
+            return True
+
+    def load(self, rows: Iterable[Tuple[int, str, str]]):
+        for post_id, title, content in rows:
+            with self._lock:
+                if post_id not in self._touched:
+                    self._add(post_id, title, content)
+
+    def finish_build(self, succeeded: bool = True):
+        with self._lock:
+            self._building = False
+            self._touched = set()
+            self.ready = succeeded
+
+    def build(self, load_rows):
+        # load_rows(): (id, title, content) 행을 순회하는 함수. 동시에 첫 검색이 들어오면 한 번만 만든다.
+        with self._build_lock:
+            if not self.start_build():
+                return
+            try:
+                self.load(load_rows())
+            except Exception:
+                self.finish_build(succeeded=False)
+                raise
+            self.finish_build()
+
+    def search(self, query: str) -> List[Tuple[float, int]]:
+        # (점수, 게시글 ID) 목록을 점수 내림차순(같으면 ID 내림차순)으로 반환. 단어 중 하나라도 맞으면 포함
+        terms = set(tokenize(query))
+        scores = {}
+        with self._lock:
+            n_docs = len(self._doc_terms)
+            if not n_docs:
+                return []
+            avg_len = self._total_len / n_docs
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(
+                    1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5)
+                )
+                for post_id, tf in postings.items():
+                    norm = self.k1 * (
+                        1 - self.b + self.b * self._doc_len[post_id] / avg_len
+                    )
+                    score = idf * tf * (self.k1 + 1) / (tf + norm)
+                    scores[post_id] = scores.get(post_id, 0.0) + score
+        return sorted(
+            ((score, post_id) for post_id, score in scores.items()), reverse=True
+        )
+
+
+_search_index = None
+_search_index_lock = threading.Lock()
+
+
+def use_fulltext(dialect_name: str) -> bool:
+    backend = get_settings().search_backend
+    if backend == "auto":
+        return dialect_name == "mysql"
+    return backend == "fulltext"
+
+
+def get_search_index() -> SearchIndex:
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = SearchIndex()
+    return _search_index
+
+
+# 서비스 계층에서 쓰는 갱신 함수 (메모리 색인을 아직 만들지 않았으면 아무 일도 하지 않음)
+def index_post(post_id: int, title: str, content: str):
+    index = _search_index
+    if index is not None and index.accepts_updates:
+        index.add(post_id, title, content)
+
+
+def unindex_post(post_id: int):
+    index = _search_index
+    if index is not None and index.accepts_updates:
+        index.remove(post_id)
+
+
+def reset_search_index():
+    # 테스트 등에서 DB를 새로 만들었을 때 사용 (다음 검색에서 다시 만듦)
+    global _search_index
+    with _search_index_lock:
+        _search_index = None
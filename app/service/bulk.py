@@ -0,0 +1,76 @@
+# 대량 생성(POST /posts/bulk, /comments/bulk) 공통 함수
+# 항목별로 검증해서 잘못된 항목만 오류로 돌려주고, 나머지는 한 트랜잭션에서 executemany로 INSERT 한다.
+from typing import Any, List, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.domain.schemas.bulk import BulkItemError
+
+
+class BatchTooLargeException(HTTPException):
+    def __init__(self, max_size: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"한 번에 최대 {max_size}개까지 생성할 수 있습니다.",
+        )
+
+
+def validate_batch(
+    schema: Type[BaseModel], items: List[Any]
+) -> Tuple[List[Tuple[int, BaseModel]], List[BulkItemError]]:
+    # 반환값: ([(요청 위치, 검증된 항목)], [항목별 오류])
+    max_size = get_settings().bulk_max_batch_size
+    if len(items) > max_size:
+        raise BatchTooLargeException(max_size)
+    valid, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            errors.append(
+                BulkItemError(
+                    index=index,
+                    detail=e.errors(include_url=False, include_context=False),
+                )
+            )
+    return valid, errors
+
+
+def _returning_ids(db) -> bool:
+    # SQLite, MariaDB 등은 여러 행 INSERT ... RETURNING 으로 id를 한 번에 받을 수 있다.
+    # RETURNING 행 순서는 보장되지 않지만 자동 증가 id는 VALUES 순서대로 커지므로 정렬해서 맞춘다.
+    # (sort_by_parameter_order=True는 SQLite에서 행마다 INSERT 하게 되므로 사용하지 않음)
+    return db.get_bind().dialect.insert_executemany_returning
+
+
+def _multi_row_insert(model, rows: List[dict]):
+    # MySQL은 RETURNING이 없으므로 여러 행 INSERT 한 문장으로 넣고 LAST_INSERT_ID()(첫 행 id)부터
+    # 행 수만큼의 id를 사용한다. InnoDB는 행 수가 정해진 INSERT(simple insert)에 연속된
+    # 자동 증가 값을 할당한다. (innodb_autoinc_lock_mode 기본값 1, 2 모두)
+    # SQLite는 lastrowid가 마지막 행 id이지만 RETURNING을 지원하므로 이 경로를 쓰지 않는다.
+    return insert(model.__table__).values(rows)
+
+
+def _consecutive_ids(first_id: int, count: int) -> List[int]:
+    return list(range(first_id, first_id + count))
+
+
+def insert_many(db: Session, model, rows: List[dict]) -> List[int]:
+    # 커밋은 호출한 쪽에서. rows와 같은 순서의 id 목록을 반환
+    if _returning_ids(db):
+        return sorted(db.execute(insert(model).returning(model.id), rows).scalars())
+    result = db.execute(_multi_row_insert(model, rows))
+    return _consecutive_ids(result.lastrowid, len(rows))
+
+
+async def ainsert_many(db: AsyncSession, model, rows: List[dict]) -> List[int]:
+    if _returning_ids(db):
+        result = await db.execute(insert(model).returning(model.id), rows)
+        return sorted(result.scalars())
+    result = await db.execute(_multi_row_insert(model, rows))
+    return _consecutive_ids(result.lastrowid, len(rows))
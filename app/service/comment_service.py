@@ -1,11 +1,96 @@
-from typing import List
+from collections import Counter
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, status
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.schemas.bulk import BulkCreateResult, BulkItemError
 from app.domain.schemas.comment import (CommentCreate, CommentRead,
                                         CommentUpdate)
+from app.logger_setup import logger
+from app.post_cache import invalidate_post
+from app.service.bulk import ainsert_many, insert_many, validate_batch
+from app.service.etag import make_etag
+from app.service.pagination import keyset_after, keyset_order, split_page
+
+
+# posts.comment_count 증감. 읽고 더해서 쓰지 않고 DB에서 한 번에 계산하므로 동시 작성에도 안전하다.
+# (Core UPDATE라서 posts.version도 함께 증가해 게시글 ETag가 바뀐다)
+def _adjust_comment_count(post_id: int, delta: int):
+    return (
+        update(Post)
+        .where(Post.id == post_id)
+        .values(comment_count=Post.comment_count + delta)
+    )
+
+
+# 게시글별 댓글 수를 더하는 executemany 문 (대량 생성)
+_add_comment_count = (
+    update(Post.__table__)
+    .where(Post.__table__.c.id == bindparam("_post_id"))
+    .values(comment_count=Post.__table__.c.comment_count + bindparam("_count"))
+)
+
+# 작성자의 댓글 수를 게시글별로 빼는 executemany 문 (회원 탈퇴 시 댓글이 함께 삭제됨)
+_subtract_comment_count = (
+    update(Post.__table__)
+    .where(Post.__table__.c.id == bindparam("_post_id"))
+    .values(comment_count=Post.__table__.c.comment_count - bindparam("_count"))
+)
+
+# 실제 댓글 수로 덮어쓰는 executemany 문 (reconcile)
+_set_comment_count = (
+    update(Post.__table__)
+    .where(Post.__table__.c.id == bindparam("_post_id"))
+    .values(comment_count=bindparam("_count"))
+)
+
+
+def _comment_counts_by_author(author_id: str):
+    return (
+        select(Comment.post_id, func.count(Comment.id))
+        .where(Comment.author_id == author_id)
+        .group_by(Comment.post_id)
+    )
+
+
+def _split_missing_posts(valid, existing_ids):
+    # 없는 게시글에 단 댓글은 항목별 오류로 분리
+    found, errors = [], []
+    for index, comment in valid:
+        if comment.post_id in existing_ids:
+            found.append((index, comment))
+        else:
+            errors.append(BulkItemError(index=index, detail="게시글이 없습니다."))
+    return found, errors
+
+
+def _bulk_rows(valid, author_id: str):
+    rows = [
+        {"author_id": author_id, "post_id": c.post_id, "content": c.content}
+        for _, c in valid
+    ]
+    counts = Counter(c.post_id for _, c in valid)
+    return rows, [{"_post_id": k, "_count": v} for k, v in counts.items()]
+
+
+def _comment_count_drift():
+    # 댓글 테이블을 post_id로 한 번만 GROUP BY 해서 저장된 값과 다른 게시글만 반환
+    counts = (
+        select(Comment.post_id, func.count(Comment.id).label("actual"))
+        .group_by(Comment.post_id)
+        .subquery()
+    )
+    actual = func.coalesce(counts.c.actual, 0)
+    return (
+        select(Post.id, actual)
+        .outerjoin(counts, counts.c.post_id == Post.id)
+        .where(Post.comment_count != actual)
+    )
 
 
 class CommentService:
@@ -19,7 +104,9 @@ class CommentService:
             content=comment_create.content,
         )
         self.db.add(comment)
+        self.db.execute(_adjust_comment_count(comment_create.post_id, 1))
         self.db.commit()
+        invalidate_post(comment_create.post_id)
         self.db.refresh(comment)
         return comment
 
@@ -36,8 +123,55 @@ class CommentService:
     def delete(self, comment_id: int):
         comment = self.db.query(Comment).filter(Comment.id == comment_id).first()
         if comment:
+            post_id = comment.post_id
             self.db.delete(comment)
+            self.db.execute(_adjust_comment_count(post_id, -1))
             self.db.commit()  # 반드시 커밋 호출
+            invalidate_post(post_id)
+
+    # 검증을 통과한 항목만 한 트랜잭션에서 executemany로 INSERT 하고, 게시글별 댓글 수를 한 번씩 갱신
+    def bulk_create(self, items: List[dict], author_id: str) -> BulkCreateResult:
+        valid, errors = validate_batch(CommentCreate, items)
+        ids = [None] * len(items)
+        if valid:
+            post_ids = {c.post_id for _, c in valid}
+            existing = self.db.execute(select(Post.id).where(Post.id.in_(post_ids)))
+            valid, missing = _split_missing_posts(valid, set(existing.scalars()))
+            errors = sorted(errors + missing, key=lambda error: error.index)
+        if valid:
+            rows, counts = _bulk_rows(valid, author_id)
+            new_ids = insert_many(self.db, Comment, rows)
+            self.db.execute(_add_comment_count, counts)
+            self.db.commit()
+            for (index, _), comment_id in zip(valid, new_ids):
+                ids[index] = comment_id
+            for count in counts:
+                invalidate_post(count["_post_id"])
+        return BulkCreateResult(ids=ids, errors=errors)
+
+    def discount_by_author(self, author_id: str) -> List[int]:
+        # 작성자의 댓글이 삭제되기 직전에 호출 (커밋은 호출한 쪽에서). 영향받은 게시글 ID를 반환
+        rows = self.db.execute(_comment_counts_by_author(author_id)).all()
+        if rows:
+            self.db.execute(
+                _subtract_comment_count,
+                [{"_post_id": post_id, "_count": count} for post_id, count in rows],
+            )
+        return [post_id for post_id, _ in rows]
+
+    def reconcile_comment_counts(self) -> int:
+        # 저장된 댓글 수가 실제와 다른 게시글을 한 번에 바로잡고, 수정한 게시글 수를 반환
+        drift = self.db.execute(_comment_count_drift()).all()
+        if drift:
+            self.db.execute(
+                _set_comment_count,
+                [{"_post_id": post_id, "_count": count} for post_id, count in drift],
+            )
+            self.db.commit()
+            for post_id, _ in drift:
+                invalidate_post(post_id)
+            logger.info("댓글 수가 어긋난 게시글 %d개를 바로잡았습니다.", len(drift))
+        return len(drift)
 
     def _get_comment_by_id(self, comment_id: int) -> Comment:
         comment = self.db.query(Comment).filter(Comment.id == comment_id).first()
@@ -57,3 +191,132 @@ class CommentService:
             .limit(limit)
             .all()
         )
+
+    # 게시글의 댓글 목록 ETag. 댓글 수, 최대 ID, version 합계만 집계해서 추가/삭제/수정을 감지
+    # params: 페이지 위치(skip, limit, cursor 등)도 응답 내용에 영향을 주므로 함께 반영
+    def get_etag_by_post(self, post_id: int, *params) -> str:
+        row = (
+            self.db.query(
+                func.count(Comment.id), func.max(Comment.id), func.sum(Comment.version)
+            )
+            .filter(Comment.post_id == post_id)
+            .one()
+        )
+        return make_etag("comments", post_id, *row, *params)
+
+    def get_page_by_post(
+        self, post_id: int, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Comment], Optional[str]]:
+        query = self.db.query(Comment).filter(Comment.post_id == post_id)
+        if cursor:
+            query = query.filter(keyset_after(Comment, cursor))
+        rows = query.order_by(*keyset_order(Comment)).limit(limit + 1).all()
+        return split_page(rows, limit)
+
+
+class AsyncCommentService:
+    # asyncio 모드용 CommentService
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, comment_create: CommentCreate, author_id: str) -> Comment:
+        comment = Comment(
+            author_id=author_id,
+            post_id=comment_create.post_id,
+            content=comment_create.content,
+        )
+        self.db.add(comment)
+        await self.db.execute(_adjust_comment_count(comment_create.post_id, 1))
+        await self.db.commit()
+        invalidate_post(comment_create.post_id)
+        await self.db.refresh(comment)
+        return comment
+
+    async def get(self, comment_id: int) -> Optional[Comment]:
+        return await self.db.get(Comment, comment_id)
+
+    async def update(self, comment_id: int, comment_update: CommentUpdate) -> Comment:
+        comment = await self.db.get(Comment, comment_id)
+        comment.content = comment_update.content
+        await self.db.commit()
+        await self.db.refresh(comment)
+        return comment
+
+    async def delete(self, comment_id: int):
+        comment = await self.db.get(Comment, comment_id)
+        if comment:
+            post_id = comment.post_id
+            await self.db.delete(comment)
+            await self.db.execute(_adjust_comment_count(post_id, -1))
+            await self.db.commit()
+            invalidate_post(post_id)
+
+    async def bulk_create(self, items: List[dict], author_id: str) -> BulkCreateResult:
+        valid, errors = validate_batch(CommentCreate, items)
+        ids = [None] * len(items)
+        if valid:
+            post_ids = {c.post_id for _, c in valid}
+            existing = await self.db.execute(
+                select(Post.id).where(Post.id.in_(post_ids))
+            )
+            valid, missing = _split_missing_posts(valid, set(existing.scalars()))
+            errors = sorted(errors + missing, key=lambda error: error.index)
+        if valid:
+            rows, counts = _bulk_rows(valid, author_id)
+            new_ids = await ainsert_many(self.db, Comment, rows)
+            await self.db.execute(_add_comment_count, counts)
+            await self.db.commit()
+            for (index, _), comment_id in zip(valid, new_ids):
+                ids[index] = comment_id
+            for count in counts:
+                invalidate_post(count["_post_id"])
+        return BulkCreateResult(ids=ids, errors=errors)
+
+    async def discount_by_author(self, author_id: str) -> List[int]:
+        rows = (await self.db.execute(_comment_counts_by_author(author_id))).all()
+        if rows:
+            await self.db.execute(
+                _subtract_comment_count,
+                [{"_post_id": post_id, "_count": count} for post_id, count in rows],
+            )
+        return [post_id for post_id, _ in rows]
+
+    async def reconcile_comment_counts(self) -> int:
+        drift = (await self.db.execute(_comment_count_drift())).all()
+        if drift:
+            await self.db.execute(
+                _set_comment_count,
+                [{"_post_id": post_id, "_count": count} for post_id, count in drift],
+            )
+            await self.db.commit()
+            for post_id, _ in drift:
+                invalidate_post(post_id)
+            logger.info("댓글 수가 어긋난 게시글 %d개를 바로잡았습니다.", len(drift))
+        return len(drift)
+
+    async def get_by_post(
+        self, post_id: int, skip: int = 0, limit: int = 10
+    ) -> List[Comment]:
+        result = await self.db.execute(
+            select(Comment).filter(Comment.post_id == post_id).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_etag_by_post(self, post_id: int, *params) -> str:
+        result = await self.db.execute(
+            select(
+                func.count(Comment.id), func.max(Comment.id), func.sum(Comment.version)
+            ).filter(Comment.post_id == post_id)
+        )
+        return make_etag("comments", post_id, *result.one(), *params)
+
+    async def get_page_by_post(
+        self, post_id: int, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Comment], Optional[str]]:
+        stmt = select(Comment).filter(Comment.post_id == post_id)
+        if cursor:
+            stmt = stmt.filter(keyset_after(Comment, cursor))
+        result = await self.db.execute(
+            stmt.order_by(*keyset_order(Comment)).limit(limit + 1)
+        )
+        return split_page(list(result.scalars().all()), limit)
@@ -0,0 +1,20 @@
+# ETag 생성과 If-None-Match 비교
+# ETag는 행의 version 컬럼(수정될 때마다 1씩 증가)으로 만들기 때문에, 조건부 요청은
+# 본문 전체를 읽지 않고 version만 조회해서 304 여부를 판단할 수 있다.
+import hashlib
+from typing import Optional
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match는 약한 비교(W/ 접두사 무시)
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
@@ -0,0 +1,96 @@
+# NDJSON 내보내기 (GET /export/posts, /export/comments)
+# 서버 측 커서(yield_per → stream_results)로 배치 단위로 읽어서 바로 응답에 쓰므로
+# 테이블 크기와 관계없이 메모리 사용량이 일정하다. id 순서로 내보내며, 중간에 끊기면
+# 마지막으로 받은 id를 after_id로 넘겨 이어받을 수 있다.
+import enum
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, Iterator
+
+from sqlalchemy import Table, select
+
+from app.config import get_settings
+from app.database import get_async_session_local, get_session_local
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+
+
+class ExportTable(str, enum.Enum):
+    POSTS = "posts"
+    COMMENTS = "comments"
+
+
+EXPORT_TABLES = {
+    ExportTable.POSTS.value: Post.__table__,
+    ExportTable.COMMENTS.value: Comment.__table__,
+}
+
+
+def _export_query(table: Table, after_id: int):
+    # ORM 객체를 만들지 않고 컬럼 값만 읽음 (관계 로딩 없음)
+    return (
+        select(table)
+        .where(table.c.id > after_id)
+        .order_by(table.c.id)
+        .execution_options(yield_per=get_settings().export_batch_size)
+    )
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} 값은 JSON으로 변환할 수 없습니다.")
+
+
+def _encode(rows) -> bytes:
+    # 한 배치를 한 덩어리로 인코딩 (행마다 yield 하면 청크가 너무 잘게 나뉨)
+    return "".join(
+        json.dumps(dict(row._mapping), default=_default, ensure_ascii=False) + "\n"
+        for row in rows
+    ).encode()
+
+
+class _Encoder:
+    # gzip=True면 배치마다 압축 스트림에 이어서 쓴다 (응답 전체가 하나의 gzip 스트림)
+    def __init__(self, compress: bool):
+        self._gzip = zlib.compressobj(wbits=16 + zlib.MAX_WBITS) if compress else None
+
+    def chunk(self, rows) -> bytes:
+        data = _encode(rows)
+        return self._gzip.compress(data) if self._gzip else data
+
+    def flush(self) -> bytes:
+        return self._gzip.flush() if self._gzip else b""
+
+
+def iter_export(
+    table: Table, after_id: int = 0, compress: bool = False, session_factory=None
+) -> Iterator[bytes]:
+    # 요청의 get_db 세션은 응답을 보내기 전에 닫히므로 스트리밍 동안 쓸 세션을 따로 연다
+    session_factory = session_factory or get_session_local()
+    encoder = _Encoder(compress)
+    with session_factory() as db:
+        for rows in db.execute(_export_query(table, after_id)).partitions():
+            chunk = encoder.chunk(rows)
+            if chunk:
+                yield chunk
+    tail = encoder.flush()
+    if tail:
+        yield tail
+
+
+async def aiter_export(
+    table: Table, after_id: int = 0, compress: bool = False, session_factory=None
+) -> AsyncIterator[bytes]:
+    session_factory = session_factory or get_async_session_local()
+    encoder = _Encoder(compress)
+    async with session_factory() as db:
+        result = await db.stream(_export_query(table, after_id))
+        async for rows in result.partitions():
+            chunk = encoder.chunk(rows)
+            if chunk:
+                yield chunk
+    tail = encoder.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,99 @@
+# (created_at, id) 기반 keyset 페이지네이션 헬퍼
+# OFFSET은 앞 페이지의 행을 모두 읽고 버리므로 깊은 페이지일수록 느려진다.
+# 커서는 마지막 행의 (created_at, id)를 담은 불투명 문자열이며,
+# 다음 페이지는 인덱스 범위 검색으로 바로 시작 지점을 찾는다.
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+
+class InvalidCursorException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다."
+        )
+
+
+# keyset(cursor) 페이지 크기 상한. offset(skip/limit) 방식은 기존 클라이언트 호환을 위해 제한하지 않는다.
+MAX_PAGE_SIZE = 100
+
+
+class InvalidPageSizeException(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"limit은 1 이상 {MAX_PAGE_SIZE} 이하여야 합니다.",
+        )
+
+
+def check_page_size(limit: int):
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise InvalidPageSizeException()
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError):
+        raise InvalidCursorException()
+
+
+def keyset_after(model, cursor: str):
+    created_at, id = decode_cursor(cursor)
+    return or_(
+        model.created_at > created_at,
+        and_(model.created_at == created_at, model.id > id),
+    )
+
+
+def keyset_order(model):
+    return (model.created_at.asc(), model.id.asc())
+
+
+def split_page(rows: List, limit: int) -> Tuple[List, Optional[str]]:
+    # limit + 1 개를 조회해서 다음 페이지가 있는지 판단
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    if not rows:
+        return rows, None
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
+
+
+# 검색 결과처럼 점수 순으로 정렬된 목록의 커서. 마지막 행의 (점수, id)를 담는다.
+def encode_rank_cursor(score: float, id: int) -> str:
+    raw = json.dumps([score, id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(score), int(id)
+    except (ValueError, TypeError):
+        raise InvalidCursorException()
+
+
+def split_ranked_page(
+    rows: List[Tuple[float, object]], limit: int
+) -> Tuple[List, Optional[str]]:
+    # rows: (점수, 행) 목록. split_page와 같이 limit + 1 개로 다음 페이지 여부를 판단
+    rows, next_cursor = rows[: limit + 1], None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        score, last = rows[-1]
+        next_cursor = encode_rank_cursor(score, last.id)
+    return [row for _, row in rows], next_cursor
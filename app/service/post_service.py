@@ -1,13 +1,74 @@
-from typing import List, Optional
+import asyncio
+from typing import List, Optional, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.domain.models.post import Post
+from app.domain.models.user import User
+from app.domain.schemas.bulk import BulkCreateResult
 from app.domain.schemas.post import PostCreate, PostRead, PostUpdate
+from app.post_cache import get_post_cache, invalidate_post
+from app.search_index import (get_search_index, index_post, unindex_post,
+                              use_fulltext)
+from app.service.bulk import ainsert_many, insert_many, validate_batch
+from app.service.etag import make_etag
+from app.service.pagination import (decode_rank_cursor, keyset_after,
+                                    keyset_order, split_page,
+                                    split_ranked_page)
+
+
+def _read_payload(post: Post) -> Tuple[dict, str]:
+    # ETag를 본문과 같은 행의 version으로 만들어서 본문과 ETag가 항상 짝이 맞도록 함
+    etag = make_etag("post", post.id, post.version, post.author.version)
+    return PostRead.model_validate(post).model_dump(mode="json"), etag
+
+
+def _fulltext_search(query: str, cursor: Optional[str], limit: int):
+    # MySQL FULLTEXT 자연어 검색. 관련도 점수 내림차순, 같은 점수는 ID 내림차순
+    score = match(Post.title, Post.content, against=query).in_natural_language_mode()
+    stmt = select(score, Post).options(selectinload(Post.author)).where(score > 0)
+    if cursor:
+        last_score, last_id = decode_rank_cursor(cursor)
+        stmt = stmt.where(
+            or_(score < last_score, and_(score == last_score, Post.id < last_id))
+        )
+    return stmt.order_by(score.desc(), Post.id.desc()).limit(limit + 1)
+
+
+def _ranked_after(ranked: List[Tuple[float, int]], cursor: Optional[str], limit: int):
+    # 메모리 색인 결과에서 커서 다음의 limit + 1 개
+    if cursor:
+        last = decode_rank_cursor(cursor)
+        ranked = [row for row in ranked if row < last]
+    return ranked[: limit + 1]
+
+
+def _load_index_rows(db: Session):
+    # 메모리 색인을 처음 만들 때 posts 전체를 배치 단위로 읽음
+    return db.execute(
+        select(Post.id, Post.title, Post.content).execution_options(yield_per=1000)
+    )
+
+
+def _in_rank_order(ranked: List[Tuple[float, int]], posts: List[Post]):
+    # 색인에는 있지만 DB에서 사라진 게시글(회원 탈퇴로 함께 삭제 등)은 색인에서도 제거
+    by_id = {post.id: post for post in posts}
+    rows = []
+    for score, post_id in ranked:
+        if post_id in by_id:
+            rows.append((score, by_id[post_id]))
+        else:
+            unindex_post(post_id)
+    return rows
 
 
 class PostService:
+    # 목록 조회는 PostRead에 필요한 author를 selectinload로 한 번에 로딩한다.
+    # (게시글마다 users를 따로 SELECT 하는 N+1 방지)
     def __init__(self, db: Session):
         self.db = db
 
@@ -20,10 +81,45 @@ class PostService:
         self.db.add(post)
         self.db.commit()
         self.db.refresh(post)
+        index_post(post.id, post.title, post.content)
         return post
 
+    # 검증을 통과한 항목만 한 트랜잭션에서 executemany로 INSERT (항목마다 commit/refresh 하지 않음)
+    def bulk_create(self, items: List[dict], author_id: str) -> BulkCreateResult:
+        valid, errors = validate_batch(PostCreate, items)
+        ids = [None] * len(items)
+        if valid:
+            new_ids = insert_many(
+                self.db,
+                Post,
+                [
+                    {"author_id": author_id, "title": p.title, "content": p.content}
+                    for _, p in valid
+                ],
+            )
+            self.db.commit()
+            for (index, post), post_id in zip(valid, new_ids):
+                ids[index] = post_id
+                index_post(post_id, post.title, post.content)
+        return BulkCreateResult(ids=ids, errors=errors)
+
     def get_multi(self, skip: int = 0, limit: int = 10) -> List[Post]:
-        return self.db.query(Post).offset(skip).limit(limit).all()
+        return (
+            self.db.query(Post)
+            .options(selectinload(Post.author))
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_page(
+        self, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Post], Optional[str]]:
+        query = self.db.query(Post).options(selectinload(Post.author))
+        if cursor:
+            query = query.filter(keyset_after(Post, cursor))
+        rows = query.order_by(*keyset_order(Post)).limit(limit + 1).all()
+        return split_page(rows, limit)
 
     def get(self, post_id: int) -> Optional[Post]:
         return (
@@ -33,18 +129,73 @@ class PostService:
             .first()
         )
 
+    # 본문을 읽지 않고 게시글과 작성자의 version만으로 ETag 계산 (없으면 None)
+    def get_etag(self, post_id: int) -> Optional[str]:
+        row = (
+            self.db.query(Post.version, User.version)
+            .join(Post.author)
+            .filter(Post.id == post_id)
+            .first()
+        )
+        return make_etag("post", post_id, *row) if row else None
+
+    # 단건 조회 응답(PostRead)을 직렬화한 dict와 그 본문의 ETag. POST_CACHE_ENABLED 이면 캐시를 거친다.
+    # etag(DB의 현재 ETag)와 다른 캐시 항목은 다시 읽으므로 수정된 게시글의 이전 본문을 내보내지 않는다.
+    def get_read(
+        self, post_id: int, etag: Optional[str] = None
+    ) -> Optional[Tuple[dict, str]]:
+        cache = get_post_cache()
+        if cache is None:
+            return self._load_read(post_id)
+        return cache.get_or_load(post_id, self._load_read, etag)
+
+    def _load_read(self, post_id: int) -> Optional[Tuple[dict, str]]:
+        post = self.get(post_id)
+        if post is None:
+            return None
+        return _read_payload(post)
+
     def update(self, post_id: int, post_update: PostCreate) -> Post:
         post = self.db.query(Post).filter(Post.id == post_id).first()
         for key, value in post_update.dict(exclude_unset=True).items():
             setattr(post, key, value)
         self.db.commit()
+        invalidate_post(post_id)
         self.db.refresh(post)
+        index_post(post.id, post.title, post.content)
         return post
 
     def delete(self, post_id: int):
         post = self.db.query(Post).filter(Post.id == post_id).first()
         self.db.delete(post)
         self.db.commit()
+        invalidate_post(post_id)
+        unindex_post(post_id)
+
+    # 제목/본문 검색. MySQL은 FULLTEXT 인덱스, 그 외에는 워커별 메모리 역색인을 사용
+    def search(
+        self, query: str, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Post], Optional[str]]:
+        if use_fulltext(self.db.get_bind().dialect.name):
+            rows = self.db.execute(_fulltext_search(query, cursor, limit)).all()
+            return split_ranked_page(rows, limit)
+
+        index = get_search_index()
+        if not index.ready:
+            index.build(lambda: _load_index_rows(self.db))
+        while True:
+            ranked = _ranked_after(index.search(query), cursor, limit)
+            posts = (
+                self.db.query(Post)
+                .options(selectinload(Post.author))
+                .filter(Post.id.in_([post_id for _, post_id in ranked]))
+                .all()
+            )
+            rows = _in_rank_order(ranked, posts)
+            # 색인에만 남은(DB에서 삭제된) 게시글이 있었으면 색인에서 뺐으므로 다시 검색.
+            # 제거 후 점수가 바뀌므로 페이지와 커서를 새 점수로 정해야 다음 페이지가 맞음
+            if len(rows) == len(ranked):
+                return split_ranked_page(rows, limit)
 
     def _get_post_by_id(self, post_id: int) -> Post:
         post = self.db.query(Post).filter(Post.id == post_id).first()
@@ -59,8 +210,181 @@ class PostService:
     ) -> List[Post]:
         return (
             self.db.query(Post)
+            .options(selectinload(Post.author))
             .filter(Post.author_id == author_id)
             .offset(skip)
             .limit(limit)
             .all()
         )
+
+    def get_page_by_author(
+        self, author_id: str, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Post], Optional[str]]:
+        query = (
+            self.db.query(Post)
+            .options(selectinload(Post.author))
+            .filter(Post.author_id == author_id)
+        )
+        if cursor:
+            query = query.filter(keyset_after(Post, cursor))
+        rows = query.order_by(*keyset_order(Post)).limit(limit + 1).all()
+        return split_page(rows, limit)
+
+
+class AsyncPostService:
+    # asyncio 모드용 PostService. 비동기 세션에서는 lazy load를 할 수 없으므로
+    # PostRead에 필요한 author를 항상 함께 로딩한다.
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, post_create: PostCreate, author_id: str) -> Post:
+        post = Post(
+            author_id=author_id,
+            title=post_create.title,
+            content=post_create.content,
+        )
+        self.db.add(post)
+        await self.db.commit()
+        post = await self.get(post.id)
+        index_post(post.id, post.title, post.content)
+        return post
+
+    async def bulk_create(self, items: List[dict], author_id: str) -> BulkCreateResult:
+        valid, errors = validate_batch(PostCreate, items)
+        ids = [None] * len(items)
+        if valid:
+            new_ids = await ainsert_many(
+                self.db,
+                Post,
+                [
+                    {"author_id": author_id, "title": p.title, "content": p.content}
+                    for _, p in valid
+                ],
+            )
+            await self.db.commit()
+            for (index, post), post_id in zip(valid, new_ids):
+                ids[index] = post_id
+                index_post(post_id, post.title, post.content)
+        return BulkCreateResult(ids=ids, errors=errors)
+
+    async def get_multi(self, skip: int = 0, limit: int = 10) -> List[Post]:
+        result = await self.db.execute(
+            select(Post).options(selectinload(Post.author)).offset(skip).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_page(
+        self, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Post], Optional[str]]:
+        stmt = select(Post).options(selectinload(Post.author))
+        if cursor:
+            stmt = stmt.filter(keyset_after(Post, cursor))
+        result = await self.db.execute(
+            stmt.order_by(*keyset_order(Post)).limit(limit + 1)
+        )
+        return split_page(list(result.scalars().all()), limit)
+
+    async def get(self, post_id: int) -> Optional[Post]:
+        result = await self.db.execute(
+            select(Post).options(joinedload(Post.author)).filter(Post.id == post_id)
+        )
+        return result.scalars().first()
+
+    async def get_etag(self, post_id: int) -> Optional[str]:
+        result = await self.db.execute(
+            select(Post.version, User.version)
+            .join(Post.author)
+            .filter(Post.id == post_id)
+        )
+        row = result.first()
+        return make_etag("post", post_id, *row) if row else None
+
+    async def get_read(
+        self, post_id: int, etag: Optional[str] = None
+    ) -> Optional[Tuple[dict, str]]:
+        cache = get_post_cache()
+        if cache is None:
+            return await self._load_read(post_id)
+        return await cache.aget_or_load(post_id, self._load_read, etag)
+
+    async def _load_read(self, post_id: int) -> Optional[Tuple[dict, str]]:
+        post = await self.get(post_id)
+        if post is None:
+            return None
+        return _read_payload(post)
+
+    async def update(self, post_id: int, post_update: PostUpdate) -> Post:
+        post = await self.get(post_id)
+        for key, value in post_update.dict(exclude_unset=True).items():
+            setattr(post, key, value)
+        await self.db.commit()
+        invalidate_post(post_id)
+        index_post(post.id, post.title, post.content)
+        return post
+
+    async def delete(self, post_id: int):
+        post = await self.db.get(Post, post_id)
+        await self.db.delete(post)
+        await self.db.commit()
+        invalidate_post(post_id)
+        unindex_post(post_id)
+
+    async def get_by_author(
+        self, author_id: str, skip: int = 0, limit: int = 10
+    ) -> List[Post]:
+        result = await self.db.execute(
+            select(Post)
+            .options(selectinload(Post.author))
+            .filter(Post.author_id == author_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_page_by_author(
+        self, author_id: str, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Post], Optional[str]]:
+        stmt = (
+            select(Post)
+            .options(selectinload(Post.author))
+            .filter(Post.author_id == author_id)
+        )
+        if cursor:
+            stmt = stmt.filter(keyset_after(Post, cursor))
+        result = await self.db.execute(
+            stmt.order_by(*keyset_order(Post)).limit(limit + 1)
+        )
+        return split_page(list(result.scalars().all()), limit)
+
+    async def search(
+        self, query: str, cursor: Optional[str] = None, limit: int = 10
+    ) -> Tuple[List[Post], Optional[str]]:
+        if use_fulltext(self.db.get_bind().dialect.name):
+            result = await self.db.execute(_fulltext_search(query, cursor, limit))
+            return split_ranked_page(result.all(), limit)
+
+        index = get_search_index()
+        while not index.ready:
+            if not index.start_build():
+                await asyncio.sleep(0.01)  # 다른 요청이 색인을 만드는 중
+                continue
+            try:
+                # 비동기 세션은 stream으로 배치 단위로 읽어서 색인
+                result = await self.db.stream(select(Post.id, Post.title, Post.content))
+                async for partition in result.partitions(1000):
+                    index.load(partition)
+            except Exception:
+                index.finish_build(succeeded=False)
+                raise
+            index.finish_build()
+        while True:
+            ranked = _ranked_after(index.search(query), cursor, limit)
+            result = await self.db.execute(
+                select(Post)
+                .options(selectinload(Post.author))
+                .filter(Post.id.in_([post_id for _, post_id in ranked]))
+            )
+            rows = _in_rank_order(ranked, list(result.scalars().all()))
+            # 색인에만 남은 게시글을 뺐으면 새 점수로 다시 검색 (동기 버전과 같음)
+            if len(rows) == len(ranked):
+                return split_ranked_page(rows, limit)
@@ -1,11 +1,18 @@
 from typing import List, Optional
 
 from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.auth.utils import get_password_hash, verify_password
+from app.auth.utils import (aget_password_hash, averify_password,
+                            get_password_hash, verify_password)
+from app.domain.models.comment import Comment
 from app.domain.models.user import Role, User
 from app.domain.schemas.user import UserCreate, UserInDB, UserRead, UserUpdate
+from app.post_cache import invalidate_author_posts, invalidate_post
+from app.service.comment_service import AsyncCommentService, CommentService
+from app.service.etag import make_etag
 
 
 class UserAlreadyExistsException(HTTPException):
@@ -51,6 +58,11 @@ class UserService:
             return UserInDB.from_orm(user)
         return None
 
+    # 본문을 읽지 않고 version만으로 ETag 계산 (없으면 None)
+    def get_etag(self, userid: str) -> Optional[str]:
+        row = self.db.query(User.version).filter(User.userid == userid).first()
+        return make_etag("user", userid, row.version) if row else None
+
     def get_by_userid(self, userid: str) -> Optional[UserInDB]:
         # 여기서 userid는 OAuth2PasswordRequestForm의 'username' 필드로 전송된 값이므로, 일관되게 사용해야 합니다.
         user = self.db.query(User).filter(User.userid == userid).first()
@@ -75,6 +87,9 @@ class UserService:
         for key, value in update_data.items():
             setattr(user, key, value)
         self.db.commit()
+        if update_data:
+            # 캐시된 게시글 응답에 작성자 정보(닉네임 등)가 포함되어 있음
+            invalidate_author_posts(userid)
         self.db.refresh(user)
 
         return UserRead.from_orm(user)
@@ -82,15 +97,130 @@ class UserService:
     def delete(self, userid: str):
         user = self.db.query(User).filter(User.userid == userid).first()
         if user:
+            # 다른 게시글에 남긴 댓글도 함께 삭제되므로 해당 게시글의 댓글 수를 먼저 차감
+            post_ids = CommentService(self.db).discount_by_author(userid)
             self.db.delete(user)
             self.db.commit()
+            invalidate_author_posts(userid)
+            for post_id in post_ids:
+                invalidate_post(post_id)
         else:
             raise ValueError("유저가 없습니다.")
 
+    def get_comments_by_user(
+        self, userid: str, skip: int = 0, limit: int = 10
+    ) -> List[Comment]:
+        return (
+            self.db.query(Comment)
+            .filter(Comment.author_id == userid)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
     def delete_by_userid(self, userid: str):
         user = self.db.query(User).filter(User.userid == userid).first()
         if user:
+            # 다른 게시글에 남긴 댓글도 함께 삭제되므로 해당 게시글의 댓글 수를 먼저 차감
+            post_ids = CommentService(self.db).discount_by_author(userid)
             self.db.delete(user)
             self.db.commit()
+            invalidate_author_posts(userid)
+            for post_id in post_ids:
+                invalidate_post(post_id)
         else:
             raise ValueError("유저가 없습니다.")
+
+
+class AsyncUserService:
+    # asyncio 모드용 UserService. bcrypt 해시는 CPU 작업이므로 이벤트 루프를 막지 않도록
+    # 비밀번호 전용 프로세스 풀에서 실행한다.
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _get_user(self, userid: str) -> Optional[User]:
+        result = await self.db.execute(select(User).filter(User.userid == userid))
+        return result.scalars().first()
+
+    async def create_user(self, user_create: UserCreate) -> UserRead:
+        if await self._get_user(user_create.userid):
+            raise UserAlreadyExistsException()
+
+        hashed_password = await aget_password_hash(user_create.password)
+        user = User(
+            userid=user_create.userid,
+            nickname=user_create.nickname,
+            hashed_password=hashed_password,
+            role=user_create.role,
+        )
+
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+
+        return UserRead.model_validate(user)
+
+    async def authenticate_user(self, userid: str, password: str) -> Optional[UserInDB]:
+        user = await self._get_user(userid)
+        if not user or not await averify_password(password, user.hashed_password):
+            return None
+        return UserInDB.model_validate(user)
+
+    async def get(self, userid: str) -> Optional[UserInDB]:
+        user = await self._get_user(userid)
+        if user:
+            return UserInDB.model_validate(user)
+        return None
+
+    async def get_etag(self, userid: str) -> Optional[str]:
+        result = await self.db.execute(
+            select(User.version).filter(User.userid == userid)
+        )
+        version = result.scalar()
+        return make_etag("user", userid, version) if version is not None else None
+
+    async def get_by_userid(self, userid: str) -> Optional[UserInDB]:
+        return await self.get(userid)
+
+    async def get_multi(self, skip: int = 0, limit: int = 10) -> List[UserRead]:
+        result = await self.db.execute(select(User).offset(skip).limit(limit))
+        return [UserRead.model_validate(user) for user in result.scalars().all()]
+
+    async def update(self, userid: str, user_update: UserUpdate) -> UserRead:
+        user = await self._get_user(userid)
+        if not user:
+            raise ValueError("유저가 없습니다.")
+        if user_update.password:
+            user.hashed_password = await aget_password_hash(user_update.password)
+        update_data = user_update.dict(exclude_unset=True, exclude={"password"})
+        for key, value in update_data.items():
+            setattr(user, key, value)
+        await self.db.commit()
+        if update_data:
+            invalidate_author_posts(userid)
+        await self.db.refresh(user)
+
+        return UserRead.model_validate(user)
+
+    async def delete(self, userid: str):
+        user = await self._get_user(userid)
+        if user:
+            post_ids = await AsyncCommentService(self.db).discount_by_author(userid)
+            await self.db.delete(user)
+            await self.db.commit()
+            invalidate_author_posts(userid)
+            for post_id in post_ids:
+                invalidate_post(post_id)
+        else:
+            raise ValueError("유저가 없습니다.")
+
+    async def get_comments_by_user(
+        self, userid: str, skip: int = 0, limit: int = 10
+    ) -> List[Comment]:
+        result = await self.db.execute(
+            select(Comment)
+            .filter(Comment.author_id == userid)
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
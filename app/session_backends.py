@@ -0,0 +1,435 @@
+# 세션 스토어 인터페이스와 DB 외 백엔드 구현
+# SESSION_BACKEND 설정으로 선택한다. (db | memory | redis | signed)
+#   - memory: 단일 노드용 샤딩된 인메모리 스토어 (워커 프로세스 간 공유되지 않음)
+#   - redis : Redis 프로토콜 스토어, 여러 노드/워커가 세션을 공유해서 MySQL을 거치지 않음
+#   - signed: 서버에 세션을 저장하지 않는 HMAC 서명 토큰, 로그아웃만 거부 목록에 기록
+import functools
+import heapq
+import inspect
+import json
+import secrets
+import threading
+import time
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Dict, Optional, Tuple
+
+from app.auth.tokens import InvalidTokenError, sign_token, verify_token
+
+
+class SessionLookupStats:
+    # 백엔드별 세션 조회 결과 수 (GET /metrics의 session_lookups_total).
+    # 세션 캐시 사용 여부와 관계없이 get_session 호출마다 세션을 찾았는지(hit) 못 찾았는지(miss) 센다.
+    def __init__(self):
+        self._counts: Dict[Tuple[str, str], int] = {}  # (backend, hit|miss)
+        self._lock = threading.Lock()
+
+    def record(self, backend: str, found: bool):
+        key = (backend, "hit" if found else "miss")
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[Tuple[str, str], int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = {}
+
+
+session_lookups = SessionLookupStats()
+
+
+def counted_lookup(backend: str):
+    # 백엔드의 get_session(동기/async)을 감싸서 조회 결과를 session_lookups에 기록
+    def decorator(get_session):
+        if inspect.iscoroutinefunction(get_session):
+
+            @functools.wraps(get_session)
+            async def async_wrapper(self, session_id):
+                data = await get_session(self, session_id)
+                session_lookups.record(backend, data is not None)
+                return data
+
+            return async_wrapper
+
+        @functools.wraps(get_session)
+        def wrapper(self, session_id):
+            data = get_session(self, session_id)
+            session_lookups.record(backend, data is not None)
+            return data
+
+        return wrapper
+
+    return decorator
+
+
+class SessionStore(ABC):
+    @abstractmethod
+    def create_session(self, data: dict, expires_in: timedelta) -> str: ...
+
+    @abstractmethod
+    def get_session(self, session_id: str) -> Optional[dict]: ...
+
+    @abstractmethod
+    def delete_session(self, session_id: str): ...
+
+    # 세션 데이터의 userid로 해당 사용자의 세션 ID를 하나 찾는다. (로그아웃용)
+    @abstractmethod
+    def find_session_id(self, userid: str) -> Optional[str]: ...
+
+    # 해당 사용자의 모든 세션을 폐기하고 폐기한 세션 수를 반환한다.
+    @abstractmethod
+    def revoke_user_sessions(self, userid: str) -> int: ...
+
+
+class AsyncSessionStore(ABC):
+    @abstractmethod
+    async def create_session(self, data: dict, expires_in: timedelta) -> str: ...
+
+    @abstractmethod
+    async def get_session(self, session_id: str) -> Optional[dict]: ...
+
+    @abstractmethod
+    async def delete_session(self, session_id: str): ...
+
+    @abstractmethod
+    async def find_session_id(self, userid: str) -> Optional[str]: ...
+
+    @abstractmethod
+    async def revoke_user_sessions(self, userid: str) -> int: ...
+
+
+class _MemoryShard:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}  # session_id -> (deadline, data)
+        self.expiry_heap = []  # (deadline, session_id), 만료 순으로 정리
+
+
+class MemorySessionStore(SessionStore):
+    # 샤드별 락으로 경합을 줄이고, 만료 힙으로 만료된 세션을 쓰기 시점에 정리한다.
+    def __init__(self, shards: int = 16):
+        self._shards = [_MemoryShard() for _ in range(shards)]
+        self._user_index = {}  # userid -> set(session_id)
+        self._user_index_lock = threading.Lock()
+
+    def _shard(self, session_id: str) -> _MemoryShard:
+        return self._shards[zlib.crc32(session_id.encode()) % len(self._shards)]
+
+    def _purge_expired(self, shard: _MemoryShard, now: float):
+        # shard.lock을 잡은 상태에서 호출
+        while shard.expiry_heap and shard.expiry_heap[0][0] <= now:
+            deadline, session_id = heapq.heappop(shard.expiry_heap)
+            entry = shard.entries.get(session_id)
+            if entry is not None and entry[0] == deadline:
+                del shard.entries[session_id]
+                self._unindex(session_id, entry[1])
+
+    def _unindex(self, session_id: str, data: dict):
+        userid = data.get("userid")
+        with self._user_index_lock:
+            session_ids = self._user_index.get(userid)
+            if session_ids is not None:
+                session_ids.discard(session_id)
+                if not session_ids:
+                    del self._user_index[userid]
+
+    def create_session(self, data: dict, expires_in: timedelta) -> str:
+        session_id = str(uuid.uuid4())
+        now = time.monotonic()
+        deadline = now + expires_in.total_seconds()
+        shard = self._shard(session_id)
+        with shard.lock:
+            self._purge_expired(shard, now)
+            shard.entries[session_id] = (deadline, data)
+            heapq.heappush(shard.expiry_heap, (deadline, session_id))
+        with self._user_index_lock:
+            self._user_index.setdefault(data.get("userid"), set()).add(session_id)
+        return session_id
+
+    @counted_lookup("memory")
+    def get_session(self, session_id: str) -> Optional[dict]:
+        if not session_id:
+            return None
+        shard = self._shard(session_id)
+        with shard.lock:
+            entry = shard.entries.get(session_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del shard.entries[session_id]
+                self._unindex(session_id, entry[1])
+                return None
+            return entry[1]
+
+    def delete_session(self, session_id: str):
+        shard = self._shard(session_id)
+        with shard.lock:
+            entry = shard.entries.pop(session_id, None)
+        if entry is not None:
+            self._unindex(session_id, entry[1])
+
+    def find_session_id(self, userid: str) -> Optional[str]:
+        with self._user_index_lock:
+            session_ids = list(self._user_index.get(userid, ()))
+        for session_id in session_ids:
+            if self.get_session(session_id) is not None:
+                return session_id
+        return None
+
+    def revoke_user_sessions(self, userid: str) -> int:
+        with self._user_index_lock:
+            session_ids = list(self._user_index.get(userid, ()))
+        revoked = 0
+        now = time.monotonic()
+        for session_id in session_ids:
+            shard = self._shard(session_id)
+            with shard.lock:
+                entry = shard.entries.pop(session_id, None)
+            if entry is not None:
+                self._unindex(session_id, entry[1])
+                if entry[0] > now:
+                    revoked += 1
+        return revoked
+
+
+# Redis 키 규칙: 세션 본문과 사용자별 세션 ID 집합
+def _session_key(session_id: str) -> str:
+    return f"session:{session_id}"
+
+
+def _user_sessions_key(userid: str) -> str:
+    return f"user_sessions:{userid}"
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _ttl_seconds(expires_in: timedelta) -> int:
+    return max(1, int(expires_in.total_seconds()))
+
+
+class RedisSessionStore(SessionStore):
+    # 만료는 Redis의 EX(TTL)에 맡긴다. client는 redis.Redis 호환 객체
+    def __init__(self, client):
+        self.client = client
+
+    def create_session(self, data: dict, expires_in: timedelta) -> str:
+        session_id = str(uuid.uuid4())
+        ttl = _ttl_seconds(expires_in)
+        user_key = _user_sessions_key(data.get("userid"))
+        pipe = self.client.pipeline()
+        pipe.set(_session_key(session_id), json.dumps(data), ex=ttl)
+        pipe.sadd(user_key, session_id)
+        # 사용자 세션 집합은 가장 늦게 만료되는 세션에 맞춰 TTL을 늘린다
+        pipe.expire(user_key, ttl, gt=True)
+        pipe.expire(user_key, ttl, nx=True)
+        pipe.execute()
+        return session_id
+
+    @counted_lookup("redis")
+    def get_session(self, session_id: str) -> Optional[dict]:
+        if not session_id:
+            return None
+        raw = self.client.get(_session_key(session_id))
+        return json.loads(raw) if raw is not None else None
+
+    def delete_session(self, session_id: str):
+        data = self.get_session(session_id)
+        pipe = self.client.pipeline()
+        pipe.delete(_session_key(session_id))
+        if data is not None:
+            pipe.srem(_user_sessions_key(data.get("userid")), session_id)
+        pipe.execute()
+
+    def find_session_id(self, userid: str) -> Optional[str]:
+        user_key = _user_sessions_key(userid)
+        for session_id in self.client.smembers(user_key):
+            session_id = _decode(session_id)
+            if self.client.exists(_session_key(session_id)):
+                return session_id
+            # 이미 만료된 세션 ID는 집합에서 정리
+            self.client.srem(user_key, session_id)
+        return None
+
+    def revoke_user_sessions(self, userid: str) -> int:
+        user_key = _user_sessions_key(userid)
+        session_ids = self.client.smembers(user_key)
+        pipe = self.client.pipeline()
+        for session_id in session_ids:
+            pipe.delete(_session_key(_decode(session_id)))
+        pipe.delete(user_key)
+        # 마지막 결과는 user_key 삭제 결과이므로 제외
+        return sum(pipe.execute()[:-1])
+
+
+class AsyncRedisSessionStore(AsyncSessionStore):
+    # asyncio 모드용. client는 redis.asyncio.Redis 호환 객체
+    def __init__(self, client):
+        self.client = client
+
+    async def create_session(self, data: dict, expires_in: timedelta) -> str:
+        session_id = str(uuid.uuid4())
+        ttl = _ttl_seconds(expires_in)
+        user_key = _user_sessions_key(data.get("userid"))
+        pipe = self.client.pipeline()
+        pipe.set(_session_key(session_id), json.dumps(data), ex=ttl)
+        pipe.sadd(user_key, session_id)
+        pipe.expire(user_key, ttl, gt=True)
+        pipe.expire(user_key, ttl, nx=True)
+        await pipe.execute()
+        return session_id
+
+    @counted_lookup("redis")
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        if not session_id:
+            return None
+        raw = await self.client.get(_session_key(session_id))
+        return json.loads(raw) if raw is not None else None
+
+    async def delete_session(self, session_id: str):
+        data = await self.get_session(session_id)
+        pipe = self.client.pipeline()
+        pipe.delete(_session_key(session_id))
+        if data is not None:
+            pipe.srem(_user_sessions_key(data.get("userid")), session_id)
+        await pipe.execute()
+
+    async def find_session_id(self, userid: str) -> Optional[str]:
+        user_key = _user_sessions_key(userid)
+        for session_id in await self.client.smembers(user_key):
+            session_id = _decode(session_id)
+            if await self.client.exists(_session_key(session_id)):
+                return session_id
+            await self.client.srem(user_key, session_id)
+        return None
+
+    async def revoke_user_sessions(self, userid: str) -> int:
+        user_key = _user_sessions_key(userid)
+        session_ids = await self.client.smembers(user_key)
+        pipe = self.client.pipeline()
+        for session_id in session_ids:
+            pipe.delete(_session_key(_decode(session_id)))
+        pipe.delete(user_key)
+        return sum((await pipe.execute())[:-1])
+
+
+class _SignedTokens:
+    # 토큰에는 인증에 필요한 최소 정보만 담는다. (비밀번호 해시 등은 제외)
+    TOKEN_FIELDS = ("id", "userid", "nickname", "role", "created_at")
+
+    # max_age: 발급하는 토큰의 최대 유효 기간, 사용자 단위 폐기 기록을 이 기간만큼 보관
+    def __init__(
+        self, secret_key: str, denylist, max_age: timedelta = timedelta(days=1)
+    ):
+        if not secret_key:
+            raise ValueError(
+                "SESSION_BACKEND=signed 를 사용하려면 SECRET_KEY가 필요합니다."
+            )
+        self.secret_key = secret_key
+        self.denylist = denylist
+        self.max_age = max_age
+
+    def _issue(self, data: dict, expires_in: timedelta) -> str:
+        payload = {key: data[key] for key in self.TOKEN_FIELDS if key in data}
+        payload["jti"] = secrets.token_urlsafe(8)
+        payload["iat"] = time.time()
+        payload["exp"] = int(time.time() + expires_in.total_seconds())
+        return sign_token(payload, self.secret_key)
+
+    def _verify(self, session_id: str) -> Optional[dict]:
+        # 서명/만료가 올바르면 payload, 아니면 None (거부 목록은 호출한 쪽에서 확인)
+        if not session_id:
+            return None
+        try:
+            return verify_token(session_id, self.secret_key)
+        except InvalidTokenError:
+            return None
+
+
+def _issued_before(payload: dict, revoked_at: Optional[float]) -> bool:
+    return revoked_at is not None and payload.get("iat", 0) <= revoked_at
+
+
+class SignedSessionStore(_SignedTokens, SessionStore):
+    def create_session(self, data: dict, expires_in: timedelta) -> str:
+        return self._issue(data, expires_in)
+
+    @counted_lookup("signed")
+    def get_session(self, session_id: str) -> Optional[dict]:
+        payload = self._verify(session_id)
+        if payload is None or self.denylist.contains(payload["jti"]):
+            return None
+        revoked_at = self.denylist.user_revoked_at(payload.get("userid"))
+        if _issued_before(payload, revoked_at):
+            return None
+        return payload
+
+    def delete_session(self, session_id: str):
+        # 이미 만료되었거나 위조된 토큰은 거부 목록에 넣을 필요가 없음
+        payload = self._verify(session_id)
+        if payload is not None:
+            self.denylist.add(payload["jti"], payload["exp"] - time.time())
+
+    def find_session_id(self, userid: str) -> Optional[str]:
+        # 서버에 토큰을 저장하지 않으므로 userid로 찾을 수 없음 (로그아웃은 쿠키의 토큰 사용)
+        return None
+
+    def revoke_user_sessions(self, userid: str) -> int:
+        # 발급한 토큰을 셀 수 없으므로, 지금 이전에 발급된 해당 사용자의 토큰을 모두 거부하도록 기록
+        self.denylist.revoke_user(userid, self.max_age.total_seconds())
+        return 0
+
+
+class AsyncSignedSessionStore(_SignedTokens, AsyncSessionStore):
+    # asyncio 모드용. denylist는 AsyncRedisDenylist처럼 메서드가 코루틴인 거부 목록
+    async def create_session(self, data: dict, expires_in: timedelta) -> str:
+        return self._issue(data, expires_in)
+
+    @counted_lookup("signed")
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        payload = self._verify(session_id)
+        if payload is None or await self.denylist.contains(payload["jti"]):
+            return None
+        revoked_at = await self.denylist.user_revoked_at(payload.get("userid"))
+        if _issued_before(payload, revoked_at):
+            return None
+        return payload
+
+    async def delete_session(self, session_id: str):
+        payload = self._verify(session_id)
+        if payload is not None:
+            await self.denylist.add(payload["jti"], payload["exp"] - time.time())
+
+    async def find_session_id(self, userid: str) -> Optional[str]:
+        return None
+
+    async def revoke_user_sessions(self, userid: str) -> int:
+        await self.denylist.revoke_user(userid, self.max_age.total_seconds())
+        return 0
+
+
+class AsyncSessionStoreAdapter(AsyncSessionStore):
+    # 블로킹 I/O가 없는 동기 스토어(memory, 메모리 거부 목록의 signed)를 asyncio 라우터에서 쓰기 위한 어댑터
+    def __init__(self, store: SessionStore):
+        self.store = store
+
+    async def create_session(self, data: dict, expires_in: timedelta) -> str:
+        return self.store.create_session(data, expires_in)
+
+    async def get_session(self, session_id: str) -> Optional[dict]:
+        return self.store.get_session(session_id)
+
+    async def delete_session(self, session_id: str):
+        self.store.delete_session(session_id)
+
+    async def find_session_id(self, userid: str) -> Optional[str]:
+        return self.store.find_session_id(userid)
+
+    async def revoke_user_sessions(self, userid: str) -> int:
+        return self.store.revoke_user_sessions(userid)
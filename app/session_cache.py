@@ -0,0 +1,86 @@
+# 워커(프로세스) 단위 세션 캐시
+# get_current_user가 인증 요청마다 sessions 테이블을 SELECT 하고 json.loads 하는 비용을 줄인다.
+# 다른 워커에서 로그아웃한 세션은 TTL 동안 이 워커에 남을 수 있으므로 TTL은 짧게 유지한다.
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+from app.config import get_settings
+
+
+class SessionCache:
+    def __init__(self, maxsize: int = 10000, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # session_id -> (deadline, payload)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, session_id: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            deadline, payload = entry
+            if deadline <= time.monotonic():
+                del self._entries[session_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            return payload
+
+    def set(self, session_id: str, payload: dict, expires_at: datetime):
+        # 캐시 TTL과 세션 자체의 만료 시각(expires_at, UTC) 중 빠른 쪽까지만 보관
+        remaining = (expires_at - datetime.utcnow()).total_seconds()
+        if remaining <= 0:
+            return
+        deadline = time.monotonic() + min(self.ttl, remaining)
+        with self._lock:
+            self._entries[session_id] = (deadline, payload)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_session_cache = None
+_session_cache_lock = threading.Lock()
+
+
+def get_session_cache() -> Optional[SessionCache]:
+    # SESSION_CACHE_ENABLED=false(기본값)이면 None을 반환해서 캐시를 사용하지 않음
+    global _session_cache
+    settings = get_settings()
+    if not settings.session_cache_enabled:
+        return None
+    if _session_cache is None:
+        with _session_cache_lock:
+            if _session_cache is None:
+                _session_cache = SessionCache(
+                    maxsize=settings.session_cache_maxsize,
+                    ttl=settings.session_cache_ttl,
+                )
+    return _session_cache
@@ -1,27 +1,44 @@
 import json  # JSON 직렬화/역직렬화 모듈 추가
 import uuid
 from datetime import datetime, timedelta
+from typing import Optional
 
 from fastapi import Depends
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session  # Session 임포트
 
-from app.database import get_db  # DB 종속성 가져오기
+from app.auth.tokens import AsyncRedisDenylist, MemoryDenylist, RedisDenylist
+from app.config import get_settings
+from app.database import get_async_db, get_db  # DB 종속성 가져오기
 from app.domain.models.session import \
     SessionModel  # SessionModel이 정의된 파일로부터 임포트
+from app.session_backends import (AsyncRedisSessionStore, AsyncSessionStore,
+                                  AsyncSessionStoreAdapter,
+                                  AsyncSignedSessionStore, MemorySessionStore,
+                                  RedisSessionStore, SessionStore,
+                                  SignedSessionStore, counted_lookup)
+from app.session_cache import SessionCache, get_session_cache
 
 
-class DBSessionStore:
-    def __init__(self, db: Session):
+class DBSessionStore(SessionStore):
+    def __init__(self, db: Session, cache: Optional[SessionCache] = None):
         self.db = db
+        # 캐시를 명시하지 않으면 설정(SESSION_CACHE_ENABLED)에 따라 워커 공용 캐시 사용
+        self.cache = get_session_cache() if cache is None else cache
 
     def create_session(self, data: dict, expires_in: timedelta):
         session_id = str(uuid.uuid4())
         expiration_time = datetime.utcnow() + expires_in
         session_data = json.dumps(data)  # 데이터를 JSON으로 직렬화하여 저장
 
-        # 세션 생성 및 DB에 저장
+        # 세션 생성 및 DB에 저장 (소유자는 인덱스 컬럼에도 기록)
         new_session = SessionModel(
-            session_id=session_id, data=session_data, expires_at=expiration_time
+            session_id=session_id,
+            data=session_data,
+            expires_at=expiration_time,
+            user_id=data.get("id"),
+            userid=data.get("userid"),
         )
         try:
             self.db.add(new_session)
@@ -32,7 +49,13 @@ class DBSessionStore:
 
         return session_id
 
+    @counted_lookup("db")
     def get_session(self, session_id: str):
+        if self.cache is not None:
+            cached = self.cache.get(session_id)
+            if cached is not None:
+                return cached
+
         # DB에서 세션 조회
         session = (
             self.db.query(SessionModel)
@@ -40,10 +63,16 @@ class DBSessionStore:
             .first()
         )
         if session and session.expires_at > datetime.utcnow():
-            return json.loads(session.data)  # JSON 문자열을 원래 데이터 형식으로 변환
+            data = json.loads(session.data)  # JSON 문자열을 원래 데이터 형식으로 변환
+            if self.cache is not None:
+                self.cache.set(session_id, data, session.expires_at)
+            return data
         return None
 
     def delete_session(self, session_id: str):
+        if self.cache is not None:
+            self.cache.invalidate(session_id)
+
         # DB에서 세션 삭제
         session = (
             self.db.query(SessionModel)
@@ -58,7 +87,216 @@ class DBSessionStore:
                 self.db.rollback()  # 에러 발생 시 롤백
                 raise e
 
+    def find_session_id(self, userid: str):
+        # ix_sessions_userid 인덱스 조회 (data 컬럼 LIKE 검색 대신)
+        session_id = (
+            self.db.query(SessionModel.session_id)
+            .filter(
+                SessionModel.userid == userid,
+                SessionModel.expires_at > datetime.utcnow(),
+            )
+            .first()
+        )
+        return session_id[0] if session_id else None
+
+    def revoke_user_sessions(self, userid: str) -> int:
+        session_ids = [
+            row.session_id
+            for row in self.db.query(SessionModel.session_id).filter(
+                SessionModel.userid == userid
+            )
+        ]
+        if not session_ids:
+            return 0
+        try:
+            self.db.query(SessionModel).filter(
+                SessionModel.session_id.in_(session_ids)
+            ).delete(synchronize_session=False)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            raise e
+        if self.cache is not None:
+            for session_id in session_ids:
+                self.cache.invalidate(session_id)
+        return len(session_ids)
+
+
+# asyncio 모드용 세션 스토어
+class AsyncDBSessionStore(AsyncSessionStore):
+    def __init__(self, db: AsyncSession, cache: Optional[SessionCache] = None):
+        self.db = db
+        self.cache = get_session_cache() if cache is None else cache
+
+    async def create_session(self, data: dict, expires_in: timedelta):
+        session_id = str(uuid.uuid4())
+        expiration_time = datetime.utcnow() + expires_in
+
+        new_session = SessionModel(
+            session_id=session_id,
+            data=json.dumps(data),
+            expires_at=expiration_time,
+            user_id=data.get("id"),
+            userid=data.get("userid"),
+        )
+        try:
+            self.db.add(new_session)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+        return session_id
+
+    @counted_lookup("db")
+    async def get_session(self, session_id: str):
+        if self.cache is not None:
+            cached = self.cache.get(session_id)
+            if cached is not None:
+                return cached
+
+        session = await self.db.get(SessionModel, session_id)
+        if session and session.expires_at > datetime.utcnow():
+            data = json.loads(session.data)
+            if self.cache is not None:
+                self.cache.set(session_id, data, session.expires_at)
+            return data
+        return None
+
+    async def delete_session(self, session_id: str):
+        if self.cache is not None:
+            self.cache.invalidate(session_id)
+
+        session = await self.db.get(SessionModel, session_id)
+        if session:
+            try:
+                await self.db.delete(session)
+                await self.db.commit()
+            except Exception as e:
+                await self.db.rollback()
+                raise e
+
+    async def find_session_id(self, userid: str):
+        result = await self.db.execute(
+            select(SessionModel.session_id).filter(
+                SessionModel.userid == userid,
+                SessionModel.expires_at > datetime.utcnow(),
+            )
+        )
+        return result.scalars().first()
+
+    async def revoke_user_sessions(self, userid: str) -> int:
+        result = await self.db.execute(
+            select(SessionModel.session_id).filter(SessionModel.userid == userid)
+        )
+        session_ids = result.scalars().all()
+        if not session_ids:
+            return 0
+        try:
+            await self.db.execute(
+                delete(SessionModel).where(SessionModel.session_id.in_(session_ids))
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+        if self.cache is not None:
+            for session_id in session_ids:
+                self.cache.invalidate(session_id)
+        return len(session_ids)
+
+
+# memory/redis 백엔드는 프로세스 단위로 하나만 만들어 공유한다
+_shared_store = None
+_async_shared_store = None
+
+
+def _redis_module():
+    try:
+        import redis
+        import redis.asyncio
+    except ImportError:
+        raise RuntimeError(
+            "SESSION_BACKEND=redis 를 사용하려면 redis 패키지를 설치해야 합니다."
+        )
+    return redis
+
+
+def get_shared_session_store() -> SessionStore:
+    global _shared_store
+    if _shared_store is None:
+        settings = get_settings()
+        if settings.session_backend == "memory":
+            _shared_store = MemorySessionStore(shards=settings.session_memory_shards)
+        elif settings.session_backend == "redis":
+            client = _redis_module().Redis.from_url(
+                settings.redis_url, decode_responses=True
+            )
+            _shared_store = RedisSessionStore(client)
+        elif settings.session_backend == "signed":
+            if settings.session_denylist_backend == "redis":
+                denylist = RedisDenylist(
+                    _redis_module().Redis.from_url(
+                        settings.redis_url, decode_responses=True
+                    )
+                )
+            else:
+                denylist = MemoryDenylist()
+            _shared_store = SignedSessionStore(settings.secret_key, denylist)
+        else:
+            raise ValueError(
+                f"알 수 없는 세션 백엔드입니다: {settings.session_backend}"
+            )
+    return _shared_store
+
+
+def get_async_shared_session_store() -> AsyncSessionStore:
+    global _async_shared_store
+    if _async_shared_store is None:
+        settings = get_settings()
+        if settings.session_backend == "redis":
+            client = _redis_module().asyncio.Redis.from_url(
+                settings.redis_url, decode_responses=True
+            )
+            _async_shared_store = AsyncRedisSessionStore(client)
+        elif (
+            settings.session_backend == "signed"
+            and settings.session_denylist_backend == "redis"
+        ):
+            # 거부 목록 조회가 이벤트 루프를 막지 않도록 asyncio Redis 클라이언트 사용
+            client = _redis_module().asyncio.Redis.from_url(
+                settings.redis_url, decode_responses=True
+            )
+            _async_shared_store = AsyncSignedSessionStore(
+                settings.secret_key, AsyncRedisDenylist(client)
+            )
+        else:
+            _async_shared_store = AsyncSessionStoreAdapter(get_shared_session_store())
+    return _async_shared_store
+
+
+async def close_session_stores():
+    # asyncio Redis 커넥션은 이벤트 루프에 묶여 있으므로 애플리케이션 종료 시 정리
+    global _async_shared_store
+    store, _async_shared_store = _async_shared_store, None
+    if isinstance(store, AsyncRedisSessionStore):
+        await store.client.aclose()
+    elif isinstance(store, AsyncSignedSessionStore) and isinstance(
+        store.denylist, AsyncRedisDenylist
+    ):
+        await store.denylist.client.aclose()
+
+
+# 설정(SESSION_BACKEND)에 따라 세션 스토어를 선택 (의존성 주입에서 사용)
+def get_session_store(db: Session = Depends(get_db)) -> SessionStore:
+    if get_settings().session_backend == "db":
+        return DBSessionStore(db)
+    return get_shared_session_store()
+
 
-# DBSessionStore 인스턴스 생성 (의존성 주입에서 사용할 수 있도록)
-def get_session_store(db: Session = Depends(get_db)):
-    return DBSessionStore(db)
+def get_async_session_store(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncSessionStore:
+    if get_settings().session_backend == "db":
+        return AsyncDBSessionStore(db)
+    return get_async_shared_session_store()
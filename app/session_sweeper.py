@@ -0,0 +1,176 @@
+# 만료된 세션 정리 작업 (SESSION_BACKEND=db)
+# get_session은 만료된 행을 무시할 뿐 지우지 않으므로 sessions 테이블과 인덱스가 계속 커진다.
+# lifespan에서 백그라운드 태스크로 실행하며, 긴 락을 잡지 않도록 작은 배치 단위로 커밋한다.
+import asyncio
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.database import get_async_session_local, get_session_local
+from app.domain.models.session import SessionModel
+from app.logger_setup import logger
+
+
+def _expired_batch(now: datetime, batch_size: int):
+    # ix_sessions_expires_at 인덱스 범위 스캔으로 가장 오래된 만료 세션부터 batch_size개
+    return (
+        select(SessionModel.session_id)
+        .where(SessionModel.expires_at <= now)
+        .order_by(SessionModel.expires_at)
+        .limit(batch_size)
+    )
+
+
+class SessionSweeper:
+    def __init__(self, interval: float = 300, batch_size: int = 500):
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.batches = 0
+        self.rows_purged = 0
+        self.batch_ms_sum = 0.0
+        self.batch_ms_max = 0.0
+        self.last_batch_ms = 0.0
+
+    def _record(self, purged: int, started: float):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.batches += 1
+            self.rows_purged += purged
+            self.batch_ms_sum += elapsed_ms
+            self.batch_ms_max = max(self.batch_ms_max, elapsed_ms)
+            self.last_batch_ms = elapsed_ms
+
+    def sweep_batch(self, db: Session) -> int:
+        started = time.perf_counter()
+        ids = db.execute(_expired_batch(datetime.utcnow(), self.batch_size))
+        ids = ids.scalars().all()
+        if ids:
+            try:
+                db.execute(delete(SessionModel).where(SessionModel.session_id.in_(ids)))
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                raise e
+        self._record(len(ids), started)
+        return len(ids)
+
+    async def asweep_batch(self, db: AsyncSession) -> int:
+        started = time.perf_counter()
+        result = await db.execute(_expired_batch(datetime.utcnow(), self.batch_size))
+        ids = result.scalars().all()
+        if ids:
+            try:
+                await db.execute(
+                    delete(SessionModel).where(SessionModel.session_id.in_(ids))
+                )
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                raise e
+        self._record(len(ids), started)
+        return len(ids)
+
+    def sweep(self, session_factory=None) -> int:
+        # 배치가 가득 차지 않을 때까지 반복, 배치마다 별도 트랜잭션
+        session_factory = session_factory or get_session_local()
+        total = 0
+        with session_factory() as db:
+            while True:
+                purged = self.sweep_batch(db)
+                total += purged
+                if purged < self.batch_size:
+                    break
+        with self._lock:
+            self.runs += 1
+        return total
+
+    async def asweep(self) -> int:
+        total = 0
+        if get_settings().db_async:
+            async with get_async_session_local()() as db:
+                while True:
+                    purged = await self.asweep_batch(db)
+                    total += purged
+                    if purged < self.batch_size:
+                        break
+                    await asyncio.sleep(0)  # 배치 사이에 다른 요청이 실행되도록 양보
+        else:
+            with get_session_local()() as db:
+                while True:
+                    purged = await run_in_threadpool(self.sweep_batch, db)
+                    total += purged
+                    if purged < self.batch_size:
+                        break
+        with self._lock:
+            self.runs += 1
+        return total
+
+    async def _run_forever(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                purged = await self.asweep()
+                if purged:
+                    logger.info("만료된 세션 %d개를 정리했습니다.", purged)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 정리 실패가 애플리케이션을 멈추지 않도록 기록만 하고 다음 주기에 재시도
+                logger.error("만료 세션 정리 중 오류 발생: %s", e)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run_forever())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "batches": self.batches,
+                "rows_purged": self.rows_purged,
+                "batch_ms_avg": (
+                    self.batch_ms_sum / self.batches if self.batches else 0.0
+                ),
+                "batch_ms_max": self.batch_ms_max,
+                "last_batch_ms": self.last_batch_ms,
+            }
+
+
+_session_sweeper = None
+
+
+def get_session_sweeper() -> Optional[SessionSweeper]:
+    # DB 세션 저장소에서만 필요 (memory/redis/signed는 각자 만료를 처리)
+    global _session_sweeper
+    settings = get_settings()
+    if not settings.session_sweeper_enabled or settings.session_backend != "db":
+        return None
+    if _session_sweeper is None:
+        _session_sweeper = SessionSweeper(
+            interval=settings.session_sweep_interval,
+            batch_size=settings.session_sweep_batch_size,
+        )
+    return _session_sweeper
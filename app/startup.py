@@ -0,0 +1,63 @@
+# 애플리케이션 시작 시간 측정
+# app.main이 가장 먼저 import 하므로 started는 프로세스가 앱을 읽기 시작한 시점에 가깝다.
+# lifespan이 끝나면 단계별 시간(모듈 import, 스키마 확인 등)을 한 줄로 기록하고,
+# 첫 요청의 응답이 끝나면 그때까지 걸린 시간을 한 번 더 기록한다.
+# 모듈별 import 시간은 python -m app.tools.startup_profile 로 본다.
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from app.logger_setup import logger
+
+
+class StartupTimer:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.steps: List[Tuple[str, float]] = []  # (단계, ms)
+        self.process_started = self.started  # log() 후에도 바뀌지 않음
+        self.first_request_ms: Optional[float] = None
+
+    def record(self, name: str, since: float):
+        self.steps.append((name, (time.perf_counter() - since) * 1000))
+
+    @contextmanager
+    def step(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    def log(self):
+        total_ms = (time.perf_counter() - self.started) * 1000
+        breakdown = ", ".join(f"{name} {ms:.1f}ms" for name, ms in self.steps)
+        logger.info("시작 완료: 총 %.1fms (%s)", total_ms, breakdown)
+        # 같은 프로세스에서 다시 시작하면(테스트 등) 이 시점부터 다시 측정
+        self.started = time.perf_counter()
+        self.steps = []
+
+    def record_first_request(self):
+        if self.first_request_ms is None:
+            self.first_request_ms = (time.perf_counter() - self.process_started) * 1000
+            logger.info("첫 요청 완료: 시작부터 %.1fms", self.first_request_ms)
+
+
+startup_timer = StartupTimer()
+
+
+class FirstRequestTimer:
+    # 첫 HTTP 요청의 응답이 끝난 시점을 기록하는 ASGI 미들웨어.
+    # 기록한 뒤에는 플래그 하나만 확인하고 그대로 넘긴다.
+    def __init__(self, app, timer: StartupTimer = startup_timer):
+        self.app = app
+        self.timer = timer
+        self.done = False
+
+    async def __call__(self, scope, receive, send):
+        if self.done or scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.done = True
+            self.timer.record_first_request()
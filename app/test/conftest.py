@@ -5,14 +5,16 @@ import pytest
 # conftest.py
 from dotenv import load_dotenv
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session, sessionmaker
 from testcontainers.mysql import MySqlContainer
 
 from app.auth.dependencies import get_current_user
 from app.auth.utils import get_password_hash
-from app.config import Settings
+from app.config import Settings, get_settings
 from app.database import Base, get_db, get_engine
 from app.domain.models.user import User
+from app.migrations import migrate
 from app.session_store import (DBSessionStore,  # DBSessionStore 임포트
                                get_session_store)
 
@@ -34,11 +36,12 @@ def mysql_container():
 def db_engine(mysql_container):
     # 환경 변수를 통해 SQLAlchemy 엔진이 Testcontainers의 MySQL URL을 사용하도록 설정
     os.environ["DATABASE_URL"] = mysql_container.get_connection_url()
+    get_settings.cache_clear()  # 캐시된 설정이 이전 DATABASE_URL을 들고 있지 않도록
     engine = get_engine()  # `get_engine()`을 사용해 엔진을 생성
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    # 데이터베이스 초기화
-    Base.metadata.create_all(bind=engine)
+    # 데이터베이스 초기화 (앱 시작 시 스키마 버전 확인을 통과하도록 마이그레이션 기록도 남김)
+    migrate(engine)
 
     yield TestingSessionLocal  # sessionmaker 객체를 반환
 
@@ -156,6 +159,41 @@ def other_user(db_session: Session) -> User:
     return user
 
 
+# 블록 안에서 실행된 SQL 문을 기록 (N+1 쿼리 회귀 방지용)
+class StatementCounter:
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def assert_count(self, expected: int):
+        assert (
+            self.count == expected
+        ), f"SQL 문 {expected}개를 예상했지만 {self.count}개가 실행됨:\n" + "\n".join(
+            self.statements
+        )
+
+
+@pytest.fixture
+def count_statements(db_engine):
+    # 사용법: with count_statements() as counter: ... ; counter.assert_count(2)
+    # (테스트 클라이언트의 get_db가 사용하는 sessionmaker의 엔진을 관찰)
+    return lambda: StatementCounter(db_engine.kw["bind"])
+
+
 @pytest.fixture
 def override_settings():
     from app.config import get_settings
@@ -10,6 +10,7 @@ from app.domain.models.comment import Comment
 from app.domain.models.post import Post
 from app.domain.models.user import User
 from app.domain.schemas.post import PostCreate, PostUpdate
+from app.service.pagination import split_page
 from app.service.post_service import PostService
 from app.service.user_service import UserCreate, UserService
 from app.test.conftest import authenticated_user, db_session
@@ -861,3 +862,141 @@ def test_read_comments_by_post_pagination(
     # 댓글 10개가 반환되었는지 확인
     # then
     assert len(response_data) == 10
+
+
+def test_read_posts_cursor_pagination(
+    client: TestClient, db_session: Session, authenticated_user
+):
+    # 15개의 게시글 생성
+    # given
+    for i in range(15):
+        db_session.add(
+            Post(
+                title=f"Test Post {i + 1}",
+                content=f"This is test post content {i + 1}.",
+                author_id=authenticated_user.userid,
+            )
+        )
+    db_session.commit()
+
+    # 빈 커서로 첫 페이지를 요청하고 next_cursor를 따라 끝까지 조회
+    # when
+    titles = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get("/posts/", params={"cursor": cursor, "limit": 10})
+        assert response.status_code == 200
+        page = response.json()
+        titles.extend(post["title"] for post in page["items"])
+        cursor = page["next_cursor"]
+
+    # then - 중복/누락 없이 작성 순서대로 반환
+    assert titles == [f"Test Post {i + 1}" for i in range(15)]
+
+
+def test_read_posts_by_user_cursor_pagination(
+    client: TestClient, db_session: Session, authenticated_user, other_user
+):
+    # given
+    for i in range(3):
+        db_session.add(
+            Post(title=f"mine {i}", content="c", author_id=authenticated_user.userid)
+        )
+        db_session.add(
+            Post(title=f"other {i}", content="c", author_id=other_user.userid)
+        )
+    db_session.commit()
+
+    # when
+    first = client.get(
+        f"/users/{authenticated_user.userid}/posts", params={"cursor": "", "limit": 2}
+    ).json()
+    second = client.get(
+        f"/users/{authenticated_user.userid}/posts",
+        params={"cursor": first["next_cursor"], "limit": 2},
+    ).json()
+
+    # then
+    assert [post["title"] for post in first["items"]] == ["mine 0", "mine 1"]
+    assert [post["title"] for post in second["items"]] == ["mine 2"]
+    assert second["next_cursor"] is None
+
+
+def test_read_comments_by_post_cursor_pagination(
+    client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    post = Post(
+        title="Test Post", content="content", author_id=authenticated_user.userid
+    )
+    db_session.add(post)
+    db_session.commit()
+    for i in range(5):
+        db_session.add(
+            Comment(
+                content=f"Test comment {i + 1}",
+                post_id=post.id,
+                author_id=authenticated_user.userid,
+            )
+        )
+    db_session.commit()
+
+    # when
+    first = client.get(
+        f"/posts/{post.id}/comments", params={"cursor": "", "limit": 3}
+    ).json()
+    second = client.get(
+        f"/posts/{post.id}/comments",
+        params={"cursor": first["next_cursor"], "limit": 3},
+    ).json()
+
+    # then
+    assert len(first["items"]) == 3
+    assert [c["content"] for c in second["items"]] == [
+        "Test comment 4",
+        "Test comment 5",
+    ]
+    assert second["next_cursor"] is None
+
+
+def test_read_posts_invalid_cursor(client: TestClient):
+    # when
+    response = client.get("/posts/", params={"cursor": "not-a-cursor"})
+
+    # then
+    assert response.status_code == 400
+    assert response.json()["detail"] == "잘못된 커서입니다."
+
+
+@pytest.mark.parametrize(
+    "path", ["/posts/", "/users/testuser/posts", "/posts/1/comments"]
+)
+@pytest.mark.parametrize("limit", [0, -1, 101])
+def test_cursor_pages_reject_out_of_range_limit(client: TestClient, path, limit):
+    # when
+    response = client.get(path, params={"cursor": "", "limit": limit})
+
+    # then
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/posts/",
+        "/users/testuser/posts",
+        "/users/testuser/comments",
+        "/posts/1/comments",
+    ],
+)
+def test_offset_pages_keep_accepting_large_limit(client: TestClient, path):
+    # when - 기존 offset 방식 클라이언트는 limit 상한 없이 그대로 동작
+    response = client.get(path, params={"limit": 500})
+
+    # then
+    assert response.status_code == 200
+
+
+def test_split_page_with_empty_slice():
+    # then
+    assert split_page([object()], 0) == ([], None)
@@ -0,0 +1,167 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.async_endpoints import router as async_router
+from app.auth.dependencies import get_current_user_async
+from app.database import lifespan
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.models.user import Role
+from app.search_index import reset_search_index
+
+
+# asyncio 모드 라우터만 포함한 애플리케이션 (DB_ASYNC=true 와 동일한 구성)
+@pytest.fixture(scope="function")
+def async_client(db_session):
+    async_app = FastAPI(lifespan=lifespan)
+    async_app.include_router(async_router)
+
+    with TestClient(async_app) as c:
+        yield c
+
+
+@pytest.fixture
+def set_mock_user_async(async_client, authenticated_user):
+    async_client.app.dependency_overrides[get_current_user_async] = (
+        lambda: authenticated_user
+    )
+
+
+def test_async_create_user_and_login(async_client: TestClient):
+    # given
+    user_data = {
+        "userid": "asyncuser",
+        "password": "Testpassword1234",
+        "role": "MEMBER",
+        "nickname": "async",
+    }
+    assert async_client.post("/users/", json=user_data).status_code == 200
+
+    # when
+    response = async_client.post(
+        "/login", data={"username": "asyncuser", "password": "Testpassword1234"}
+    )
+
+    # then
+    assert response.status_code == 200
+    profile = async_client.get(
+        "/profile", cookies={"session_id": response.json()["session_id"]}
+    )
+    assert profile.json() == {"user": "async"}
+
+    logout = async_client.post("/logout", params={"userid": "asyncuser"})
+    assert logout.status_code == 200
+
+
+def test_async_create_and_read_post(
+    async_client: TestClient, authenticated_user, set_mock_user_async
+):
+    # given
+    post_data = {"title": "Async Post", "content": "async content"}
+
+    # when
+    created = async_client.post("/posts/", json=post_data)
+    response = async_client.get(f"/posts/{created.json()['id']}")
+
+    # then
+    assert created.status_code == 200
+    assert response.status_code == 200
+    assert response.json()["author"]["userid"] == authenticated_user.userid
+
+
+def test_async_read_posts_and_comments(
+    async_client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    post = Post(title="Post", content="content", author_id=authenticated_user.userid)
+    db_session.add(post)
+    db_session.commit()
+    for i in range(3):
+        db_session.add(
+            Comment(
+                content=f"comment {i}",
+                post_id=post.id,
+                author_id=authenticated_user.userid,
+            )
+        )
+    db_session.commit()
+
+    # when
+    posts = async_client.get("/posts/")
+    comments = async_client.get(f"/posts/{post.id}/comments?limit=2")
+
+    # then
+    assert posts.status_code == 200
+    assert posts.json()[0]["author"]["nickname"] == authenticated_user.nickname
+    assert len(comments.json()) == 2
+
+
+def test_async_update_post_forbidden(
+    async_client: TestClient, db_session: Session, other_user, set_mock_user_async
+):
+    # given - 다른 사용자가 작성한 게시글
+    post = Post(title="Post", content="content", author_id=other_user.userid)
+    db_session.add(post)
+    db_session.commit()
+
+    # when
+    response = async_client.patch(f"/posts/{post.id}", json={"title": "New"})
+
+    # then
+    assert response.status_code == 403
+    assert response.json()["detail"] == "게시글 수정 권한이 없습니다."
+
+
+def test_async_search_posts(
+    async_client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    reset_search_index()
+    for title in ("파이썬 입문", "여행 후기"):
+        db_session.add(Post(title=title, content="내용", author_id="testuser"))
+    db_session.commit()
+
+    # when
+    response = async_client.get("/posts/search", params={"q": "파이썬"})
+    reset_search_index()
+
+    # then
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["items"]] == ["파이썬 입문"]
+
+
+def test_async_export_posts(
+    async_client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    authenticated_user.role = Role.ADMIN
+    db_session.add(Post(title="export", content="content", author_id="testuser"))
+    db_session.commit()
+    async_client.app.dependency_overrides[get_current_user_async] = (
+        lambda: authenticated_user
+    )
+
+    # when
+    response = async_client.get("/export/posts")
+
+    # then
+    assert response.status_code == 200
+    assert [json.loads(line)["title"] for line in response.text.splitlines()] == [
+        "export"
+    ]
+
+
+def test_async_metrics_reports_async_pool(async_client: TestClient):
+    # given
+    async_client.get("/posts/")
+
+    # when
+    response = async_client.get("/metrics")
+
+    # then
+    assert response.status_code == 200
+    assert 'db_pool_checkout_wait_seconds_count{engine="async"}' in response.text
@@ -0,0 +1,109 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.models.user import User
+from app.domain.schemas.comment import CommentCreate
+from app.service.comment_service import CommentService
+from app.service.user_service import UserService
+
+
+def _post(db_session: Session, author: User) -> Post:
+    post = Post(title="title", content="content", author_id=author.userid)
+    db_session.add(post)
+    db_session.commit()
+    return post
+
+
+def _comment_count(db_session: Session, post_id: int) -> int:
+    db_session.expire_all()
+    return db_session.get(Post, post_id).comment_count
+
+
+def test_comment_create_and_delete_update_count(
+    db_session: Session, authenticated_user
+):
+    # given
+    post = _post(db_session, authenticated_user)
+    service = CommentService(db_session)
+
+    # when
+    first = service.create(
+        CommentCreate(post_id=post.id, content="c1"), authenticated_user.userid
+    )
+    service.create(
+        CommentCreate(post_id=post.id, content="c2"), authenticated_user.userid
+    )
+    service.delete(first.id)
+
+    # then
+    assert _comment_count(db_session, post.id) == 1
+
+
+def test_comment_count_in_post_response_and_etag(
+    client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    post = _post(db_session, authenticated_user)
+    before = client.get(f"/posts/{post.id}")
+    CommentService(db_session).create(
+        CommentCreate(post_id=post.id, content="c1"), authenticated_user.userid
+    )
+
+    # when
+    response = client.get(f"/posts/{post.id}")
+
+    # then
+    assert before.json()["comment_count"] == 0
+    assert response.json()["comment_count"] == 1
+    assert response.headers["ETag"] != before.headers["ETag"]
+
+
+def test_user_delete_subtracts_comments_on_other_posts(
+    db_session: Session, authenticated_user, other_user
+):
+    # given
+    post = _post(db_session, authenticated_user)
+    service = CommentService(db_session)
+    for content in ("c1", "c2"):
+        service.create(CommentCreate(post_id=post.id, content=content), "otheruser123")
+    service.create(
+        CommentCreate(post_id=post.id, content="c3"), authenticated_user.userid
+    )
+
+    # when
+    UserService(db_session).delete("otheruser123")
+
+    # then
+    assert _comment_count(db_session, post.id) == 1
+
+
+def test_reconcile_fixes_drift(db_session: Session, authenticated_user):
+    # given
+    drifted = _post(db_session, authenticated_user)
+    correct = _post(db_session, authenticated_user)
+    db_session.add_all(
+        [
+            Comment(content="c", post_id=drifted.id, author_id="testuser"),
+            Comment(content="c", post_id=correct.id, author_id="testuser"),
+        ]
+    )
+    db_session.execute(
+        update(Post).where(Post.id == correct.id).values(comment_count=1)
+    )
+    db_session.execute(
+        update(Post).where(Post.id == drifted.id).values(comment_count=7)
+    )
+    db_session.commit()
+    service = CommentService(db_session)
+
+    # when
+    fixed = service.reconcile_comment_counts()
+
+    # then
+    assert fixed == 1
+    assert _comment_count(db_session, drifted.id) == 1
+    assert _comment_count(db_session, correct.id) == 1
+    assert service.reconcile_comment_counts() == 0
@@ -0,0 +1,37 @@
+from app.config import Settings
+from app.database import (dispose_engine, get_async_database_url,
+                          get_database_url, get_engine, get_session_local)
+
+
+def test_get_engine_returns_process_wide_engine():
+    # when
+    first = get_engine()
+    second = get_engine()
+
+    # then - 요청마다 새 엔진(커넥션 풀)을 만들지 않아야 함
+    assert first is second
+    assert get_session_local() is get_session_local()
+    assert get_session_local().kw["bind"] is first
+
+
+def test_dispose_engine_resets_lazily(db_engine):
+    # given
+    engine = get_engine()
+
+    # when
+    dispose_engine()
+
+    # then - 다음 호출 시 새 엔진을 지연 생성
+    assert get_engine() is not engine
+
+
+def test_database_urls_come_from_settings(monkeypatch):
+    # given
+    monkeypatch.setattr(
+        "app.database.get_settings",
+        lambda: Settings(_env_file=None, database_url="sqlite:///from-settings.db"),
+    )
+
+    # when / then - 동기/비동기 엔진이 같은 설정을 씀
+    assert get_database_url() == "sqlite:///from-settings.db"
+    assert get_async_database_url() == "sqlite+aiosqlite:///from-settings.db"
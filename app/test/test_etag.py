@@ -0,0 +1,90 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.service.etag import etag_matches
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcard():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+def test_read_post_returns_304_until_post_changes(
+    client: TestClient, db_session: Session, authenticated_user, set_mock_user
+):
+    # given
+    post = Post(title="Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    etag = client.get(f"/posts/{post.id}").headers["ETag"]
+
+    # when
+    not_modified = client.get(f"/posts/{post.id}", headers={"If-None-Match": etag})
+    client.patch(f"/posts/{post.id}", json={"title": "New Title"})
+    modified = client.get(f"/posts/{post.id}", headers={"If-None-Match": etag})
+
+    # then
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert modified.status_code == 200
+    assert modified.json()["title"] == "New Title"
+    assert modified.headers["ETag"] != etag
+
+
+def test_post_etag_changes_when_author_nickname_changes(
+    client: TestClient, db_session: Session, authenticated_user, set_mock_user
+):
+    # given
+    post = Post(title="Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    etag = client.get(f"/posts/{post.id}").headers["ETag"]
+
+    # when - 게시글 응답에는 작성자 닉네임이 포함됨
+    client.patch("/users/testuser", json={"nickname": "renamed"})
+    response = client.get(f"/posts/{post.id}", headers={"If-None-Match": etag})
+
+    # then
+    assert response.status_code == 200
+    assert response.json()["author"]["nickname"] == "renamed"
+
+
+def test_read_comments_by_post_etag_tracks_new_comments(
+    client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    post = Post(title="Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    etag = client.get(f"/posts/{post.id}/comments").headers["ETag"]
+    not_modified = client.get(
+        f"/posts/{post.id}/comments", headers={"If-None-Match": etag}
+    )
+
+    # when
+    db_session.add(Comment(content="comment", post_id=post.id, author_id="testuser"))
+    db_session.commit()
+    modified = client.get(f"/posts/{post.id}/comments", headers={"If-None-Match": etag})
+
+    # then
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+    assert len(modified.json()) == 1
+
+
+def test_read_user_returns_304_with_matching_etag(
+    client: TestClient, authenticated_user
+):
+    # given
+    etag = client.get("/users/testuser").headers["ETag"]
+
+    # when
+    response = client.get("/users/testuser", headers={"If-None-Match": etag})
+
+    # then
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
@@ -0,0 +1,87 @@
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.auth.dependencies import get_current_user
+from app.config import Settings
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.models.user import Role, User
+
+
+@pytest.fixture
+def admin_client(client: TestClient, db_session: Session):
+    admin = User(userid="admin", nickname="admin", hashed_password="x", role=Role.ADMIN)
+    db_session.add(admin)
+    db_session.commit()
+    client.app.dependency_overrides[get_current_user] = lambda: admin
+    yield client
+    client.app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture
+def posts(db_session: Session, authenticated_user):
+    rows = [
+        Post(title=f"제목 {i}", content="content", author_id="testuser")
+        for i in range(5)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    db_session.add(Comment(content="댓글", post_id=rows[0].id, author_id="testuser"))
+    db_session.commit()
+    return rows
+
+
+def _lines(body: bytes):
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+def test_export_posts_ndjson(admin_client: TestClient, posts):
+    # when
+    response = admin_client.get("/export/posts")
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = _lines(response.content)
+    assert [row["id"] for row in rows] == [post.id for post in posts]
+    assert rows[0]["title"] == "제목 0"
+
+
+def test_export_resumes_after_id(admin_client: TestClient, posts, monkeypatch):
+    # given: 배치 크기보다 많은 행
+    monkeypatch.setattr(
+        "app.service.export.get_settings",
+        lambda: Settings(_env_file=".env.test", export_batch_size=2),
+    )
+
+    # when
+    response = admin_client.get("/export/posts", params={"after_id": posts[1].id})
+
+    # then
+    assert [row["id"] for row in _lines(response.content)] == [
+        post.id for post in posts[2:]
+    ]
+
+
+def test_export_comments_gzip(admin_client: TestClient, posts):
+    # when: TestClient(httpx)는 Content-Encoding을 보고 자동으로 풀기 때문에 원본 바이트를 읽음
+    with admin_client.stream("GET", "/export/comments?gzip=true") as response:
+        raw = b"".join(response.iter_raw())
+
+    # then
+    assert response.headers["content-encoding"] == "gzip"
+    assert [row["content"] for row in _lines(gzip.decompress(raw))] == ["댓글"]
+
+
+def test_export_requires_admin(client: TestClient, set_mock_user):
+    response = client.get("/export/posts")
+    assert response.status_code == 403
+
+
+def test_export_unknown_table(admin_client: TestClient):
+    response = admin_client.get("/export/users")
+    assert response.status_code == 422
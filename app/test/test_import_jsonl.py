@@ -0,0 +1,115 @@
+import json
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.auth.utils import _verify_password
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.models.user import User
+from app.tools.import_jsonl import run_import
+
+
+def _write(path, rows):
+    path.write_text(
+        "\n".join(json.dumps(row, ensure_ascii=False) for row in rows) + "\n",
+        encoding="utf-8",
+    )
+    return str(path)
+
+
+@pytest.fixture
+def jsonl_files(tmp_path):
+    return {
+        "users": _write(
+            tmp_path / "users.jsonl",
+            [
+                {"userid": "alice", "nickname": "앨리스", "password": "Password1234"},
+                {"userid": "bob", "nickname": "bob", "hashed_password": "hashed"},
+            ],
+        ),
+        "posts": _write(
+            tmp_path / "posts.jsonl",
+            [
+                {"id": i, "author_id": "alice", "title": f"t{i}", "content": "c"}
+                for i in range(1, 6)
+            ]
+            + [{"id": 6, "author_id": "nobody", "title": "t", "content": "c"}],
+        ),
+        "comments": _write(
+            tmp_path / "comments.jsonl",
+            [
+                {
+                    "id": 1,
+                    "post_id": 1,
+                    "author_id": "bob",
+                    "content": "c",
+                    "created_at": "2024-01-01T00:00:00",
+                },
+                {"id": 2, "post_id": 1, "author_id": "alice", "content": "c"},
+                {"id": 3, "post_id": 99, "author_id": "bob", "content": "no post"},
+            ],
+        ),
+    }
+
+
+def test_import_jsonl(db_session: Session, db_engine, jsonl_files):
+    # when
+    results = run_import(db_engine.kw["bind"], jsonl_files, batch_size=2, workers=0)
+
+    # then
+    assert {kind: p.inserted for kind, p in results.items()} == {
+        "users": 2,
+        "posts": 5,
+        "comments": 2,
+    }
+    assert results["posts"].invalid == 1
+    assert results["comments"].invalid == 1
+    alice = db_session.query(User).filter(User.userid == "alice").one()
+    assert _verify_password("Password1234", alice.hashed_password)
+    assert db_session.get(Post, 1).comment_count == 2
+    assert db_session.get(Comment, 1).created_at.year == 2024
+
+
+def test_import_jsonl_is_idempotent(db_session: Session, db_engine, jsonl_files):
+    # given
+    engine = db_engine.kw["bind"]
+    run_import(engine, jsonl_files, batch_size=2, workers=0)
+
+    # when
+    results = run_import(engine, jsonl_files, batch_size=2, workers=0)
+
+    # then
+    assert all(p.inserted == 0 for p in results.values())
+    assert results["posts"].skipped == 5
+    assert db_session.query(Post).count() == 5
+    assert db_session.query(Comment).count() == 2
+
+
+def test_import_jsonl_skips_duplicate_nicknames(
+    db_session: Session, db_engine, jsonl_files, tmp_path
+):
+    # given - 이미 있는 닉네임(bob)과 같은 배치 안에서 겹치는 닉네임(carol)
+    engine = db_engine.kw["bind"]
+    run_import(engine, {"users": jsonl_files["users"]}, workers=0)
+    users = _write(
+        tmp_path / "more_users.jsonl",
+        [
+            {"userid": "bob2", "nickname": "bob", "hashed_password": "hashed"},
+            {"userid": "carol", "nickname": "carol", "hashed_password": "hashed"},
+            {"userid": "carol2", "nickname": "carol", "hashed_password": "hashed"},
+        ],
+    )
+
+    # when - 한 행 때문에 가져오기 전체가 실패하지 않고, 다시 실행해도 같은 결과
+    first = run_import(engine, {"users": users}, batch_size=10, workers=0)["users"]
+    again = run_import(engine, {"users": users}, batch_size=10, workers=0)["users"]
+
+    # then
+    assert (first.inserted, first.invalid) == (1, 2)
+    assert (again.inserted, again.skipped, again.invalid) == (0, 1, 2)
+    assert {user.userid for user in db_session.query(User).all()} == {
+        "alice",
+        "bob",
+        "carol",
+    }
@@ -0,0 +1,83 @@
+import io
+import json
+import logging
+import queue
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.domain.models.post import Post
+from app.logger_setup import (JsonFormatter, NonBlockingQueueHandler,
+                              SamplingFilter, console_handler, log_queue,
+                              parse_sampling)
+
+
+def _record(name: str, level: int) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, "message %s", ("x",), None)
+
+
+def test_request_id_is_echoed_or_generated(client: TestClient):
+    # when
+    echoed = client.get("/posts/", headers={"X-Request-ID": "req-123"})
+    generated = client.get("/posts/")
+
+    # then
+    assert echoed.headers["x-request-id"] == "req-123"
+    assert len(generated.headers["x-request-id"]) == 32
+
+
+def test_request_logs_are_json_with_request_id(
+    client: TestClient,
+    db_session: Session,
+    authenticated_user,
+    set_mock_user,
+    monkeypatch,
+):
+    # given - 출력 스레드가 쓰는 핸들러를 메모리 버퍼 + JSON 형식으로 바꿈
+    post = Post(title="title", content="content", author_id=authenticated_user.userid)
+    db_session.add(post)
+    db_session.commit()
+    stream = io.StringIO()
+    monkeypatch.setattr(console_handler, "stream", stream)
+    monkeypatch.setattr(console_handler, "formatter", JsonFormatter())
+
+    # when
+    response = client.patch(
+        f"/posts/{post.id}", json={"title": "new"}, headers={"X-Request-ID": "req-42"}
+    )
+    log_queue.join()  # 큐에 넣은 로그가 모두 출력될 때까지 대기
+
+    # then
+    assert response.status_code == 200
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    updated = [
+        e for e in entries if e["message"] == f"Post ID {post.id} 업데이트 성공."
+    ]
+    assert len(updated) == 1
+    assert updated[0]["request_id"] == "req-42"
+    assert updated[0]["logger"] == "app.api.endpoints"
+    assert updated[0]["level"] == "INFO"
+
+
+def test_sampling_filter_drops_only_sampled_loggers_below_warning():
+    # given
+    sampling = SamplingFilter(parse_sampling("app.api=0, app.api.keep=1"))
+
+    # then - 가장 길게 일치하는 로거 설정을 따르고, WARNING 이상은 항상 남김
+    assert not sampling.filter(_record("app.api.endpoints", logging.INFO))
+    assert sampling.filter(_record("app.api.endpoints", logging.WARNING))
+    assert sampling.filter(_record("app.api.keep.child", logging.DEBUG))
+    assert sampling.filter(_record("app.service", logging.DEBUG))
+
+
+def test_full_queue_drops_instead_of_blocking():
+    # given
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+    # when
+    handler.handle(_record("app", logging.INFO))
+    handler.handle(_record("app", logging.INFO))
+
+    # then
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
@@ -0,0 +1,123 @@
+import asyncio
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.domain.models.post import Post
+from app.metrics import (UNMATCHED_ROUTE, MetricsMiddleware, RequestMetrics,
+                         render_metrics, request_metrics)
+from app.session_backends import session_lookups
+
+
+def _sample(text: str, prefix: str) -> float:
+    # prefix로 시작하는 첫 샘플 줄의 값
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{prefix} 없음:\n{text}")
+
+
+def test_metrics_reports_route_templates_and_status(
+    client: TestClient, db_session: Session, authenticated_user
+):
+    # given
+    request_metrics.reset()
+    post = Post(title="title", content="content", author_id=authenticated_user.userid)
+    db_session.add(post)
+    db_session.commit()
+    client.get(f"/posts/{post.id}")
+    client.get(f"/posts/{post.id}")
+    client.get("/posts/999999")
+    client.get("/no-such-path")
+
+    # when
+    response = client.get("/metrics")
+
+    # then - 게시글 ID가 아니라 라우트 템플릿으로 묶임
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    route = 'method="GET",route="/posts/{post_id}"'
+    assert _sample(text, f"http_request_duration_seconds_count{{{route}}}") == 3
+    assert _sample(text, f'http_responses_total{{{route},status="200"}}') == 2
+    assert _sample(text, f'http_responses_total{{{route},status="404"}}') == 1
+    assert f'route="{UNMATCHED_ROUTE}",status="404"' in text
+    assert f"/posts/{post.id}" not in text
+    # /metrics 요청 자신이 처리 중
+    assert _sample(text, "http_requests_in_flight") == 1
+    assert _sample(text, 'db_pool_checkout_wait_seconds_count{engine="sync"}') > 0
+
+
+def test_metrics_reports_session_lookups_without_session_cache(
+    client: TestClient, mock_session_store
+):
+    # given - 기본 설정(db 백엔드, 세션 캐시 꺼짐)
+    session_lookups.reset()
+    session_id = mock_session_store.create_session(
+        {"userid": "testuser", "nickname": "tester"}, expires_in=timedelta(hours=1)
+    )
+    client.get("/profile", cookies={"session_id": session_id})
+    client.get("/profile", cookies={"session_id": "expired-or-unknown"})
+
+    # when
+    text = client.get("/metrics").text
+
+    # then
+    assert _sample(text, 'session_lookups_total{backend="db",result="hit"}') == 1
+    assert _sample(text, 'session_lookups_total{backend="db",result="miss"}') == 1
+    assert "session_cache_hits_total" not in text
+
+
+def test_metrics_can_be_disabled(client: TestClient, monkeypatch):
+    # given
+    monkeypatch.setattr(
+        "app.api.endpoints.get_settings",
+        lambda: Settings(_env_file=".env.test", metrics_enabled=False),
+    )
+
+    # when
+    response = client.get("/metrics")
+
+    # then
+    assert response.status_code == 404
+
+
+def test_histogram_buckets_are_cumulative():
+    # given
+    metrics = RequestMetrics(buckets=(0.01, 0.1))
+    metrics.observe("GET", "/a", 200, 0.005)
+    metrics.observe("GET", "/a", 200, 0.05)
+    metrics.observe("GET", "/a", 500, 3.0)
+
+    # when
+    text = render_metrics(metrics)
+
+    # then
+    labels = 'method="GET",route="/a"'
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.01"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+    assert f"http_request_duration_seconds_sum{{{labels}}} 3.055" in text
+    assert f'http_responses_total{{{labels},status="500"}} 1' in text
+
+
+def test_middleware_records_unhandled_exception_as_500():
+    # given
+    async def failing_app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    metrics = RequestMetrics()
+    middleware = MetricsMiddleware(failing_app, metrics=metrics)
+
+    # when
+    try:
+        asyncio.run(middleware({"type": "http", "method": "GET"}, None, None))
+    except RuntimeError:
+        pass
+
+    # then
+    _, responses = metrics.snapshot()
+    assert responses == {("GET", UNMATCHED_ROUTE, 500): 1}
+    assert metrics.in_flight == 0
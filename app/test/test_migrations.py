@@ -0,0 +1,130 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from app.config import Settings
+from app.database import SchemaOutdatedError, prepare_schema
+from app.migrations import (MIGRATIONS, applied_versions, migrate,
+                            pending_versions, upgrade)
+
+
+# 이 변경 이전의 sessions 테이블 (user_id unique, userid 컬럼/expires_at 인덱스 없음)
+@pytest.fixture
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE sessions ("
+                "session_id VARCHAR(36) PRIMARY KEY, data VARCHAR(255), "
+                "expires_at DATETIME, user_id INTEGER UNIQUE)"
+            )
+        )
+        for i, userid in enumerate(["alice", "bob"], start=1):
+            connection.execute(
+                text("INSERT INTO sessions VALUES (:id, :data, '2099-01-01', NULL)"),
+                {"id": f"s{i}", "data": json.dumps({"userid": userid, "id": i})},
+            )
+    yield engine
+    engine.dispose()
+
+
+def test_upgrade_backfills_session_owner_columns(legacy_engine):
+    # when
+    applied = upgrade(legacy_engine)
+
+    # then
+    assert applied == [version for version, _, _ in MIGRATIONS]
+    inspector = inspect(legacy_engine)
+    indexes = {i["name"]: i for i in inspector.get_indexes("sessions")}
+    assert {
+        "ix_sessions_userid",
+        "ix_sessions_user_id",
+        "ix_sessions_expires_at",
+    } <= set(indexes)
+    assert not any(i["unique"] for i in indexes.values())
+    with legacy_engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT session_id, user_id, userid FROM sessions ORDER BY 1")
+        ).all()
+    assert [tuple(row) for row in rows] == [("s1", 1, "alice"), ("s2", 2, "bob")]
+
+
+def test_upgrade_is_idempotent(legacy_engine):
+    # given
+    upgrade(legacy_engine)
+
+    # when
+    applied = upgrade(legacy_engine)
+
+    # then
+    assert applied == []
+    assert applied_versions(legacy_engine) == {version for version, _, _ in MIGRATIONS}
+
+
+def test_upgrade_backfills_post_comment_count(legacy_engine):
+    # given: comment_count 컬럼이 없는 posts 테이블
+    with legacy_engine.begin() as connection:
+        for table in ("posts", "comments"):
+            connection.execute(
+                text(
+                    f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, post_id INTEGER, "
+                    "author_id VARCHAR(36), created_at DATETIME)"
+                )
+            )
+        connection.execute(text("INSERT INTO posts (id) VALUES (1), (2)"))
+        connection.execute(
+            text("INSERT INTO comments (id, post_id) VALUES (1, 1), (2, 1)")
+        )
+
+    # when
+    upgrade(legacy_engine)
+
+    # then
+    with legacy_engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT id, comment_count FROM posts ORDER BY id")
+        ).all()
+    assert [tuple(row) for row in rows] == [(1, 2), (2, 0)]
+
+
+def test_migrate_creates_schema_on_empty_database(tmp_path):
+    # given
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    assert pending_versions(engine) == [version for version, _, _ in MIGRATIONS]
+
+    # when
+    migrate(engine)
+
+    # then
+    assert pending_versions(engine) == []
+    assert {"users", "posts", "comments", "sessions"} <= set(
+        inspect(engine).get_table_names()
+    )
+    engine.dispose()
+
+
+def test_prepare_schema_refuses_outdated_database(legacy_engine, monkeypatch):
+    # given
+    monkeypatch.setattr("app.database.get_engine", lambda: legacy_engine)
+
+    # when / then: 스키마를 건드리지 않고 시작을 중단
+    with pytest.raises(SchemaOutdatedError):
+        prepare_schema()
+    assert not inspect(legacy_engine).has_table("schema_migrations")
+
+
+def test_prepare_schema_migrates_when_asked(legacy_engine, monkeypatch):
+    # given
+    monkeypatch.setattr("app.database.get_engine", lambda: legacy_engine)
+    monkeypatch.setattr(
+        "app.database.get_settings",
+        lambda: Settings(_env_file=".env.test", schema_on_startup="migrate"),
+    )
+
+    # when
+    prepare_schema()
+
+    # then
+    assert pending_versions(legacy_engine) == []
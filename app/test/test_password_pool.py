@@ -0,0 +1,84 @@
+import time
+
+import pytest
+
+from app.auth.password_pool import PasswordHashPool, PasswordPoolBusyException
+from app.auth.utils import _get_password_hash, _verify_password
+from app.service.user_service import UserCreate, UserService
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordHashPool(workers=1, max_queue=1, retry_after=3)
+    yield pool
+    pool.shutdown()
+
+
+def test_password_pool_hashes_and_records_metrics(pool):
+    # when
+    hashed = pool.run(_get_password_hash, "Testpassword1234")
+
+    # then
+    assert pool.run(_verify_password, "Testpassword1234", hashed) is True
+    stats = pool.stats()
+    assert stats["completed"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["latency_max_ms"] > 0
+
+
+def test_password_pool_rejects_when_saturated(pool):
+    # given - 대기 한도(1)를 채우는 느린 작업
+    future = pool.submit(time.sleep, 1)
+
+    # when
+    with pytest.raises(PasswordPoolBusyException) as exc_info:
+        pool.submit(_get_password_hash, "Testpassword1234")
+
+    # then
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "3"}
+    assert pool.stats()["rejected"] == 1
+    future.result()
+
+
+def test_password_pool_does_not_count_cancelled_work():
+    # given - 작업자 1개에 느린 작업이 쌓여 있음
+    pool = PasswordHashPool(workers=1, max_queue=4)
+    futures = [pool.submit(time.sleep, 0.2) for _ in range(4)]
+
+    # when - 종료하면서 대기 중인 작업을 취소
+    pool.shutdown()
+
+    # then
+    cancelled = sum(future.cancelled() for future in futures)
+    stats = pool.stats()
+    assert cancelled > 0
+    assert stats["completed"] == len(futures) - cancelled
+    assert stats["queue_depth"] == 0
+    assert sum(stats["latency_buckets_ms"].values()) == stats["completed"]
+
+
+def test_login_returns_503_when_password_pool_saturated(
+    client, db_session, pool, monkeypatch
+):
+    # given
+    UserService(db_session).create_user(
+        UserCreate(
+            userid="testuser123",
+            password="Testpassword1234",
+            role="MEMBER",
+            nickname="tester",
+        )
+    )
+    monkeypatch.setattr("app.auth.utils.get_password_pool", lambda: pool)
+    future = pool.submit(time.sleep, 1)
+
+    # when
+    response = client.post(
+        "/login", data={"username": "testuser123", "password": "Testpassword1234"}
+    )
+
+    # then - 로그인 폭주 시 느려지는 대신 즉시 거절
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
+    future.result()
@@ -0,0 +1,145 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.domain.models.post import Post
+from app.post_cache import PostCache
+
+
+def _payload(post_id: int, title: str, userid: str = "testuser") -> dict:
+    return {"id": post_id, "title": title, "author": {"userid": userid}}
+
+
+def test_stale_entry_is_refreshed_by_a_single_caller():
+    # given - TTL이 지났지만 stale 기간 안에 있는 항목
+    cache = PostCache(ttl=0, stale_ttl=60)
+    cache.set(1, _payload(1, "old"))
+    concurrent = []
+
+    def loader(post_id):
+        # 갱신 중에 들어온 다른 요청은 DB를 읽지 않고 기존 값을 받음
+        concurrent.append(cache.get_or_load(post_id, pytest.fail)[0])
+        return _payload(post_id, "new"), None
+
+    # when
+    refreshed, _ = cache.get_or_load(1, loader)
+
+    # then
+    assert refreshed["title"] == "new"
+    assert concurrent[0]["title"] == "old"
+    assert cache.stats()["stale_hits"] == 1
+
+
+def test_invalidation_during_load_is_not_overwritten():
+    # given
+    cache = PostCache(ttl=60)
+
+    def loader(post_id):
+        # DB에서 읽는 도중 게시글이 수정됨
+        cache.invalidate(post_id)
+        return _payload(post_id, "before update"), None
+
+    # when
+    cache.get_or_load(1, loader)
+
+    # then - 수정 이전 값은 캐시하지 않음
+    assert cache.stats()["size"] == 0
+
+
+def test_invalidate_author_removes_only_that_authors_posts():
+    # given
+    cache = PostCache(ttl=60)
+    cache.set(1, _payload(1, "a", userid="alice"))
+    cache.set(2, _payload(2, "b", userid="alice"))
+    cache.set(3, _payload(3, "c", userid="bob"))
+
+    # when
+    cache.invalidate_author("alice")
+
+    # then
+    assert cache.stats()["size"] == 1
+    assert cache.get_or_load(3, pytest.fail)[0]["title"] == "c"
+
+
+@pytest.fixture
+def post_cache(monkeypatch):
+    cache = PostCache(ttl=60, stale_ttl=60)
+    monkeypatch.setattr("app.post_cache.get_post_cache", lambda: cache)
+    monkeypatch.setattr("app.service.post_service.get_post_cache", lambda: cache)
+    return cache
+
+
+def test_read_post_is_cached_and_invalidated_on_update(
+    client: TestClient,
+    db_session: Session,
+    authenticated_user,
+    set_mock_user,
+    post_cache,
+):
+    # given
+    post = Post(title="Old Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    assert client.get(f"/posts/{post.id}").json()["title"] == "Old Title"
+
+    # when - 두 번째 조회는 캐시, 수정 후에는 다시 DB에서 읽음
+    cached = client.get(f"/posts/{post.id}")
+    client.patch(f"/posts/{post.id}", json={"title": "New Title"})
+    updated = client.get(f"/posts/{post.id}")
+
+    # then
+    assert cached.json()["title"] == "Old Title"
+    assert updated.json()["title"] == "New Title"
+    assert post_cache.stats()["hits"] == 1
+
+
+def test_read_post_cache_invalidated_on_author_nickname_change(
+    client: TestClient,
+    db_session: Session,
+    authenticated_user,
+    set_mock_user,
+    post_cache,
+):
+    # given
+    post = Post(title="Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    assert client.get(f"/posts/{post.id}").json()["author"]["nickname"] == "tester"
+
+    # when
+    client.patch("/users/testuser", json={"nickname": "renamed"})
+    response = client.get(f"/posts/{post.id}")
+
+    # then
+    assert response.json()["author"]["nickname"] == "renamed"
+
+
+def test_read_post_edited_on_another_worker_keeps_body_and_etag_in_sync(
+    client: TestClient,
+    db_session: Session,
+    authenticated_user,
+    set_mock_user,
+    post_cache,
+    monkeypatch,
+):
+    # given - 이 워커의 캐시에 게시글이 들어 있음
+    post = Post(title="Old Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    cached = client.get(f"/posts/{post.id}")
+
+    # when - 다른 워커(다른 캐시 인스턴스)에서 수정해서 이 워커의 캐시는 무효화되지 않음
+    other_worker = PostCache(ttl=60, stale_ttl=60)
+    with monkeypatch.context() as m:
+        m.setattr("app.post_cache.get_post_cache", lambda: other_worker)
+        m.setattr("app.service.post_service.get_post_cache", lambda: other_worker)
+        client.patch(f"/posts/{post.id}", json={"title": "New Title"})
+    response = client.get(f"/posts/{post.id}")
+    revalidated = client.get(
+        f"/posts/{post.id}", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    # then - 새 ETag에는 새 본문이 함께 오고, 그 ETag로 재검증하면 304
+    assert response.json()["title"] == "New Title"
+    assert response.headers["ETag"] != cached.headers["ETag"]
+    assert revalidated.status_code == 304
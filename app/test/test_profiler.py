@@ -0,0 +1,133 @@
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.dependencies import get_current_user
+from app.config import Settings
+from app.domain.models.user import Role, User
+from app.profiler import StackSampler, _active, load_profile, profiled_endpoint
+
+
+@pytest.fixture
+def profile_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.profiler.get_settings",
+        lambda: Settings(
+            _env_file=".env.test", profile_dir=str(tmp_path), profile_interval_ms=0.2
+        ),
+    )
+    return tmp_path
+
+
+def _login(client, db_session, mock_session_store, role: Role):
+    # 다른 테스트의 set_mock_user 오버라이드가 남아 있으면 실제 세션으로 인증하도록 제거
+    client.app.dependency_overrides.pop(get_current_user, None)
+    user = User(userid="profiler", nickname="p", hashed_password="x", role=role)
+    db_session.add(user)
+    db_session.commit()
+    session_data = {
+        "userid": user.userid,
+        "nickname": user.nickname,
+        "hashed_password": user.hashed_password,
+        "role": user.role,
+        "id": user.id,
+        "created_at": str(user.created_at),
+    }
+    session_id = mock_session_store.create_session(
+        session_data, expires_in=timedelta(hours=1)
+    )
+    client.cookies.set("session_id", session_id)
+
+
+def test_admin_request_with_header_is_profiled(
+    client: TestClient, db_session, mock_session_store, profile_settings
+):
+    # given
+    _login(client, db_session, mock_session_store, Role.ADMIN)
+
+    # when
+    response = client.get("/posts/", headers={"X-Profile": "1"})
+    profile_id = response.headers["x-profile-id"]
+    profile = client.get(f"/profiles/{profile_id}")
+
+    # then - collapsed stack 형식 ("프레임;프레임 샘플 수")
+    assert response.status_code == 200
+    assert (profile_settings / f"{profile_id}.folded").exists()
+    assert profile.status_code == 200
+    for line in profile.text.splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0 and " " not in stack
+
+
+def test_header_is_ignored_for_non_admin(
+    client: TestClient, db_session, mock_session_store, profile_settings
+):
+    # given
+    _login(client, db_session, mock_session_store, Role.MEMBER)
+
+    # when
+    profiled = client.get("/posts/", headers={"X-Profile": "1"})
+    denied = client.get("/profiles/20260101-000000-abcdef12")
+
+    # then
+    assert profiled.status_code == 200
+    assert "x-profile-id" not in profiled.headers
+    assert not list(profile_settings.iterdir())
+    assert denied.status_code == 403
+
+
+def test_stack_sampler_records_registered_thread():
+    # given
+    sampler = StackSampler(interval=0.001)
+    ready = threading.Event()
+
+    def busy_handler():
+        ready.set()
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+
+    worker = threading.Thread(target=busy_handler)
+    worker.start()
+    ready.wait()
+
+    # when
+    sampler.add_thread(worker.ident)
+    sampler.start()
+    worker.join()
+    sampler.stop()
+
+    # then
+    assert sampler.samples
+    assert any("busy_handler" in stack for stack in sampler.samples)
+
+
+def test_profiled_endpoint_registers_worker_thread_only_when_active():
+    # given
+    seen = []
+    sampler = StackSampler(interval=1)
+    endpoint = profiled_endpoint(lambda: seen.append(set(sampler.thread_ids)))
+
+    async def async_endpoint():
+        pass
+
+    # when
+    endpoint()
+    token = _active.set(sampler)
+    try:
+        endpoint()
+    finally:
+        _active.reset(token)
+
+    # then
+    assert seen == [set(), {threading.get_ident()}]
+    assert sampler.thread_ids == set()
+    assert profiled_endpoint(async_endpoint) is async_endpoint
+
+
+def test_load_profile_rejects_paths(profile_settings):
+    assert load_profile("../etc/passwd") is None
+    assert load_profile("missing") is None
@@ -0,0 +1,50 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.models.user import User
+
+
+# 작성자가 서로 다른 게시글 5개 (작성자를 게시글마다 조회하면 SQL 문이 5개 늘어남)
+@pytest.fixture
+def posts_by_many_authors(db_session: Session):
+    for i in range(5):
+        db_session.add(
+            User(userid=f"author{i}", nickname=f"author{i}", hashed_password="x")
+        )
+        db_session.add(
+            Post(title=f"title {i}", content="content", author_id=f"author{i}")
+        )
+    db_session.commit()
+    post = db_session.query(Post).first()
+    db_session.add(Comment(content="comment", post_id=post.id, author_id="author0"))
+    db_session.commit()
+    return post
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/posts/?limit=5", 2),  # 게시글 + 작성자(IN)
+        ("/posts/?cursor=&limit=5", 2),
+        ("/users/author0/posts", 2),
+        ("/users/author0/posts?cursor=", 2),
+        ("/posts/{post_id}", 2),  # ETag(version) + 게시글/작성자 JOIN
+        ("/posts/{post_id}/comments", 2),  # ETag(집계) + 댓글
+    ],
+)
+def test_endpoint_statement_count(
+    client: TestClient, posts_by_many_authors, count_statements, path, expected
+):
+    # given
+    path = path.format(post_id=posts_by_many_authors.id)
+
+    # when
+    with count_statements() as counter:
+        response = client.get(path)
+
+    # then
+    assert response.status_code == 200
+    counter.assert_count(expected)
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.domain.models.post import Post
+from app.query_stats import (QueryStatsMiddleware, _after_cursor_execute,
+                             current_query_stats, redact)
+
+
+def _settings(**values):
+    return lambda: Settings(_env_file=".env.test", **values)
+
+
+def test_server_timing_header_reports_queries(
+    client: TestClient, db_session: Session, authenticated_user, monkeypatch
+):
+    # given
+    post = Post(title="title", content="content", author_id=authenticated_user.userid)
+    db_session.add(post)
+    db_session.commit()
+    monkeypatch.setattr("app.query_stats.get_settings", _settings(server_timing=True))
+
+    # when
+    response = client.get(f"/posts/{post.id}")
+
+    # then
+    assert response.status_code == 200
+    db_timing, total_timing = response.headers["server-timing"].split(", ")
+    assert db_timing.startswith("db;dur=")
+    assert int(db_timing.split('desc="')[1].split(" ")[0]) >= 1
+    assert total_timing.startswith("total;dur=")
+
+
+def test_server_timing_header_is_off_by_default(client: TestClient):
+    # when
+    response = client.get("/posts/")
+
+    # then
+    assert "server-timing" not in response.headers
+
+
+def test_repeated_statements_are_flagged_as_n_plus_one(db_engine, monkeypatch, caplog):
+    # given - 같은 SELECT를 3번 실행하는 요청
+    monkeypatch.setattr(
+        "app.query_stats.get_settings", _settings(n_plus_one_threshold=3)
+    )
+    engine = db_engine.kw["bind"]
+    seen = {}
+
+    async def app(scope, receive, send):
+        with engine.connect() as connection:
+            for post_id in (1, 2, 3):
+                connection.execute(
+                    text("SELECT id FROM posts WHERE id = :id"), {"id": post_id}
+                )
+            connection.execute(text("SELECT count(*) FROM users"))
+        seen["stats"] = current_query_stats()
+
+    middleware = QueryStatsMiddleware(app)
+
+    # when
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(
+            middleware({"type": "http", "method": "GET", "path": "/posts/"}, None, None)
+        )
+
+    # then
+    assert seen["stats"].count == 4
+    assert current_query_stats() is None
+    warnings = [r.message for r in caplog.records if "N+1" in r.message]
+    assert len(warnings) == 1
+    assert "3번" in warnings[0] and "FROM posts" in warnings[0]
+
+
+def test_slow_query_log_redacts_parameters(caplog):
+    # given - 1초 전에 시작한 SQL 문
+    conn = SimpleNamespace(info={"query_started": [time.perf_counter() - 1]})
+
+    # when
+    with caplog.at_level(logging.WARNING):
+        _after_cursor_execute(
+            conn,
+            None,
+            "SELECT *\n  FROM users WHERE hashed_password = ?",
+            ("secret-hash",),
+            None,
+            False,
+        )
+
+    # then
+    message = caplog.records[-1].message
+    assert message.startswith("느린 쿼리")
+    assert "SELECT * FROM users WHERE hashed_password = ?" in message
+    assert "secret-hash" not in message
+    assert "['str']" in message
+
+
+def test_redact_keeps_only_types():
+    assert redact({"userid": "abc", "id": 3}) == {"userid": "str", "id": "int"}
+    assert redact([("a", 1), ("b", 2)], executemany=True) == "<2행>"
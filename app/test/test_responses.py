@@ -0,0 +1,61 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.domain.models.post import Post
+
+
+@pytest.fixture
+def posts(db_session: Session, authenticated_user):
+    db_session.add_all(
+        Post(title=f"title {i}", content="content", author_id="testuser")
+        for i in range(3)
+    )
+    db_session.commit()
+
+
+def _fast_json(monkeypatch, enabled: bool):
+    monkeypatch.setattr(
+        "app.api.responses.get_settings",
+        lambda: Settings(_env_file=".env.test", fast_json=enabled),
+    )
+
+
+@pytest.mark.parametrize(
+    "path", ["/posts/?limit=2", "/posts/?cursor=&limit=2", "/users/testuser/posts"]
+)
+def test_fast_json_renders_same_body(
+    client: TestClient, posts, monkeypatch, path: str
+):
+    # given
+    _fast_json(monkeypatch, False)
+    expected = client.get(path).json()
+
+    # when
+    _fast_json(monkeypatch, True)
+    response = client.get(path)
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected
+
+
+def test_fast_json_keeps_etag_header(
+    client: TestClient, db_session: Session, authenticated_user, monkeypatch
+):
+    # given
+    post = Post(title="Title", content="content", author_id="testuser")
+    db_session.add(post)
+    db_session.commit()
+    _fast_json(monkeypatch, True)
+
+    # when
+    response = client.get(f"/posts/{post.id}")
+
+    # then
+    assert response.json()["title"] == "Title"
+    etag = response.headers["ETag"]
+    cached = client.get(f"/posts/{post.id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
@@ -0,0 +1,133 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from app.domain.models.post import Post
+from app.domain.schemas.post import PostCreate, PostUpdate
+from app.search_index import SearchIndex, reset_search_index, tokenize
+from app.service.post_service import PostService
+
+
+# 테스트마다 DB를 새로 만들므로 워커별 메모리 색인도 비움
+@pytest.fixture(autouse=True)
+def search_index():
+    reset_search_index()
+    yield
+    reset_search_index()
+
+
+@pytest.fixture
+def posts(db_session: Session, authenticated_user):
+    rows = [
+        Post(title="파이썬 입문", content="처음 배우는 언어", author_id="testuser"),
+        Post(title="오늘 점심", content="파이썬 스터디 후 점심", author_id="testuser"),
+        Post(title="FastAPI tips", content="async python", author_id="testuser"),
+        Post(title="여행 후기", content="제주도", author_id="testuser"),
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def test_tokenize_splits_hangul_into_bigrams():
+    assert tokenize("게시글을 Python") == ["게시", "시글", "글을", "python"]
+
+
+def test_search_index_ranks_title_matches_first():
+    # given
+    index = SearchIndex()
+    index.add(1, "점심", "파이썬 스터디")
+    index.add(2, "파이썬 입문", "언어")
+    index.add(3, "여행", "제주도")
+
+    # when
+    results = index.search("파이썬")
+
+    # then
+    assert [post_id for _, post_id in results] == [2, 1]
+
+
+def test_search_index_remove_and_update():
+    # given
+    index = SearchIndex()
+    index.add(1, "python", "")
+    index.add(2, "python", "")
+
+    # when
+    index.remove(1)
+    index.add(2, "rust", "")
+
+    # then
+    assert index.search("python") == []
+    assert [post_id for _, post_id in index.search("rust")] == [2]
+    assert len(index) == 1
+
+
+def test_search_posts_ranked(client: TestClient, posts):
+    # when
+    response = client.get("/posts/search", params={"q": "파이썬"})
+
+    # then
+    assert response.status_code == 200
+    titles = [item["title"] for item in response.json()["items"]]
+    assert titles == ["파이썬 입문", "오늘 점심"]
+    assert response.json()["next_cursor"] is None
+
+
+def test_search_posts_cursor_pagination(client: TestClient, posts):
+    # when
+    first = client.get("/posts/search", params={"q": "파이썬 python", "limit": 2})
+    second = client.get(
+        "/posts/search",
+        params={
+            "q": "파이썬 python",
+            "limit": 2,
+            "cursor": first.json()["next_cursor"],
+        },
+    )
+
+    # then
+    assert len(first.json()["items"]) == 2
+    assert first.json()["next_cursor"] is not None
+    ids = [item["id"] for item in first.json()["items"] + second.json()["items"]]
+    assert sorted(ids) == sorted(post.id for post in posts[:3])
+    assert second.json()["next_cursor"] is None
+
+
+def test_search_posts_requires_query(client: TestClient):
+    response = client.get("/posts/search", params={"q": ""})
+    assert response.status_code == 422
+
+
+def test_post_service_updates_index_incrementally(db_session: Session, posts):
+    # given: 첫 검색으로 색인을 만든 뒤
+    service = PostService(db_session)
+    service.search("파이썬")
+
+    # when
+    created = service.create(PostCreate(title="파이썬 심화", content="..."), "testuser")
+    service.update(posts[0].id, PostUpdate(title="자바 입문"))
+    service.delete(posts[1].id)
+
+    # then
+    items, _ = service.search("파이썬")
+    assert [post.id for post in items] == [created.id]
+
+
+def test_search_skips_posts_deleted_outside_the_index(db_session: Session, posts):
+    # given: 색인을 만든 뒤 서비스를 거치지 않고 최상위 결과를 삭제 (색인에만 남음)
+    service = PostService(db_session)
+    ranked, _ = service.search("파이썬 python")
+    db_session.execute(delete(Post).where(Post.id == ranked[0].id))
+    db_session.commit()
+
+    # when
+    first, cursor = service.search("파이썬 python", limit=1)
+    second, last_cursor = service.search("파이썬 python", cursor=cursor, limit=1)
+
+    # then - 페이지 크기와 다음 커서가 유지되고 남은 게시글을 모두 한 번씩 받음
+    # (순서는 색인에서 제거한 뒤의 점수를 따르므로 집합으로 비교)
+    assert len(first) == 1 and cursor is not None
+    assert len(second) == 1 and last_cursor is None
+    assert {first[0].id, second[0].id} == {ranked[1].id, ranked[2].id}
@@ -0,0 +1,334 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+import redis
+from fakeredis import TcpFakeServer
+
+from app.auth.dependencies import get_current_user
+from app.auth.tokens import MemoryDenylist, sign_token
+from app.config import Settings
+from app.service.user_service import UserCreate, UserService
+from app.session_backends import (AsyncSignedSessionStore, MemorySessionStore,
+                                  RedisSessionStore, SignedSessionStore,
+                                  session_lookups)
+from app.session_store import (DBSessionStore, close_session_stores,
+                               get_async_shared_session_store,
+                               get_session_store)
+
+
+# Redis 프로토콜을 그대로 사용하는 로컬 가짜 서버
+@pytest.fixture(scope="module")
+def redis_server():
+    server = TcpFakeServer(("127.0.0.1", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"redis://{host}:{port}/0"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def redis_store(redis_server):
+    client = redis.Redis.from_url(redis_server, decode_responses=True)
+    client.flushdb()
+    return RedisSessionStore(client)
+
+
+@pytest.fixture(params=["memory", "redis"])
+def shared_store(request):
+    if request.param == "memory":
+        return MemorySessionStore(shards=4)
+    return request.getfixturevalue("redis_store")
+
+
+def test_shared_store_create_get_delete(shared_store):
+    # given
+    session_id = shared_store.create_session(
+        {"userid": "testuser", "nickname": "tester"}, expires_in=timedelta(days=1)
+    )
+
+    # when / then
+    assert shared_store.get_session(session_id)["nickname"] == "tester"
+    assert shared_store.find_session_id("testuser") == session_id
+
+    shared_store.delete_session(session_id)
+    assert shared_store.get_session(session_id) is None
+    assert shared_store.find_session_id("testuser") is None
+
+
+def test_shared_store_revokes_all_user_sessions(shared_store):
+    # given - 같은 사용자의 두 기기 세션과 다른 사용자의 세션
+    first = shared_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(days=1)
+    )
+    second = shared_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(days=1)
+    )
+    other = shared_store.create_session(
+        {"userid": "otheruser"}, expires_in=timedelta(days=1)
+    )
+
+    # when
+    revoked = shared_store.revoke_user_sessions("testuser")
+
+    # then
+    assert revoked == 2
+    assert shared_store.get_session(first) is None
+    assert shared_store.get_session(second) is None
+    assert shared_store.find_session_id("testuser") is None
+    assert shared_store.get_session(other) is not None
+
+
+def test_shared_store_expires_sessions(shared_store):
+    # given
+    session_id = shared_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(seconds=1)
+    )
+
+    # when
+    time.sleep(1.1)
+
+    # then - 백엔드 자체 만료 기능으로 사라져야 함
+    assert shared_store.get_session(session_id) is None
+    assert shared_store.find_session_id("testuser") is None
+
+
+def test_get_session_store_selects_backend_from_settings(monkeypatch, db_session):
+    # given
+    monkeypatch.setattr(
+        "app.session_store.get_settings", lambda: Settings(session_backend="memory")
+    )
+    monkeypatch.setattr("app.session_store._shared_store", None)
+
+    # when
+    store = get_session_store(db_session)
+
+    # then - memory/redis 백엔드는 프로세스 단위로 공유
+    assert isinstance(store, MemorySessionStore)
+    assert get_session_store(db_session) is store
+
+    monkeypatch.setattr(
+        "app.session_store.get_settings", lambda: Settings(session_backend="db")
+    )
+    assert isinstance(get_session_store(db_session), DBSessionStore)
+
+
+def test_login_and_logout_with_memory_backend(client, db_session):
+    # given
+    store = MemorySessionStore()
+    client.app.dependency_overrides[get_session_store] = lambda: store
+    UserService(db_session).create_user(
+        UserCreate(
+            userid="testuser123",
+            password="Testpassword1234",
+            role="MEMBER",
+            nickname="tester",
+        )
+    )
+
+    # when
+    login = client.post(
+        "/login", data={"username": "testuser123", "password": "Testpassword1234"}
+    )
+    session_id = login.json()["session_id"]
+    profile = client.get("/profile", cookies={"session_id": session_id})
+    logout = client.post("/logout", params={"userid": "testuser123"})
+
+    # then
+    assert profile.json() == {"user": "tester"}
+    assert logout.status_code == 200
+    assert store.get_session(session_id) is None
+
+
+@pytest.fixture
+def signed_store():
+    return SignedSessionStore("test-secret-key", MemoryDenylist())
+
+
+def test_signed_store_round_trip_without_sensitive_fields(signed_store):
+    # given
+    data = {
+        "id": 1,
+        "userid": "testuser",
+        "nickname": "tester",
+        "role": "MEMBER",
+        "created_at": "2024-01-01 00:00:00",
+        "hashed_password": "secret-hash",
+    }
+
+    # when
+    token = signed_store.create_session(data, expires_in=timedelta(days=1))
+    session_data = signed_store.get_session(token)
+
+    # then - 비밀번호 해시는 토큰에 담지 않음
+    assert session_data["userid"] == "testuser"
+    assert session_data["role"] == "MEMBER"
+    assert "hashed_password" not in session_data
+
+
+def test_signed_store_rejects_tampered_and_expired_tokens(signed_store):
+    # given
+    token = signed_store.create_session(
+        {"id": 1, "userid": "testuser"}, expires_in=timedelta(days=1)
+    )
+    body, signature = token.split(".")
+    forged_body = sign_token({"id": 1, "userid": "admin", "exp": 9999999999}, "x")
+
+    # then
+    assert signed_store.get_session(forged_body.split(".")[0] + "." + signature) is None
+    assert signed_store.get_session(body + "." + signature[::-1]) is None
+    expired = signed_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(seconds=-1)
+    )
+    assert signed_store.get_session(expired) is None
+
+
+def test_signed_store_logout_uses_denylist(signed_store):
+    # given
+    token = signed_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(days=1)
+    )
+
+    # when
+    signed_store.delete_session(token)
+
+    # then
+    assert signed_store.get_session(token) is None
+
+
+def test_signed_store_revokes_tokens_issued_before_revocation(signed_store):
+    # given
+    token = signed_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(days=1)
+    )
+
+    # when
+    signed_store.revoke_user_sessions("testuser")
+    time.sleep(0.01)
+    new_token = signed_store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(days=1)
+    )
+
+    # then - 폐기 이전에 발급된 토큰만 거부
+    assert signed_store.get_session(token) is None
+    assert signed_store.get_session(new_token)["userid"] == "testuser"
+
+
+def test_revoke_all_sessions_with_db_backend(client, db_session, mock_session_store):
+    # given - 같은 사용자로 두 번 로그인
+    client.app.dependency_overrides.pop(get_current_user, None)
+    UserService(db_session).create_user(
+        UserCreate(
+            userid="testuser123",
+            password="Testpassword1234",
+            role="MEMBER",
+            nickname="tester",
+        )
+    )
+    form = {"username": "testuser123", "password": "Testpassword1234"}
+    first = client.post("/login", data=form).json()["session_id"]
+    second = client.post("/login", data=form).json()["session_id"]
+
+    # when
+    response = client.delete(
+        "/users/testuser123/sessions", cookies={"session_id": second}
+    )
+
+    # then - 세션에 소유자 컬럼이 채워져 인덱스로 조회/삭제
+    assert response.status_code == 200
+    assert response.json()["revoked"] == 2
+    assert mock_session_store.get_session(first) is None
+    assert mock_session_store.find_session_id("testuser123") is None
+
+
+def test_login_and_logout_with_signed_tokens(client, db_session, signed_store):
+    # given - 다른 테스트의 가짜 로그인 오버라이드 제거 후 실제 토큰으로 인증
+    client.app.dependency_overrides.pop(get_current_user, None)
+    client.app.dependency_overrides[get_session_store] = lambda: signed_store
+    UserService(db_session).create_user(
+        UserCreate(
+            userid="testuser123",
+            password="Testpassword1234",
+            role="MEMBER",
+            nickname="tester",
+        )
+    )
+
+    # when - 로그인 응답 쿠키에 서명 토큰이 설정됨
+    login = client.post(
+        "/login", data={"username": "testuser123", "password": "Testpassword1234"}
+    )
+    token = login.json()["session_id"]
+    created = client.post("/posts/", json={"title": "Signed", "content": "content"})
+    logout = client.post("/logout", params={"userid": "testuser123"})
+
+    # then
+    assert created.status_code == 200
+    assert created.json()["author"]["userid"] == "testuser123"
+    assert logout.status_code == 200
+    assert signed_store.get_session(token) is None
+
+
+def test_async_signed_store_uses_asyncio_redis_denylist(redis_server, monkeypatch):
+    # given
+    monkeypatch.setattr(
+        "app.session_store.get_settings",
+        lambda: Settings(
+            session_backend="signed",
+            session_denylist_backend="redis",
+            redis_url=redis_server,
+            secret_key="test-secret-key",
+        ),
+    )
+    monkeypatch.setattr("app.session_store._async_shared_store", None)
+
+    async def scenario():
+        store = get_async_shared_session_store()
+        data = {"userid": "testuser", "nickname": "tester"}
+        logged_out = await store.create_session(data, timedelta(days=1))
+        revoked = await store.create_session(data, timedelta(days=1))
+        await store.delete_session(logged_out)
+        await store.revoke_user_sessions("testuser")
+        reissued = await store.create_session(data, timedelta(days=1))
+        results = [
+            await store.get_session(token) for token in (logged_out, revoked, reissued)
+        ]
+        await close_session_stores()
+        return store, results
+
+    # when
+    store, (logged_out, revoked, reissued) = asyncio.run(scenario())
+
+    # then - 이벤트 루프를 막는 동기 Redis 클라이언트 대신 asyncio 스토어를 사용
+    assert isinstance(store, AsyncSignedSessionStore)
+    assert logged_out is None and revoked is None
+    assert reissued["userid"] == "testuser"
+
+
+@pytest.mark.parametrize("backend", ["db", "memory", "redis", "signed"])
+def test_session_lookups_are_counted_for_every_backend(
+    request, backend, mock_session_store
+):
+    # given
+    store = {
+        "db": lambda: mock_session_store,
+        "memory": lambda: MemorySessionStore(shards=4),
+        "redis": lambda: request.getfixturevalue("redis_store"),
+        "signed": lambda: SignedSessionStore("test-secret-key", MemoryDenylist()),
+    }[backend]()
+    session_id = store.create_session(
+        {"userid": "testuser"}, expires_in=timedelta(minutes=1)
+    )
+    session_lookups.reset()
+
+    # when
+    store.get_session(session_id)
+    store.get_session(session_id)
+    store.get_session("no-such-session")
+
+    # then
+    assert session_lookups.snapshot() == {(backend, "hit"): 2, (backend, "miss"): 1}
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from app.session_cache import SessionCache
+from app.session_store import DBSessionStore
+
+
+def test_session_cache_evicts_least_recently_used():
+    # given
+    cache = SessionCache(maxsize=2, ttl=60)
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    cache.set("a", {"userid": "a"}, expires_at)
+    cache.set("b", {"userid": "b"}, expires_at)
+
+    # when - a를 조회해서 최근 사용으로 만든 뒤 c 추가
+    cache.get("a")
+    cache.set("c", {"userid": "c"}, expires_at)
+
+    # then
+    assert cache.get("b") is None
+    assert cache.get("a") == {"userid": "a"}
+    assert cache.stats() == {"size": 2, "hits": 2, "misses": 1, "evictions": 1}
+
+
+def test_session_cache_respects_session_expires_at():
+    # given
+    cache = SessionCache(maxsize=10, ttl=60)
+
+    # when - 이미 만료된 세션은 캐시에 넣지 않음
+    cache.set("expired", {"userid": "a"}, datetime.utcnow() - timedelta(seconds=1))
+
+    # then
+    assert cache.get("expired") is None
+
+
+def test_db_session_store_uses_cache_and_invalidates_on_delete(db_session):
+    # given
+    cache = SessionCache(maxsize=10, ttl=60)
+    store = DBSessionStore(db_session, cache=cache)
+    session_id = store.create_session({"userid": "a"}, expires_in=timedelta(days=1))
+
+    # when
+    first = store.get_session(session_id)
+    second = store.get_session(session_id)
+
+    # then - 두 번째 조회는 캐시에서 반환
+    assert first == second == {"userid": "a"}
+    assert cache.stats()["hits"] == 1
+
+    # 로그아웃(delete_session) 후에는 캐시에서도 사라져야 함
+    store.delete_session(session_id)
+    assert store.get_session(session_id) is None
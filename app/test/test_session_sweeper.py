@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.domain.models.session import SessionModel
+from app.session_sweeper import SessionSweeper, get_session_sweeper
+
+
+def _add_sessions(db: Session, prefix: str, count: int, expires_at: datetime):
+    for i in range(count):
+        db.add(
+            SessionModel(session_id=f"{prefix}-{i}", data="{}", expires_at=expires_at)
+        )
+    db.commit()
+
+
+def test_sweeper_purges_expired_sessions_in_batches(db_engine, db_session):
+    # given
+    now = datetime.utcnow()
+    _add_sessions(db_session, "expired", 5, now - timedelta(minutes=1))
+    _add_sessions(db_session, "valid", 2, now + timedelta(hours=1))
+    sweeper = SessionSweeper(batch_size=2)
+
+    # when
+    purged = sweeper.sweep(db_engine)
+
+    # then - 2, 2, 1 세 번의 배치로 나눠서 삭제
+    assert purged == 5
+    remaining = db_session.query(SessionModel.session_id).all()
+    assert sorted(row.session_id for row in remaining) == ["valid-0", "valid-1"]
+    stats = sweeper.stats()
+    assert stats["runs"] == 1
+    assert stats["batches"] == 3
+    assert stats["rows_purged"] == 5
+
+
+def test_sweeper_runs_during_application_lifespan(client):
+    # given - client fixture가 lifespan을 실행한 상태
+    sweeper = get_session_sweeper()
+
+    # then
+    assert sweeper is not None
+    assert sweeper.running
@@ -0,0 +1,98 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.startup import FirstRequestTimer, StartupTimer
+from app.tools.startup_profile import MARKER, package_totals, parse_importtime
+
+
+def test_import_auth_utils_does_not_hash_or_load_passlib():
+    # when - 새 프로세스에서 import만 함
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.auth.utils; print('passlib' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # then - passlib은 처음 해시/검증할 때 불러옴
+    assert completed.stdout.strip() == "False"
+
+
+def test_async_mode_does_not_import_sync_router():
+    # when - DB_ASYNC=true 로 새 프로세스에서 앱을 import
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, app.main; print('app.api.endpoints' in sys.modules)",
+        ],
+        env={**os.environ, "DB_ASYNC": "true"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # then - 사용하지 않는 동기 라우터 모듈은 불러오지 않음
+    assert completed.stdout.strip() == "False"
+
+
+def test_first_request_timer_records_only_first_request():
+    # given
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["type"])
+
+    timer = StartupTimer()
+    middleware = FirstRequestTimer(app, timer=timer)
+
+    # when
+    asyncio.run(middleware({"type": "lifespan"}, None, None))
+    assert timer.first_request_ms is None
+    asyncio.run(middleware({"type": "http"}, None, None))
+    first = timer.first_request_ms
+    asyncio.run(middleware({"type": "http"}, None, None))
+
+    # then
+    assert first is not None and first > 0
+    assert timer.first_request_ms == first
+    assert calls == ["lifespan", "http", "http"]
+
+
+def test_parse_importtime_stops_at_marker():
+    # given
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       100 |        100 |     sqlalchemy.sql",
+            "import time:       200 |        300 |   sqlalchemy",
+            "import time:      1500 |       1500 |   app.api.endpoints",
+            "import time:        50 |       1850 | app.main",
+            "경고 로그 같은 다른 줄",
+            MARKER,
+            "import time:      9000 |       9000 | starlette.testclient",
+        ]
+    )
+
+    # when
+    modules = parse_importtime(stderr)
+
+    # then
+    assert [m["module"] for m in modules] == [
+        "sqlalchemy.sql",
+        "sqlalchemy",
+        "app.api.endpoints",
+        "app.main",
+    ]
+    assert modules[-1]["cumulative_ms"] == 1.85
+    assert package_totals(modules) == pytest.approx(
+        {"app.api": 1.5, "sqlalchemy": 0.3, "app.main": 0.05}
+    )
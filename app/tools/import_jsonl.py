@@ -0,0 +1,271 @@
+# JSONL 대량 가져오기
+# 사용법: DATABASE_URL=... python -m app.tools.import_jsonl \
+#           --users users.jsonl --posts posts.jsonl --comments comments.jsonl [--batch-size 1000]
+#
+# 파일을 한 줄씩 읽어 batch_size 행마다 Core insert()의 executemany로 넣고 배치마다 커밋한다.
+# - users: {"userid", "nickname", "password" 또는 "hashed_password", "role"(선택)}
+#   password는 프로세스 풀에서 bcrypt로 해시한다.
+# - posts: {"id", "author_id", "title", "content", "created_at"(선택)}
+# - comments: {"id", "post_id", "author_id", "content", "created_at"(선택)}
+#   (GET /export/posts, /export/comments 의 출력 형식 그대로 가져올 수 있다)
+# users는 userid, posts/comments는 id로 이미 있는 행을 건너뛰므로 중간에 실패해도 다시 실행하면 된다.
+# 참조하는 사용자/게시글이 없는 행, 다른 사용자와 닉네임이 겹치는 행, 형식이 잘못된 줄은
+# 건너뛰고 개수를 기록한다.
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Column, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.auth.utils import _get_password_hash
+from app.config import get_settings
+from app.database import get_engine
+from app.domain.models import session  # noqa: F401  (User.sessions 매퍼 등록)
+from app.domain.models.comment import Comment
+from app.domain.models.post import Post
+from app.domain.models.user import Role, User
+from app.logger_setup import logger
+from app.service.comment_service import CommentService
+
+users, posts, comments = User.__table__, Post.__table__, Comment.__table__
+
+
+def _created_at(row: dict) -> datetime:
+    # executemany는 모든 행에 같은 컬럼이 있어야 하므로 없으면 현재 시각으로 채움
+    if row.get("created_at"):
+        return datetime.fromisoformat(row["created_at"])
+    return datetime.utcnow()
+
+
+def _user_row(row: dict) -> dict:
+    values = {
+        "userid": row["userid"],
+        "nickname": row["nickname"],
+        "role": Role(row.get("role", Role.MEMBER.value)),
+    }
+    if row.get("hashed_password"):
+        values["hashed_password"] = row["hashed_password"]
+    else:
+        values["password"] = row["password"]  # 나중에 풀에서 해시
+    return values
+
+
+def _post_row(row: dict) -> dict:
+    return {
+        "id": int(row["id"]),
+        "author_id": row["author_id"],
+        "title": row["title"],
+        "content": row["content"],
+        "created_at": _created_at(row),
+    }
+
+
+def _comment_row(row: dict) -> dict:
+    return {
+        "id": int(row["id"]),
+        "post_id": int(row["post_id"]),
+        "author_id": row["author_id"],
+        "content": row["content"],
+        "created_at": _created_at(row),
+    }
+
+
+# 종류별 (테이블, 중복 판단 컬럼, 변환 함수, [(참조 컬럼, 필드)], [그 밖의 unique 컬럼])
+SPECS: Dict[str, Tuple] = {
+    "users": (users, users.c.userid, _user_row, [], [users.c.nickname]),
+    "posts": (posts, posts.c.id, _post_row, [(users.c.userid, "author_id")], []),
+    "comments": (
+        comments,
+        comments.c.id,
+        _comment_row,
+        [(posts.c.id, "post_id"), (users.c.userid, "author_id")],
+        [],
+    ),
+}
+
+
+class Progress:
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.started = time.perf_counter()
+        self.read = 0
+        self.inserted = 0
+        self.skipped = 0  # 이미 있는 행
+        self.invalid = 0  # 형식 오류, 참조 대상 없음
+
+    @property
+    def rows_per_sec(self) -> float:
+        elapsed = time.perf_counter() - self.started
+        return self.read / elapsed if elapsed > 0 else 0.0
+
+    def log(self, done: bool = False):
+        logger.info(
+            "%s%s: %d행 읽음 (추가 %d, 건너뜀 %d, 오류 %d), %.0f rows/s",
+            self.kind,
+            " 완료" if done else "",
+            self.read,
+            self.inserted,
+            self.skipped,
+            self.invalid,
+            self.rows_per_sec,
+        )
+
+
+def read_jsonl(path: str, progress: Progress, convert: Callable) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            progress.read += 1
+            try:
+                yield convert(json.loads(line))
+            except (ValueError, KeyError, TypeError) as e:
+                progress.invalid += 1
+                logger.warning("%s:%d 건너뜀: %r", path, line_no, e)
+
+
+def _batches(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _existing(connection: Connection, column: Column, keys) -> set:
+    return set(connection.execute(select(column).where(column.in_(keys))).scalars())
+
+
+def _hash_passwords(batch: List[dict], executor: Optional[Executor]):
+    pending = [row for row in batch if "password" in row]
+    if not pending:
+        return
+    passwords = [row.pop("password") for row in pending]
+    if executor is None:
+        hashes = map(_get_password_hash, passwords)
+    else:
+        hashes = executor.map(_get_password_hash, passwords, chunksize=16)
+    for row, hashed in zip(pending, hashes):
+        row["hashed_password"] = hashed
+
+
+def _import_batch(
+    connection: Connection, kind: str, batch: List[dict], executor, progress
+):
+    table, key, _, references, unique = SPECS[kind]
+    existing = _existing(connection, key, {row[key.name] for row in batch})
+    new_rows, seen = [], set()
+    for row in batch:
+        if row[key.name] in existing or row[key.name] in seen:
+            progress.skipped += 1
+            continue
+        seen.add(row[key.name])
+        new_rows.append(row)
+
+    for column, field in references:
+        # 참조 대상(사용자, 게시글)은 앞 단계에서 이미 커밋되어 있음
+        found = _existing(connection, column, {row[field] for row in new_rows})
+        valid = [row for row in new_rows if row[field] in found]
+        progress.invalid += len(new_rows) - len(valid)
+        new_rows = valid
+
+    for column in unique:
+        # 이미 있거나 배치 안에서 겹치는 값(예: 닉네임)은 INSERT 전체를 실패시키므로 제외
+        taken = _existing(connection, column, {row[column.name] for row in new_rows})
+        valid = []
+        for row in new_rows:
+            if row[column.name] in taken:
+                continue
+            taken.add(row[column.name])
+            valid.append(row)
+        progress.invalid += len(new_rows) - len(valid)
+        new_rows = valid
+
+    if kind == "users":
+        _hash_passwords(new_rows, executor)
+    if new_rows:
+        connection.execute(insert(table), new_rows)
+    progress.inserted += len(new_rows)
+
+
+def import_file(
+    engine: Engine,
+    kind: str,
+    path: str,
+    batch_size: int,
+    executor: Optional[Executor] = None,
+) -> Progress:
+    progress = Progress(kind)
+    rows = read_jsonl(path, progress, SPECS[kind][2])
+    for batch in _batches(rows, batch_size):
+        with engine.begin() as connection:  # 배치마다 커밋
+            _import_batch(connection, kind, batch, executor, progress)
+        progress.log()
+    progress.log(done=True)
+    return progress
+
+
+def run_import(
+    engine: Engine,
+    paths: Dict[str, str],
+    batch_size: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Dict[str, Progress]:
+    # paths: {"users": ..., "posts": ..., "comments": ...} 중 일부. 참조 순서대로 가져온다.
+    # workers=0이면 현재 프로세스에서 해시 (적은 양이나 테스트용)
+    batch_size = batch_size or get_settings().import_batch_size
+    workers = os.cpu_count() if workers is None else workers
+    executor = None
+    if workers > 0 and paths.get("users"):
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        )
+    results = {}
+    try:
+        for kind in ("users", "posts", "comments"):
+            if paths.get(kind):
+                results[kind] = import_file(
+                    engine, kind, paths[kind], batch_size, executor
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    if "comments" in results:
+        # 댓글을 직접 INSERT 했으므로 posts.comment_count를 한 번에 맞춤
+        with Session(engine) as db:
+            CommentService(db).reconcile_comment_counts()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="JSONL 파일을 대량으로 가져옵니다.")
+    parser.add_argument("--users")
+    parser.add_argument("--posts")
+    parser.add_argument("--comments")
+    parser.add_argument("--batch-size", type=int, default=None)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="비밀번호 해시 프로세스 수"
+    )
+    args = parser.parse_args(argv)
+    if not (args.users or args.posts or args.comments):
+        parser.error("--users, --posts, --comments 중 하나 이상을 지정하세요.")
+
+    run_import(
+        get_engine(),
+        {"users": args.users, "posts": args.posts, "comments": args.comments},
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
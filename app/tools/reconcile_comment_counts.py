@@ -0,0 +1,12 @@
+# posts.comment_count를 실제 댓글 수와 맞추는 작업 (cron 등으로 주기 실행)
+# 사용법: DATABASE_URL=... python -m app.tools.reconcile_comment_counts
+from app.database import get_session_local
+from app.domain.models import session  # noqa: F401  (User.sessions 매퍼 등록)
+from app.logger_setup import logger
+from app.service.comment_service import CommentService
+
+if __name__ == "__main__":
+    with get_session_local()() as db:
+        fixed = CommentService(db).reconcile_comment_counts()
+    if not fixed:
+        logger.info("댓글 수가 어긋난 게시글이 없습니다.")
@@ -0,0 +1,157 @@
+# 시작 시간 프로파일러
+# 사용법: python -m app.tools.startup_profile [--runs 3] [--top 15] [--path /posts/?limit=10]
+#
+# 새 파이썬 프로세스에서 python -X importtime 으로 app.main을 import 하고, 앱을 시작(lifespan)한 뒤
+# 첫 요청을 보내 다음을 측정한다. 매번 새 프로세스를 띄우므로 콜드 스타트 기준이다.
+# - import_ms: import app.main 에 걸린 시간
+# - first_request_ms: app.main import 시작부터 첫 요청의 응답이 끝날 때까지 걸린 시간
+# - 모듈별 import 시간 (self: 모듈 자체, cumulative: 그 모듈이 import 한 모듈 포함)
+# DATABASE_URL이 없으면 임시 SQLite 파일에 마이그레이션을 적용해서 사용한다.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# 자식 프로세스에서 실행하는 코드. app.main import가 끝나면 stderr에 MARKER를 써서
+# 그 뒤(테스트 클라이언트 등)의 import 기록과 구분한다.
+MARKER = "--- app.main imported ---"
+RESULT_PREFIX = "STARTUP_PROFILE "
+_CHILD = f"""
+import sys, time, json
+t0 = time.perf_counter()
+import app.main
+import_ms = (time.perf_counter() - t0) * 1000
+sys.stderr.write({MARKER!r} + "\\n")
+sys.stderr.flush()
+t1 = time.perf_counter()
+from starlette.testclient import TestClient
+client_import_ms = (time.perf_counter() - t1) * 1000
+from app.startup import startup_timer
+with TestClient(app.main.app) as client:
+    status = client.get(sys.argv[1]).status_code
+result = {{
+    "import_ms": import_ms,
+    # 측정용 테스트 클라이언트 import 시간은 뺀다
+    "first_request_ms": startup_timer.first_request_ms - client_import_ms,
+    "status": status,
+}}
+print({RESULT_PREFIX!r} + json.dumps(result))
+"""
+
+
+def parse_importtime(text: str) -> List[dict]:
+    # "import time: self [us] | cumulative | imported package" 형식의 줄을 읽는다 (MARKER 이전까지)
+    modules = []
+    for line in text.splitlines():
+        if line.startswith(MARKER):
+            break
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+            }
+        )
+    return modules
+
+
+def package_totals(modules: List[dict]) -> Dict[str, float]:
+    # 최상위 패키지별 self 시간 합계 (app은 app.api, app.service 처럼 한 단계 더 나눔)
+    totals = defaultdict(float)
+    for module in modules:
+        parts = module["module"].split(".")
+        package = ".".join(parts[:2]) if parts[0] == "app" else parts[0]
+        totals[package] += module["self_ms"]
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def _prepare_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env.setdefault("LOG_LEVEL", "WARNING")
+    env.setdefault("PYTHONPATH", os.getcwd())
+    if "DATABASE_URL" not in env:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        env["DATABASE_URL"] = f"sqlite:///{path}"
+        subprocess.run([sys.executable, "-m", "app.migrations"], env=env, check=True)
+    return env
+
+
+def run_once(env: Dict[str, str], path: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, path],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    lines = [
+        line for line in completed.stdout.splitlines() if line.startswith(RESULT_PREFIX)
+    ]
+    if completed.returncode != 0 or not lines:
+        raise RuntimeError(f"시작 측정 실패:\n{completed.stderr[-2000:]}")
+    result = json.loads(lines[-1][len(RESULT_PREFIX) :])
+    result["modules"] = parse_importtime(completed.stderr)
+    return result
+
+
+def profile(runs: int = 3, path: str = "/posts/?limit=10", top: int = 15) -> dict:
+    # 여러 번 측정해서 중앙값을 쓴다. 모듈별 시간은 중앙값에 가장 가까운 실행의 것을 보고한다.
+    env = _prepare_env()
+    results = [run_once(env, path) for _ in range(runs)]
+    first_request_ms = statistics.median(r["first_request_ms"] for r in results)
+    closest = min(results, key=lambda r: abs(r["first_request_ms"] - first_request_ms))
+    modules = closest["modules"]
+    return {
+        "runs": runs,
+        "path": path,
+        "status": closest["status"],
+        "import_ms": statistics.median(r["import_ms"] for r in results),
+        "first_request_ms": first_request_ms,
+        "packages": dict(list(package_totals(modules).items())[:top]),
+        "slowest_modules": sorted(
+            modules, key=lambda m: m["cumulative_ms"], reverse=True
+        )[:top],
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"import app.main: {report['import_ms']:.1f}ms, "
+        f"첫 요청({report['path']} -> {report['status']}): "
+        f"{report['first_request_ms']:.1f}ms (중앙값, {report['runs']}회)",
+        "",
+        "패키지별 import 시간 (self 합계)",
+    ]
+    lines += [f"  {ms:8.1f}ms  {name}" for name, ms in report["packages"].items()]
+    lines += ["", "import가 오래 걸린 모듈 (cumulative / self)"]
+    lines += [
+        f"  {m['cumulative_ms']:8.1f}ms {m['self_ms']:8.1f}ms  {m['module']}"
+        for m in report["slowest_modules"]
+    ]
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="콜드 스타트 시간을 측정합니다.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--path", default="/posts/?limit=10", help="첫 요청 경로")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    report = profile(runs=args.runs, path=args.path, top=args.top)
+    print(
+        json.dumps(report, ensure_ascii=False) if args.json else format_report(report)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""/posts/?limit=100 요청당 CPU 시간 벤치마크 (FAST_JSON 끔/켬 비교).
+
+기본 경로는 핸들러가 ORM 객체를 반환하고 FastAPI가 response_model로 검증한 뒤
+표준 json 모듈로 인코딩한다. FAST_JSON=true 이면 pydantic-core가 한 번에 검증/직렬화한다.
+
+    python -m benchmarks.bench_json --requests 200
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import List
+
+
+def _seed(rows: int):
+    from app.database import get_engine, get_session_local
+    from app.domain.models.post import Post
+    from app.domain.models.user import User
+    from app.migrations import migrate
+
+    migrate(get_engine())
+    db = get_session_local()()
+    try:
+        db.add(User(userid="bench", nickname="bench", hashed_password="x"))
+        db.add_all(
+            Post(author_id="bench", title=f"title {i}", content="content " * 20)
+            for i in range(rows)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _cpu_per_request_ms(client, path: str, requests: int) -> float:
+    # 같은 프로세스에서 실행되는 TestClient이므로 process_time에 서버 측 처리가 포함된다
+    start = time.process_time()
+    for _ in range(requests):
+        response = client.get(path)
+        assert response.status_code == 200, response.text
+    return (time.process_time() - start) * 1000 / requests
+
+
+def _serialize_cpu_ms(posts, iterations: int = 500) -> tuple:
+    # 직렬화 단계만 분리해서 측정 (DB 조회 제외)
+    from pydantic import TypeAdapter
+
+    from app.domain.schemas.post import PostRead
+
+    adapter = TypeAdapter(List[PostRead])
+
+    def response_model_path():
+        # FastAPI 기본 경로: response_model 검증 -> JSON 호환 dict -> json.dumps
+        content = adapter.dump_python(
+            adapter.validate_python(posts, from_attributes=True), mode="json"
+        )
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def fast_json_path():
+        return adapter.dump_json(adapter.validate_python(posts, from_attributes=True))
+
+    results = []
+    for serialize in (response_model_path, fast_json_path):
+        start = time.process_time()
+        for _ in range(iterations):
+            serialize()
+        results.append((time.process_time() - start) * 1000 / iterations)
+    return tuple(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    if "DATABASE_URL" not in os.environ:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+
+    from fastapi.testclient import TestClient
+
+    from app.config import get_settings
+    from app.database import get_session_local
+    from app.main import app
+    from app.service.post_service import PostService
+
+    _seed(args.rows)
+    path = "/posts/?limit=100"
+    results = {}
+
+    with TestClient(app) as client:
+        for fast_json in ("false", "true"):
+            os.environ["FAST_JSON"] = fast_json
+            get_settings.cache_clear()
+            client.get(path)  # 워밍업
+            results[fast_json] = _cpu_per_request_ms(client, path, args.requests)
+
+    with get_session_local()() as db:
+        posts = PostService(db).get_multi(limit=100)
+        for post in posts:
+            post.author  # noqa: B018 - 작성자 미리 로딩
+        serialize_before, serialize_after = _serialize_cpu_ms(posts)
+
+    before, after = results["false"], results["true"]
+    print(f"요청 전체 before (response_model + json): {before:8.2f} ms CPU/req")
+    print(f"요청 전체 after  (FAST_JSON)            : {after:8.2f} ms CPU/req")
+    print(
+        f"직렬화만 before                         : {serialize_before:8.2f} ms CPU/req"
+    )
+    print(
+        f"직렬화만 after                          : {serialize_after:8.2f} ms CPU/req"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""로깅 호출이 요청 스레드에서 쓰는 시간 벤치마크.
+
+update_post 한 번이 남기는 로그(DEBUG 1개, INFO 1개)를 기준으로 요청당 시간을 비교한다.
+- before: StreamHandler가 요청 스레드에서 바로 출력 (f-string은 레벨과 상관없이 항상 만들어짐)
+- after : 앱과 같은 큐 핸들러(요청 ID, 샘플링 필터 포함)로 큐에 넣기만 하고 출력은 QueueListener 스레드가 함 (%-style 지연 포매팅)
+출력 대상은 쓰기마다 --write-us 만큼 걸리는 스트림으로 흉내 낸다. (stdout 파이프가 밀린 상황)
+
+    python -m benchmarks.bench_logging --requests 20000 --write-us 50
+"""
+
+import argparse
+import io
+import logging
+import queue
+import time
+from logging.handlers import QueueListener
+
+from app.logger_setup import (NonBlockingQueueHandler, RequestIdFilter,
+                              SamplingFilter)
+
+
+class SlowStream(io.StringIO):
+    def __init__(self, write_us: float):
+        super().__init__()
+        self.write_s = write_us / 1_000_000
+
+    def write(self, text):
+        time.sleep(self.write_s)  # 실제 쓰기처럼 GIL을 놓고 기다림
+        return len(text)
+
+
+def _before(logger, user, author, post_id):
+    logger.debug(f"현재 유저 id : {user}, 게시글 작성자 id : {author}")
+    logger.info(f"Post ID {post_id} 업데이트 성공.")
+
+
+def _after(logger, user, author, post_id):
+    logger.debug("현재 유저 id : %s, 게시글 작성자 id : %s", user, author)
+    logger.info("Post ID %s 업데이트 성공.", post_id)
+
+
+def _per_request_us(logger, log_request, requests: int) -> float:
+    start = time.perf_counter()
+    for i in range(requests):
+        log_request(logger, "user", "author", i)
+    return (time.perf_counter() - start) * 1_000_000 / requests
+
+
+def _logger(name: str, handler: logging.Handler, level: int) -> logging.Logger:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--write-us", type=float, default=50)
+    args = parser.parse_args()
+
+    fmt = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    for level in (logging.INFO, logging.DEBUG):
+        direct = logging.StreamHandler(SlowStream(args.write_us))
+        direct.setFormatter(fmt)
+        before = _per_request_us(
+            _logger("before", direct, level), _before, args.requests
+        )
+
+        output = logging.StreamHandler(SlowStream(args.write_us))
+        output.setFormatter(fmt)
+        log_queue = queue.Queue(maxsize=args.requests * 2)
+        listener = QueueListener(log_queue, output)
+        listener.start()
+        handler = NonBlockingQueueHandler(log_queue)
+        handler.addFilter(RequestIdFilter())
+        handler.addFilter(SamplingFilter({}))
+        after = _per_request_us(_logger("after", handler, level), _after, args.requests)
+        listener.stop()
+
+        name = logging.getLevelName(level)
+        print(f"LOG_LEVEL={name:5} before (직접 출력) : {before:8.2f} µs/req")
+        print(f"LOG_LEVEL={name:5} after  (큐)       : {after:8.2f} µs/req")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""요청 지표 수집(MetricsMiddleware) 오버헤드 벤치마크.
+
+1) 미들웨어만: 아무 일도 하지 않는 ASGI 앱을 직접 호출해서 요청당 추가 시간(µs)을 잰다.
+2) 요청 전체: 같은 라우터로 만든 앱 두 개(미들웨어 없음/있음)에 /posts/?limit=10 을
+   번갈아 보내 요청당 CPU 시간을 비교한다.
+
+    python -m benchmarks.bench_metrics --requests 500
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+def _seed(rows: int):
+    from app.database import get_engine, get_session_local
+    from app.domain.models.post import Post
+    from app.domain.models.user import User
+    from app.migrations import migrate
+
+    migrate(get_engine())
+    db = get_session_local()()
+    try:
+        db.add(User(userid="bench", nickname="bench", hashed_password="x"))
+        db.add_all(
+            Post(author_id="bench", title=f"title {i}", content="content " * 20)
+            for i in range(rows)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _middleware_overhead_us(iterations: int) -> float:
+    from fastapi.routing import APIRoute
+
+    from app.metrics import MetricsMiddleware, RequestMetrics
+
+    route = APIRoute("/posts/{post_id}", lambda post_id: None)
+
+    async def app(scope, receive, send):
+        scope["route"] = route
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    async def run(target) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await target({"type": "http", "method": "GET"}, None, send)
+        return time.perf_counter() - start
+
+    async def compare():
+        wrapped = MetricsMiddleware(app, metrics=RequestMetrics())
+        await run(app)  # 워밍업
+        await run(wrapped)
+        return await run(app), await run(wrapped)
+
+    bare, wrapped = asyncio.run(compare())
+    return (wrapped - bare) * 1_000_000 / iterations
+
+
+def _cpu_per_request_ms(client, path: str, requests: int) -> float:
+    start = time.process_time()
+    for _ in range(requests):
+        response = client.get(path)
+        assert response.status_code == 200, response.text
+    return (time.process_time() - start) * 1000 / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    if "DATABASE_URL" not in os.environ:
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.api import endpoints
+    from app.api.responses import default_response_class
+    from app.metrics import MetricsMiddleware
+
+    _seed(args.rows)
+    path = "/posts/?limit=10"
+
+    apps = {}
+    for name, instrumented in (("off", False), ("on", True)):
+        apps[name] = FastAPI()
+        apps[name].include_router(
+            endpoints.router, default_response_class=default_response_class()
+        )
+        if instrumented:
+            apps[name].add_middleware(MetricsMiddleware)
+
+    results = {"off": [], "on": []}
+    clients = {name: TestClient(app) for name, app in apps.items()}
+    for client in clients.values():
+        client.get(path)  # 워밍업
+    for _ in range(args.rounds):  # 번갈아 측정해서 시간에 따른 편차를 줄임
+        for name, client in clients.items():
+            results[name].append(_cpu_per_request_ms(client, path, args.requests))
+    off, on = min(results["off"]), min(results["on"])
+
+    overhead_us = _middleware_overhead_us(args.requests * 20)
+    print(f"미들웨어만 (요청당 추가 시간)   : {overhead_us:8.2f} µs/req")
+    print(f"요청 전체 미들웨어 없음         : {off:8.3f} ms CPU/req")
+    print(f"요청 전체 미들웨어 있음         : {on:8.3f} ms CPU/req")
+    print(f"요청 대비 미들웨어 비용         : {overhead_us / 10 / off:8.2f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""콜드 스타트(import app.main ~ 첫 요청 응답) 시간 벤치마크.
+
+새 프로세스에서 앱을 띄워 첫 요청까지 걸린 시간의 중앙값을 재고, 예산(--budget-ms)을
+넘으면 종료 코드 1을 반환한다. 측정은 python -X importtime 으로 하므로 실제보다 조금 느리다.
+
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 1200
+"""
+
+import argparse
+import sys
+
+from app.tools.startup_profile import format_report, profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1200)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    report = profile(runs=args.runs, top=args.top)
+    print(format_report(report))
+    print()
+    over = report["first_request_ms"] > args.budget_ms
+    print(
+        f"첫 요청까지 {report['first_request_ms']:.1f}ms / 예산 {args.budget_ms:.0f}ms"
+        f" -> {'초과' if over else '통과'}"
+    )
+    if over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()